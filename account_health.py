@@ -0,0 +1,169 @@
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# How many reader browsers a status sweep may run at once
+HEALTH_CHECK_CONCURRENCY = 3
+
+# How long a check result is trusted before the account is checked again
+HEALTH_CACHE_TTL_SECONDS = 15 * 60
+
+# X's session cookie; without it (or once it expires) the account is logged out
+SESSION_COOKIE = 'auth_token'
+
+
+def precheck_session(acc):
+    """Cheap, browser-free session check from the saved cookies.
+
+    Returns 'Inactive' when the saved cookies can't hold a session (no file,
+    no auth_token, or auth_token expired), or None when only a browser can
+    tell.
+    """
+    cookie_path = acc.get_cookie_path()
+    if not os.path.exists(cookie_path):
+        return 'Inactive'
+    try:
+        with open(cookie_path, 'rb') as f:
+            cookies = pickle.load(f)
+    except Exception:
+        return 'Inactive'
+
+    auth_cookie = next((c for c in cookies if c.get('name') == SESSION_COOKIE and c.get('value')), None)
+    if not auth_cookie:
+        return 'Inactive'
+    expiry = auth_cookie.get('expiry')
+    if expiry and expiry < time.time():
+        return 'Inactive'
+    return None
+
+
+class AccountHealthChecker:
+    """Bounded, cached account status checks.
+
+    At most max_workers reader browsers run at once and each reader is closed
+    right after its check, so a sweep over any number of accounts uses a fixed
+    amount of memory. Accounts whose saved cookies already rule out a session
+    are answered without a browser, and results are cached for ttl seconds.
+    """
+
+    def __init__(self, max_workers=HEALTH_CHECK_CONCURRENCY, ttl=HEALTH_CACHE_TTL_SECONDS):
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-check')
+        self._cache = {}  # account label -> result dict
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def get_cached(self, acc):
+        """The cached result for this account if it's still fresh, else None"""
+        with self._lock:
+            result = self._cache.get(acc.label)
+        if result and time.time() - result['checked_at'] < self.ttl:
+            return result
+        return None
+
+    def invalidate(self, acc=None):
+        with self._lock:
+            if acc is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(acc.label, None)
+
+    def check_accounts(self, accounts, on_result=None, on_done=None, force=False):
+        """Queue status checks; on_result(acc, result) fires as each one finishes.
+
+        Callbacks run on worker threads. on_done(results) fires once after
+        the last account, with a label -> result dict.
+        """
+        accounts = list(accounts)
+        results = {}
+        remaining = [len(accounts)]
+        results_lock = threading.Lock()
+
+        def finish(acc, result):
+            if result is not None and on_result:
+                try:
+                    on_result(acc, result)
+                except Exception as e:
+                    print(f"⚠️ Health check callback error for {acc.label}: {e}")
+            with results_lock:
+                if result is not None:
+                    results[acc.label] = result
+                remaining[0] -= 1
+                done = remaining[0] == 0
+            if done and on_done:
+                on_done(results)
+
+        if not accounts and on_done:
+            on_done(results)
+
+        for acc in accounts:
+            cached = None if force else self.get_cached(acc)
+            if cached:
+                finish(acc, cached)
+                continue
+            with self._lock:
+                if acc.label in self._in_flight:
+                    # Already being checked by an earlier sweep
+                    finish(acc, None)
+                    continue
+                self._in_flight.add(acc.label)
+            self._executor.submit(self._run_check, acc, finish)
+
+    def _run_check(self, acc, finish):
+        result = None
+        try:
+            result = self.check_account(acc)
+        except Exception as e:
+            print(f"❌ Health check failed for {acc.label}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(acc.label)
+            finish(acc, result)
+
+    def check_account(self, acc):
+        """Check one account now (blocking) and cache the result"""
+        status = precheck_session(acc)
+        avatar_url = acc.avatar_url
+        source = 'cookies'
+        if status is None:
+            from selenium_manager import get_global_driver_manager, get_account_status_and_avatar
+            # A reader that is already open belongs to a campaign, scraper or yapping run
+            reader_was_open = acc.label in get_global_driver_manager().reader_drivers
+            try:
+                active, avatar_url = get_account_status_and_avatar(acc, headless=True)
+                status = 'Active' if active else 'Inactive'
+                avatar_url = avatar_url or acc.avatar_url
+                source = 'browser'
+            finally:
+                # Don't keep a reader per account alive after a sweep, but only close our own,
+                # and not while a run that picked it up during the check still holds it
+                if not reader_was_open:
+                    get_global_driver_manager().close_reader_driver(acc, if_idle=True)
+
+        result = {
+            'status': status,
+            'avatar_url': avatar_url,
+            'source': source,
+            'checked_at': time.time()
+        }
+        with self._lock:
+            self._cache[acc.label] = result
+        return result
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_health_checker = None
+_health_checker_lock = threading.Lock()
+
+def get_health_checker():
+    """Get or create the global account health checker"""
+    global _health_checker
+    with _health_checker_lock:
+        if _health_checker is None:
+            _health_checker = AccountHealthChecker()
+        return _health_checker
@@ -1,5 +1,7 @@
 import os
 import json
+import threading
+from contextlib import contextmanager
 from constants import ACCOUNTS_FILE, COOKIE_DIR
 
 class SeleniumAccount:
@@ -21,6 +23,11 @@ class SeleniumAccount:
         safe_label = self.label.replace(' ', '_').replace('/', '_').replace('\\', '_')
         return os.path.join('chrome_profiles', safe_label)
 
+    def get_reader_profile_path(self):
+        """Get the profile path for this account's headless reader session"""
+        # Chrome locks its user data dir, so readers can't share the writer's profile
+        return self.get_chrome_profile_path() + '_reader'
+
     def to_dict(self):
         return {
             'label': self.label,
@@ -43,13 +50,284 @@ class SeleniumAccount:
             d.get('proxy')
         )
 
-def load_accounts():
-    if os.path.exists(ACCOUNTS_FILE):
-        with open(ACCOUNTS_FILE, 'r') as f:
+def load_accounts(path=ACCOUNTS_FILE):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
             data = json.load(f)
             return [SeleniumAccount.from_dict(acc) for acc in data]
     return []
 
-def save_accounts(accounts):
-    with open(ACCOUNTS_FILE, 'w') as f:
-        json.dump([acc.to_dict() for acc in accounts], f, indent=2) 
\ No newline at end of file
+def save_accounts(accounts, path=ACCOUNTS_FILE):
+    # Write to a temp file and rename so a crash never leaves a half-written file
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump([acc.to_dict() for acc in accounts], f, indent=2)
+    os.replace(tmp_path, path)
+
+# Fields an account update may change
+ACCOUNT_FIELDS = ('label', 'username', 'password', 'status', 'avatar_url', 'tags', 'proxy')
+
+
+class AccountRepository:
+    """Single in-memory source of truth for accounts.
+
+    Accounts are loaded once into a shared list that panels hold on to; the
+    list is mutated in place so every panel sees the same objects. Lookups by
+    label, username and tag go through indexes. Subscribers are called with
+    (event, accounts) for 'added', 'updated', 'removed' and 'reloaded' events,
+    from whichever thread made the change. Each change is persisted as a
+    single-record write to the AccountStore; batch() turns many changes into
+    one transaction, holding events until it commits. Commits made by other processes are picked up through
+    the store's data version, without re-reading on every check.
+    """
+
+    def __init__(self, store=None):
+        from account_store import AccountStore
+        self.store = store if store is not None else AccountStore()
+        self.accounts = []
+        self._by_label = {}
+        self._by_username = {}
+        self._by_tag = {}
+        self._subscribers = []
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._held_events = []  # events published inside batch(), sent on commit
+        self._known_version = None
+        self._watch_stop = threading.Event()
+        self._watch_thread = None
+        self.reload()
+
+    # Indexes
+
+    def _index(self, acc):
+        self._by_label[acc.label] = acc
+        self._by_username[acc.username] = acc
+        for tag in acc.tags or []:
+            self._by_tag.setdefault(tag, []).append(acc)
+
+    def _unindex(self, acc, label=None, username=None, tags=None):
+        label = acc.label if label is None else label
+        username = acc.username if username is None else username
+        tags = acc.tags if tags is None else tags
+        if self._by_label.get(label) is acc:
+            del self._by_label[label]
+        if self._by_username.get(username) is acc:
+            del self._by_username[username]
+        for tag in tags or []:
+            members = self._by_tag.get(tag)
+            if members and acc in members:
+                members.remove(acc)
+                if not members:
+                    del self._by_tag[tag]
+
+    def _rebuild_indexes(self):
+        self._by_label = {}
+        self._by_username = {}
+        self._by_tag = {}
+        for acc in self.accounts:
+            self._index(acc)
+
+    # Queries
+
+    def get(self, label):
+        with self._lock:
+            return self._by_label.get(label)
+
+    def get_by_username(self, username):
+        with self._lock:
+            return self._by_username.get(username)
+
+    def with_tag(self, tag):
+        """Accounts carrying this tag ('All' or None returns every account)"""
+        with self._lock:
+            if tag in (None, 'All'):
+                return list(self.accounts)
+            return list(self._by_tag.get(tag, []))
+
+    def tags(self):
+        with self._lock:
+            return sorted(self._by_tag)
+
+    # Changes
+
+    def add(self, acc):
+        with self._lock:
+            if acc.label in self._by_label:
+                raise ValueError(f"Account '{acc.label}' already exists")
+            self.store.upsert(acc)
+            self.accounts.append(acc)
+            self._index(acc)
+        self._publish('added', [acc])
+        return acc
+
+    def update(self, acc, **fields):
+        """Change fields of an account and persist it; memory is left untouched if the write fails"""
+        unknown = set(fields) - set(ACCOUNT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown account fields: {', '.join(sorted(unknown))}")
+        with self._lock:
+            old_label = acc.label
+            if 'label' in fields and fields['label'] != old_label and fields['label'] in self._by_label:
+                raise ValueError(f"Account '{fields['label']}' already exists")
+            old_values = {name: getattr(acc, name) for name in fields}
+            self._unindex(acc)
+            for name, value in fields.items():
+                setattr(acc, name, value)
+            try:
+                self.store.upsert(acc, old_label=old_label)
+            except Exception:
+                for name, value in old_values.items():
+                    setattr(acc, name, value)
+                self._index(acc)
+                raise
+            self._index(acc)
+        self._publish('updated', [acc])
+        return acc
+
+    def remove(self, acc):
+        with self._lock:
+            if acc not in self.accounts:
+                return False
+            self.store.delete(acc.label)
+            self.accounts.remove(acc)
+            self._unindex(acc)
+        self._publish('removed', [acc])
+        return True
+
+    @contextmanager
+    def batch(self):
+        """Commit every change made inside the block as one transaction.
+
+        Events are held until the commit. If the block raises, the transaction
+        is rolled back and the in-memory accounts and indexes are restored.
+        """
+        with self._lock:
+            outermost = self._batch_depth == 0
+            if outermost:
+                saved = [(acc, {name: getattr(acc, name) for name in ACCOUNT_FIELDS}) for acc in self.accounts]
+                saved_tags = [list(acc.tags or []) for acc in self.accounts]
+            self._batch_depth += 1
+            try:
+                with self.store.batch():
+                    yield self
+            except Exception:
+                self._batch_depth -= 1
+                if outermost:
+                    self._held_events = []
+                    for (acc, values), tags in zip(saved, saved_tags):
+                        for name, value in values.items():
+                            setattr(acc, name, value)
+                        acc.tags = tags
+                    self.accounts[:] = [acc for acc, _ in saved]
+                    self._rebuild_indexes()
+                raise
+            self._batch_depth -= 1
+            if not outermost:
+                return
+            self._known_version = self.store.data_version()
+            events, self._held_events = self._held_events, []
+        for event, accounts in events:
+            self._publish(event, accounts)
+
+    def save(self):
+        """Persist the current in-memory state (after direct attribute edits)"""
+        with self._lock:
+            self._rebuild_indexes()
+            self.store.replace_all(self.accounts)
+        self._publish('updated', list(self.accounts))
+
+    def import_json(self, path):
+        """Merge accounts from a JSON file (accounts.json format)"""
+        count = self.store.import_json(path)
+        self.reload()
+        return count
+
+    def export_json(self, path):
+        return self.store.export_json(path)
+
+    # Loading and external changes
+
+    def reload(self):
+        """Re-read the store and merge it into the shared list in place"""
+        with self._lock:
+            loaded = self.store.load_all()
+            existing = {acc.label: acc for acc in self.accounts}
+            merged = []
+            for fresh in loaded:
+                acc = existing.get(fresh.label)
+                if acc is None:
+                    acc = fresh
+                else:
+                    # Keep the same object (and its in-memory password)
+                    for name in ACCOUNT_FIELDS:
+                        if name != 'password':
+                            setattr(acc, name, getattr(fresh, name))
+                merged.append(acc)
+            self.accounts[:] = merged
+            self._rebuild_indexes()
+            self._known_version = self.store.data_version()
+        self._publish('reloaded', list(self.accounts))
+
+    def check_for_external_changes(self):
+        """Reload if another process committed to the store since we last looked"""
+        version = self.store.data_version()
+        if version != self._known_version:
+            print("🔄 accounts changed outside this app, reloading")
+            self.reload()
+            return True
+        return False
+
+    def start_watching(self, interval=2):
+        """Watch the store for changes by other processes in a background thread"""
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+        self._watch_stop.clear()
+        def watch():
+            while not self._watch_stop.wait(interval):
+                try:
+                    self.check_for_external_changes()
+                except Exception as e:
+                    print(f"⚠️ Error checking accounts file: {e}")
+        self._watch_thread = threading.Thread(target=watch, name='accounts-watcher', daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        self._watch_stop.set()
+
+    # Notifications
+
+    def subscribe(self, callback):
+        """Call callback(event, accounts) on every change; returns callback"""
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _publish(self, event, accounts):
+        with self._lock:
+            # Only the thread inside batch() can hold the lock while it is open
+            if self._batch_depth:
+                self._held_events.append((event, accounts))
+                return
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event, accounts)
+            except Exception as e:
+                print(f"⚠️ Account subscriber error: {e}")
+
+
+_account_repository = None
+_account_repository_lock = threading.Lock()
+
+def get_account_repository():
+    """Get or create the global account repository"""
+    global _account_repository
+    with _account_repository_lock:
+        if _account_repository is None:
+            _account_repository = AccountRepository()
+        return _account_repository
\ No newline at end of file
@@ -0,0 +1,155 @@
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from constants import ACCOUNTS_DB, ACCOUNTS_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL UNIQUE,
+    username TEXT NOT NULL,
+    status TEXT,
+    avatar_url TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    proxy TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_accounts_username ON accounts(username);
+"""
+
+
+class AccountStore:
+    """SQLite-backed account storage with per-record writes.
+
+    Runs in WAL mode so reads never block the writer and a crash mid-write
+    can't corrupt the data. Every change is a single-row statement; wrap many
+    changes in batch() to commit them as one transaction. Passwords are never
+    stored, same as the JSON format. accounts.json is imported automatically
+    the first time the database is created and can be exported at any time.
+    """
+
+    def __init__(self, path=ACCOUNTS_DB, legacy_json=ACCOUNTS_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+        if legacy_json and self.count() == 0 and os.path.exists(legacy_json):
+            imported = self.import_json(legacy_json)
+            print(f"📥 Imported {imported} accounts from {legacy_json} into {path}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def batch(self):
+        """Run every change inside the block as one transaction"""
+        with self._lock:
+            if self._batch_depth == 0:
+                self._conn.execute('BEGIN IMMEDIATE')
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.execute('ROLLBACK')
+                raise
+            else:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._conn.execute('COMMIT')
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    # Reads
+
+    def count(self):
+        return self._execute('SELECT COUNT(*) FROM accounts').fetchone()[0]
+
+    def load_all(self):
+        """All accounts in insertion order, as SeleniumAccount objects"""
+        from account_manager import SeleniumAccount
+        rows = self._execute('SELECT * FROM accounts ORDER BY id').fetchall()
+        return [SeleniumAccount.from_dict(self._row_to_dict(row)) for row in rows]
+
+    def data_version(self):
+        """Changes whenever another connection commits to the database"""
+        return self._execute('PRAGMA data_version').fetchone()[0]
+
+    @staticmethod
+    def _row_to_dict(row):
+        try:
+            tags = json.loads(row['tags'] or '[]')
+        except json.JSONDecodeError:
+            tags = []
+        return {
+            'label': row['label'],
+            'username': row['username'],
+            'status': row['status'],
+            'avatar_url': row['avatar_url'],
+            'tags': tags,
+            'proxy': row['proxy']
+        }
+
+    # Writes
+
+    def upsert(self, acc, old_label=None):
+        """Insert or update one account (old_label handles renames)"""
+        data = acc.to_dict()
+        params = (data['label'], data['username'], data['status'], data['avatar_url'],
+                  json.dumps(data['tags'] or []), data['proxy'])
+        with self.batch():
+            if old_label and old_label != acc.label:
+                cursor = self._execute(
+                    'UPDATE accounts SET label=?, username=?, status=?, avatar_url=?, tags=?, proxy=? WHERE label=?',
+                    params + (old_label,))
+                if cursor.rowcount:
+                    return
+            self._execute(
+                'INSERT INTO accounts (label, username, status, avatar_url, tags, proxy) VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(label) DO UPDATE SET username=excluded.username, status=excluded.status, '
+                'avatar_url=excluded.avatar_url, tags=excluded.tags, proxy=excluded.proxy',
+                params)
+
+    def delete(self, label):
+        with self.batch():
+            self._execute('DELETE FROM accounts WHERE label=?', (label,))
+
+    def replace_all(self, accounts):
+        """Make the stored accounts exactly match this list, in one transaction"""
+        with self.batch():
+            labels = [acc.label for acc in accounts]
+            placeholders = ','.join('?' * len(labels))
+            if labels:
+                self._execute(f'DELETE FROM accounts WHERE label NOT IN ({placeholders})', labels)
+            else:
+                self._execute('DELETE FROM accounts')
+            for acc in accounts:
+                self.upsert(acc)
+
+    # JSON compatibility
+
+    def import_json(self, path):
+        """Add or update accounts from a JSON file in the accounts.json format"""
+        from account_manager import load_accounts
+        accounts = load_accounts(path)
+        with self.batch():
+            for acc in accounts:
+                self.upsert(acc)
+        return len(accounts)
+
+    def export_json(self, path):
+        """Write all accounts to a JSON file in the accounts.json format"""
+        from account_manager import save_accounts
+        accounts = self.load_all()
+        save_accounts(accounts, path)
+        return len(accounts)
@@ -6,6 +6,7 @@ import time
 import hashlib
 from typing import Dict, List, Optional
 from utils import log_to_file
+from metrics import get_metrics, timed_stage
 from datetime import datetime, timedelta
 import threading
 import queue
@@ -50,6 +51,14 @@ class APIRateLimiter:
         with self.lock:
             self.minute_calls.append(now)
             self.hour_calls.append(now)
+    
+    def usage(self) -> tuple:
+        """Calls made in the last minute and the last hour"""
+        now = time.time()
+        with self.lock:
+            minute = sum(1 for t in self.minute_calls if now - t < 60)
+            hour = sum(1 for t in self.hour_calls if now - t < 3600)
+        return minute, hour
 
 class APICache:
     """Cache to prevent duplicate API calls"""
@@ -127,6 +136,12 @@ class CostTracker:
             
             self.daily_costs[today] = self.daily_costs.get(today, 0) + cost
             self.monthly_costs[this_month] = self.monthly_costs.get(this_month, 0) + cost
+    
+    def spent(self) -> tuple:
+        """Estimated spend today and this month"""
+        with self.lock:
+            return (self.daily_costs.get(datetime.now().strftime('%Y-%m-%d'), 0),
+                    self.monthly_costs.get(datetime.now().strftime('%Y-%m'), 0))
 
 class OpenAIProvider:
     """OpenAI GPT integration - Focused and optimized"""
@@ -142,6 +157,7 @@ class OpenAIProvider:
         self.rate_limiter = APIRateLimiter()
         self.cache = APICache()
         self.cost_tracker = CostTracker()
+        get_metrics().register_source('openai', self.usage_metrics)
         
         if self.api_key:
             global client
@@ -149,6 +165,32 @@ class OpenAIProvider:
             log_to_file('ai_integration', f"OpenAI provider initialized with model: {model}")
             log_to_file('ai_integration', f"API key configured: {'Yes' if self.is_configured else 'No'}")
     
+    def usage_metrics(self) -> Dict:
+        """Request rate and spend against their limits, for the dashboard"""
+        minute, hour = self.rate_limiter.usage()
+        today, month = self.cost_tracker.spent()
+        return {
+            'model': self.model,
+            'requests_minute': minute,
+            'limit_minute': self.rate_limiter.max_calls_per_minute,
+            'requests_hour': hour,
+            'limit_hour': self.rate_limiter.max_calls_per_hour,
+            'spend_today': today,
+            'daily_budget': self.cost_tracker.daily_budget,
+            'spend_month': month,
+            'monthly_budget': self.cost_tracker.monthly_budget,
+        }
+    
+    def _create_completion(self, **kwargs):
+        """Chat completion request, timed and counted for the dashboard"""
+        get_metrics().increment('openai_requests', 'sent')
+        try:
+            with timed_stage('generate', model=kwargs.get('model')):
+                return client.chat.completions.create(**kwargs)
+        except Exception:
+            get_metrics().increment('openai_requests', 'failed')
+            raise
+    
     def test_connection(self, api_key: str = None) -> bool:
         """Test OpenAI API connection"""
         try:
@@ -209,7 +251,7 @@ class OpenAIProvider:
             # Make API call with retries
             for attempt in range(self.max_retries):
                 try:
-                    response = client.chat.completions.create(
+                    response = self._create_completion(
                         model=self.model,
                         messages=[
                             {"role": "system", "content": "You are a social media expert who creates engaging, authentic comments. Be conversational, relevant, and add value to the discussion."},
@@ -297,7 +339,7 @@ Generate a brief, natural reply ({min_chars}-{max_chars} characters) that:
 Reply:"""
             
             # Make API call
-            response = client.chat.completions.create(
+            response = self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a casual Twitter user who replies naturally and briefly. Use conversational language and keep responses between 180-280 characters. No hashtags or emojis."},
@@ -390,7 +432,7 @@ Generate a brief, natural reply ({min_chars}-{max_chars} characters) that:
 Reply:"""
             
             # Make API call
-            response = client.chat.completions.create(
+            response = self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": f"You are a casual Twitter user who replies naturally and briefly. Use conversational language and keep responses between {min_chars}-{max_chars} characters. No hashtags or emojis."},
@@ -474,7 +516,7 @@ Reply:"""
             # Make API call with retries
             for attempt in range(self.max_retries):
                 try:
-                    response = client.chat.completions.create(
+                    response = self._create_completion(
                         model=self.model,
                         messages=[
                             {"role": "system", "content": "You are a social media analyst. Respond only with valid JSON. Analyze the tweet content and comment context to provide insights for engagement."},
@@ -660,7 +702,7 @@ Current reply: {short_reply}
 
 Expanded reply:"""
                 
-                response = client.chat.completions.create(
+                response = self._create_completion(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are a casual Twitter user. Expand the reply naturally to 180-280 characters."},
@@ -701,7 +743,7 @@ Current reply: {short_reply}
 
 Expanded reply:"""
                 
-                response = client.chat.completions.create(
+                response = self._create_completion(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": f"You are a casual Twitter user. Expand the reply naturally to {min_chars}-{max_chars} characters."},
@@ -798,7 +840,7 @@ Requirements:
                     if custom_prompt:
                         base_prompt += f"\n\nCustom Instructions: {custom_prompt}"
                     
-                    response = client.chat.completions.create(
+                    response = self._create_completion(
                         model=self.model,
                         messages=[
                             {"role": "system", "content": f"You are a Twitter user with this personality: {style['prompt']}. Keep replies brief (180-280 characters) and natural."},
@@ -1030,7 +1072,7 @@ Choose the most natural style based on the tweet content. Focus on making statem
             if not client:
                 return None
             
-            response = client.chat.completions.create(
+            response = self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a casual Twitter user who creates natural, engaging replies. Be conversational and genuine. Focus on making statements and observations, avoid asking questions."},
@@ -0,0 +1,159 @@
+import os
+import io
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from constants import AVATAR_DIR
+
+# Thumbnail edge length in pixels (fits a Treeview row)
+AVATAR_THUMB_SIZE = 24
+
+# Decoded PhotoImages kept in memory
+AVATAR_LRU_SIZE = 512
+
+AVATAR_FETCH_WORKERS = 4
+
+# How long a URL that failed to download is left alone before it is tried again
+AVATAR_RETRY_SECONDS = 600
+
+
+class AvatarCache:
+    """Account avatars as small cached thumbnails.
+
+    Images are downloaded once through a pooled HTTP session, shrunk with
+    Pillow and stored on disk under their content hash, with an index from
+    avatar URL to hash. A new download only happens when an account's avatar
+    URL changes, and a URL that failed is not retried for AVATAR_RETRY_SECONDS.
+    Decoded PhotoImages live in an LRU and must only be created
+    and used on the Tk main thread; downloads run on a small worker pool.
+    """
+
+    def __init__(self, cache_dir=AVATAR_DIR, thumb_size=AVATAR_THUMB_SIZE, max_images=AVATAR_LRU_SIZE):
+        self.cache_dir = cache_dir
+        self.thumb_size = thumb_size
+        self.max_images = max_images
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        import requests
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = 'Mozilla/5.0'
+        self._executor = ThreadPoolExecutor(max_workers=AVATAR_FETCH_WORKERS, thread_name_prefix='avatar-fetch')
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._failed = {}  # avatar URL -> time after which a new download may be tried
+        self._images = OrderedDict()  # content hash -> PhotoImage
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()  # avatar URL -> content hash
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _thumb_path(self, digest):
+        return os.path.join(self.cache_dir, f'{digest}.png')
+
+    def get_thumbnail_path(self, url):
+        """Path of the cached thumbnail for this URL, or None if not fetched yet"""
+        with self._lock:
+            digest = self._index.get(url)
+        if digest and os.path.exists(self._thumb_path(digest)):
+            return self._thumb_path(digest)
+        return None
+
+    def get_photo(self, url, on_ready=None):
+        """PhotoImage for an avatar URL (main thread only).
+
+        Returns None when the thumbnail isn't cached yet; it's then fetched in
+        the background and on_ready(url) is called from the worker thread.
+        """
+        if not url:
+            return None
+        with self._lock:
+            digest = self._index.get(url)
+            if digest in self._images:
+                self._images.move_to_end(digest)
+                return self._images[digest]
+
+        path = self._thumb_path(digest) if digest else None
+        if path and os.path.exists(path):
+            from PIL import Image, ImageTk
+            with Image.open(path) as image:
+                photo = ImageTk.PhotoImage(image)
+            with self._lock:
+                self._images[digest] = photo
+                while len(self._images) > self.max_images:
+                    self._images.popitem(last=False)
+            return photo
+
+        self.fetch(url, on_ready)
+        return None
+
+    def fetch(self, url, on_ready=None):
+        """Download and cache an avatar in the background (no-op if cached or in flight)"""
+        with self._lock:
+            if url in self._pending or self._failed.get(url, 0) > time.time():
+                return
+            if url in self._index and os.path.exists(self._thumb_path(self._index[url])):
+                return
+            self._pending.add(url)
+        self._executor.submit(self._fetch, url, on_ready)
+
+    def _fetch(self, url, on_ready):
+        try:
+            response = self._session.get(url, timeout=15)
+            response.raise_for_status()
+            self.store_bytes(url, response.content)
+            with self._lock:
+                self._failed.pop(url, None)
+            if on_ready:
+                on_ready(url)
+        except Exception as e:
+            print(f"⚠️ Could not fetch avatar {url}: {e}")
+            with self._lock:
+                self._failed[url] = time.time() + AVATAR_RETRY_SECONDS
+        finally:
+            with self._lock:
+                self._pending.discard(url)
+
+    def store_bytes(self, url, data):
+        """Cache avatar image bytes (e.g. already fetched by a browser) for a URL"""
+        from PIL import Image
+        digest = hashlib.sha1(data).hexdigest()
+        path = self._thumb_path(digest)
+        if not os.path.exists(path):
+            with Image.open(io.BytesIO(data)) as image:
+                image = image.convert('RGBA')
+                image.thumbnail((self.thumb_size, self.thumb_size))
+                tmp_path = path + '.tmp'
+                image.save(tmp_path, format='PNG')
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._index[url] = digest
+            self._save_index()
+        return path
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_avatar_cache = None
+_avatar_cache_lock = threading.Lock()
+
+def get_avatar_cache():
+    """Get or create the global avatar cache"""
+    global _avatar_cache
+    with _avatar_cache_lock:
+        if _avatar_cache is None:
+            _avatar_cache = AvatarCache()
+        return _avatar_cache
@@ -0,0 +1,408 @@
+"""Local stand-in for the X pages the automation drives.
+
+    python -m benchmarks.mock_x_site [--port 8800] [--latency-ms 150] [--render-ms 300] [--require-login]
+
+Serves tweet detail pages, an infinitely scrolling search timeline, the
+login flow, the reply composer, the DM composer, profile pages and profile
+settings with the same data-testid structure the selenium code looks for.
+Every response is delayed by the configured network latency, and pages
+render their content from JavaScript after a further delay, like X's own
+client does. Actions the browser performs (replies, likes, reposts, DMs,
+profile saves) are counted and can be read from /__mock__/stats.
+
+Point the app at it with XAUTO_X_BASE_URL=http://127.0.0.1:<port>.
+"""
+import json
+import time
+import random
+import argparse
+import threading
+import urllib.parse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+DEFAULT_PORT = 8800
+
+# Network round trip added to every response
+DEFAULT_LATENCY_MS = 150
+
+# Random extra latency, up to this much, on top of DEFAULT_LATENCY_MS
+DEFAULT_JITTER_MS = 100
+
+# Time the page script takes to render content after the document loads
+DEFAULT_RENDER_MS = 300
+
+# Tweets per search timeline page; scrolling near the bottom loads the next one
+TIMELINE_PAGE_SIZE = 10
+
+# Timeline pages a search returns before it runs out
+TIMELINE_PAGES = 5
+
+# Replies shown under each tweet
+REPLIES_PER_TWEET = 8
+
+# Cookie set by the mock login page
+AUTH_COOKIE = 'auth_token'
+
+WORDS = ('automation latency browser timeline reply thread scaling python queue metrics selector '
+         'render network cache profile session benchmark throughput worker pipeline').split()
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; background: #fff; }
+main { width: 600px; margin: 0 auto; }
+article { display: block; min-height: 140px; border-bottom: 1px solid #eee; padding: 12px; }
+[role="button"], [role="menuitem"], [role="option"] { display: inline-block; cursor: pointer; padding: 4px 10px; margin-right: 6px; border: 1px solid #ccc; border-radius: 12px; }
+[role="dialog"] { position: fixed; top: 80px; left: 50%; width: 560px; margin-left: -280px; background: #fff; border: 1px solid #888; padding: 16px; }
+[contenteditable="true"] { min-height: 60px; border: 1px solid #ccc; padding: 6px; margin-bottom: 8px; }
+"""
+
+# Shared page script: latency-aware API calls and the tweet markup X uses
+SCRIPT = """
+function api(path, body) {
+  return fetch(path, {method: body ? 'POST' : 'GET', headers: {'Content-Type': 'application/json'},
+                      body: body ? JSON.stringify(body) : undefined}).then(r => r.json());
+}
+function esc(s) { const d = document.createElement('div'); d.textContent = s; return d.innerHTML; }
+function tweetHtml(t, actions) {
+  let html = '<div data-testid="cellInnerDiv"><article data-testid="tweet" role="article" tabindex="0">' +
+    '<div data-testid="User-Name"><a href="/' + t.user + '" role="link">' + esc(t.name) + '</a> ' +
+    '<a href="/' + t.user + '/status/' + t.id + '" role="link"><time>' + t.time + '</time></a></div>' +
+    '<div data-testid="tweetText" lang="en" dir="auto"><span>' + esc(t.text) + '</span></div>';
+  if (actions) {
+    html += '<div role="group">' +
+      '<div data-testid="reply" role="button" aria-label="' + t.replies + ' Replies. Reply">Reply</div>' +
+      '<div data-testid="retweet" role="button" aria-label="Repost">Repost</div>' +
+      '<div data-testid="like" role="button" aria-label="Like">Like</div></div>';
+  }
+  return html + '</article></div>';
+}
+function later(fn) { setTimeout(fn, RENDER_MS); }
+"""
+
+
+def _tweet(tweet_id, user=None):
+    """Deterministic tweet for an id"""
+    rng = random.Random(tweet_id)
+    user = user or f'user{rng.randint(1, 500)}'
+    words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(12, 30)))
+    return {'id': str(tweet_id), 'user': user, 'name': user.title(), 'time': f'{rng.randint(1, 59)}m',
+            'text': f'Mock tweet {tweet_id}: {words}.', 'replies': REPLIES_PER_TWEET}
+
+
+def _replies(tweet_id):
+    return [_tweet(int(tweet_id) * 100 + n) for n in range(1, REPLIES_PER_TWEET + 1)]
+
+
+def _timeline_page(query, page):
+    if page >= TIMELINE_PAGES:
+        return []
+    seed = sum(ord(c) for c in query) * 1000
+    return [_tweet(seed + page * TIMELINE_PAGE_SIZE + n) for n in range(TIMELINE_PAGE_SIZE)]
+
+
+class MockXState:
+    """Counters of everything the browser did on the mock site"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = {}
+            self.last = {}
+
+    def record(self, kind, details=None):
+        with self._lock:
+            self.counts[kind] = self.counts.get(kind, 0) + 1
+            self.last[kind] = details
+
+    def snapshot(self):
+        with self._lock:
+            return {'counts': dict(self.counts), 'last': dict(self.last)}
+
+
+class MockXHandler(BaseHTTPRequestHandler):
+    server_version = 'MockX/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _delay(self):
+        jitter = random.uniform(0, self.server.jitter_ms) if self.server.jitter_ms else 0
+        time.sleep((self.server.latency_ms + jitter) / 1000)
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _json(self, payload, status=200):
+        self._send(status, json.dumps(payload), 'application/json')
+
+    def _page(self, title, body, script=''):
+        self._send(200, f"""<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title} / X</title>
+<style>{STYLE}</style></head><body><main role="main"><div data-testid="primaryColumn">{body}</div></main>
+<script>const RENDER_MS = {self.server.render_ms};{SCRIPT}{script}</script></body></html>""")
+
+    def _logged_in(self):
+        cookies = self.headers.get('Cookie', '')
+        return any(part.strip().startswith(f'{AUTH_COOKIE}=') for part in cookies.split(';'))
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        parts = [part for part in url.path.split('/') if part]
+
+        if url.path == '/favicon.ico':
+            self._send(204, '')
+            return
+        if parts[:1] == ['__mock__']:
+            self._mock_api(parts[1:], query)
+            return
+
+        self._delay()
+        if url.path == '/i/flow/login':
+            self._login_page(query.get('redirect_after_login', ['/home'])[0])
+            return
+        if self.server.require_login and not self._logged_in():
+            target = urllib.parse.quote(self.path)
+            self._send(302, '', headers={'Location': f'/i/flow/login?redirect_after_login={target}'})
+            return
+
+        self.server.state.record('page_view', url.path)
+        if not parts or parts == ['home']:
+            self._timeline_page('Home', 'home')
+        elif parts == ['search']:
+            self._timeline_page('Search', query.get('q', [''])[0])
+        elif parts == ['messages']:
+            self._messages_page()
+        elif parts == ['settings', 'profile']:
+            self._settings_page()
+        elif len(parts) >= 3 and parts[1] == 'status' and parts[2].isdigit():
+            # /user/status/id and its /photo/1, /video/1 variants
+            self._tweet_page(parts[0], parts[2])
+        elif len(parts) == 1:
+            self._profile_page(parts[0])
+        else:
+            self._page('Page not found', "<div><span>Hmm...this page doesn't exist. Try searching for something else.</span></div>")
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self._json({'error': 'invalid json'}, 400)
+            return
+        if url.path == '/__mock__/reset':
+            self.server.state.reset()
+            self._json({'ok': True})
+        elif url.path == '/__mock__/action':
+            self._delay()
+            self.server.state.record(body.get('type', 'unknown'), body)
+            self._json({'ok': True})
+        else:
+            self._json({'error': 'not found'}, 404)
+
+    def _mock_api(self, parts, query):
+        if parts == ['stats']:
+            self._json(self.server.state.snapshot())
+        elif parts == ['timeline']:
+            self._delay()
+            page = int(query.get('page', ['0'])[0])
+            self._json(_timeline_page(query.get('q', [''])[0], page))
+        else:
+            self._json({'error': 'not found'}, 404)
+
+    # Pages
+
+    def _login_page(self, redirect):
+        self._page('Log in', """
+<div><h1>Sign in to X</h1>
+<input autocomplete="username" name="text" type="text">
+<input autocomplete="current-password" name="password" type="password">
+<div data-testid="LoginForm_Login_Button" role="button" id="login">Log in</div></div>""", f"""
+document.getElementById('login').onclick = () => {{
+  document.cookie = '{AUTH_COOKIE}=mock; path=/';
+  location.href = {json.dumps(redirect)};
+}};""")
+
+    def _timeline_page(self, title, timeline_query):
+        self._page(title, '<div aria-label="Timeline" id="timeline"></div>', f"""
+const QUERY = {json.dumps(timeline_query)};
+let page = 0, loading = false, done = false;
+function loadPage() {{
+  if (loading || done) return;
+  loading = true;
+  api('/__mock__/timeline?q=' + encodeURIComponent(QUERY) + '&page=' + page).then(tweets => {{
+    later(() => {{
+      if (!tweets.length) {{ done = true; }}
+      document.getElementById('timeline').insertAdjacentHTML('beforeend', tweets.map(t => tweetHtml(t, true)).join(''));
+      page += 1;
+      loading = false;
+    }});
+  }});
+}}
+window.addEventListener('scroll', () => {{
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 400) loadPage();
+}});
+loadPage();""")
+
+    def _tweet_page(self, user, tweet_id):
+        tweet = _tweet(int(tweet_id), user)
+        self._page(f'{tweet["name"]} on X', '<div aria-label="Timeline: Conversation" id="conversation"></div>', f"""
+const TWEET = {json.dumps(tweet)};
+const REPLIES = {json.dumps(_replies(tweet_id))};
+function bind() {{
+  const root = document.querySelector('#conversation article');
+  root.querySelector('[data-testid="reply"]').onclick = openComposer;
+  const like = root.querySelector('[data-testid="like"]');
+  like.onclick = () => {{
+    if (like.dataset.testid !== 'like') return;
+    api('/__mock__/action', {{type: 'like', tweet: TWEET.id}}).then(() => {{
+      like.dataset.testid = 'unlike'; like.setAttribute('aria-label', 'Liked');
+    }});
+  }};
+  const retweet = root.querySelector('[data-testid="retweet"]');
+  retweet.onclick = () => {{
+    if (retweet.dataset.testid !== 'retweet' || document.querySelector('[role="menu"]')) return;
+    retweet.insertAdjacentHTML('afterend', '<div role="menu"><div data-testid="retweetConfirm" role="menuitem">Repost</div></div>');
+    document.querySelector('[data-testid="retweetConfirm"]').onclick = () => {{
+      api('/__mock__/action', {{type: 'retweet', tweet: TWEET.id}}).then(() => {{
+        document.querySelector('[role="menu"]').remove();
+        retweet.dataset.testid = 'unretweet'; retweet.setAttribute('aria-label', 'Reposted');
+      }});
+    }};
+  }};
+}}
+function openComposer() {{
+  if (document.querySelector('[role="dialog"]')) return;
+  document.body.insertAdjacentHTML('beforeend',
+    '<div role="dialog" aria-modal="true" aria-labelledby="modal-header"><div id="modal-header">Replying to @' + TWEET.user + '</div>' +
+    '<div data-testid="tweetTextarea_0" contenteditable="true" role="textbox" aria-label="Post text"></div>' +
+    '<div data-testid="tweetButton" role="button">Reply</div></div>');
+  document.querySelector('[data-testid="tweetButton"]').onclick = () => {{
+    const text = document.querySelector('[data-testid="tweetTextarea_0"]').textContent.trim();
+    if (!text) return;
+    api('/__mock__/action', {{type: 'reply', tweet: TWEET.id, text: text}}).then(() => {{
+      document.querySelector('[role="dialog"]').remove();
+    }});
+  }};
+}}
+later(() => {{
+  document.getElementById('conversation').innerHTML = tweetHtml(TWEET, true) + REPLIES.map(t => tweetHtml(t, false)).join('');
+  bind();
+}});""")
+
+    def _messages_page(self):
+        self._page('Messages', """
+<div><a href="#" data-testid="NewDM_Button" role="link" id="new-dm">New message</a></div>
+<div id="dm"></div>""", """
+document.getElementById('new-dm').onclick = (event) => {
+  event.preventDefault();
+  const dm = document.getElementById('dm');
+  dm.innerHTML = '<div role="dialog"><input data-testid="searchPeople" placeholder="Search people"><div id="results"></div></div>';
+  const search = dm.querySelector('[data-testid="searchPeople"]');
+  search.oninput = () => later(() => {
+    const name = search.value.replace(/^@/, '');
+    document.getElementById('results').innerHTML = name ?
+      '<div data-testid="typeaheadResult" role="option">@' + esc(name) + '</div>' : '';
+    const result = document.querySelector('[data-testid="typeaheadResult"]');
+    if (result) result.onclick = () => openConversation(name);
+  });
+};
+function openConversation(name) {
+  document.getElementById('dm').innerHTML = '<div data-testid="DmActivityContainer"><div>@' + esc(name) + '</div>' +
+    '<div data-testid="dmComposerTextInput" contenteditable="true" role="textbox"></div>' +
+    '<div data-testid="dmComposerSendButton" role="button">Send</div></div>';
+  document.querySelector('[data-testid="dmComposerSendButton"]').onclick = () => {
+    const input = document.querySelector('[data-testid="dmComposerTextInput"]');
+    api('/__mock__/action', {type: 'dm', to: name, text: input.textContent}).then(() => { input.textContent = ''; });
+  };
+}""")
+
+    def _settings_page(self):
+        self._page('Edit profile', '<div id="settings"></div>', """
+later(() => {
+  document.getElementById('settings').innerHTML = '<div role="dialog" aria-labelledby="modal-header"><div id="modal-header">Edit profile</div>' +
+    '<input type="file" accept="image/jpeg,image/png,image/webp" data-testid="fileInput">' +
+    '<textarea name="description" rows="3"></textarea>' +
+    '<div data-testid="saveButton" role="button">Save</div></div>';
+  document.querySelector('[data-testid="saveButton"]').onclick = () => {
+    const file = document.querySelector('input[type="file"]').files[0];
+    api('/__mock__/action', {type: 'profile_save', description: document.querySelector('textarea[name="description"]').value,
+                             avatar: file ? file.name : null});
+  };
+});""")
+
+    def _profile_page(self, user):
+        self._page(f'@{user}', '<div id="profile"></div>', f"""
+const USER = {json.dumps(user)};
+later(() => {{
+  document.getElementById('profile').innerHTML =
+    '<img data-testid="UserAvatar-Container-unknown" src="/favicon.ico" alt="">' +
+    '<div data-testid="UserName"><span>' + esc(USER) + '</span> <span>@' + esc(USER) + '</span></div>';
+}});""")
+
+
+class MockXServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=DEFAULT_PORT, latency_ms=DEFAULT_LATENCY_MS, jitter_ms=DEFAULT_JITTER_MS,
+                 render_ms=DEFAULT_RENDER_MS, require_login=False, verbose=False, host='127.0.0.1'):
+        super().__init__((host, port), MockXHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.render_ms = render_ms
+        self.require_login = require_login
+        self.verbose = verbose
+        self.state = MockXState()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve from a background thread; returns self"""
+        threading.Thread(target=self.serve_forever, name='mock-x-site', daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def tweet_url(base_url, tweet_id, user='benchuser'):
+    return f'{base_url}/{user}/status/{tweet_id}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve a local mock of the X pages xAuto drives')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=int, default=DEFAULT_LATENCY_MS, help='delay added to every response')
+    parser.add_argument('--jitter-ms', type=int, default=DEFAULT_JITTER_MS, help='random extra delay, up to this much')
+    parser.add_argument('--render-ms', type=int, default=DEFAULT_RENDER_MS, help='client-side render delay')
+    parser.add_argument('--require-login', action='store_true', help='redirect to the login flow until logged in')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    server = MockXServer(args.port, args.latency_ms, args.jitter_ms, args.render_ms, args.require_login, args.verbose)
+    print(f"🧪 Mock X site on {server.base_url} (set XAUTO_X_BASE_URL={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
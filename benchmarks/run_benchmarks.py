@@ -0,0 +1,323 @@
+"""End-to-end browser automation benchmarks against the local mock X site.
+
+    python -m benchmarks.run_benchmarks [--scenarios reply,scrape,search,like_retweet]
+                                        [--concurrency 1,2,4] [--iterations 3]
+                                        [--latency-ms 150] [--render-ms 300] [--headed]
+                                        [--output FILE] [--baseline FILE] [--save-baseline]
+                                        [--max-regression PERCENT]
+
+Starts the mock site, points the app at it (XAUTO_X_BASE_URL) and drives
+real Chrome sessions through the same selenium_manager and campaign_engine
+functions the panels use. Each scenario runs at every concurrency level
+with one throwaway account per worker thread; browsers are launched before
+the timed part. The report gives throughput, per-operation latency
+percentiles, how many actions the mock site actually received, and a
+per-phase breakdown built from trace spans (navigation, selector waits,
+typing, posting). Results are compared with the saved baseline;
+--max-regression makes the run exit 1 when throughput or p95 latency
+regresses by more than that percentage.
+
+Everything the app writes (history, cookies, profiles) goes to a temporary
+working directory, so benchmarking never touches real accounts.
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from benchmarks.mock_x_site import MockXServer, tweet_url, DEFAULT_LATENCY_MS, DEFAULT_JITTER_MS, DEFAULT_RENDER_MS
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+
+SCENARIOS = ('reply', 'scrape', 'search', 'like_retweet')
+
+# Tweets search_tweet_urls is asked for per search operation
+SEARCH_MAX_TWEETS = 30
+
+# Trace phases listed per result, longest total time first
+PHASES_SHOWN = 10
+
+# Config keys that make two runs comparable
+COMPARABLE_CONFIG = ('latency_ms', 'jitter_ms', 'render_ms', 'iterations', 'headless')
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class BenchmarkRunner:
+    """Runs the scenarios against a started mock site; app modules are imported lazily"""
+
+    def __init__(self, server, iterations):
+        self.server = server
+        self.iterations = iterations
+        self._op_counter = 0
+        self._op_lock = threading.Lock()
+        from account_manager import SeleniumAccount
+        from selenium_manager import get_global_driver_manager
+        from tracing import get_tracer
+        self.account_class = SeleniumAccount
+        self.driver_manager = get_global_driver_manager()
+        self.tracer = get_tracer()
+        self.tracer.enable()
+
+    def accounts(self, count):
+        return [self.account_class(f'bench{n + 1}', f'bench{n + 1}') for n in range(count)]
+
+    def _next_id(self):
+        """A fresh tweet id per operation, so likes and reposts never hit an already-liked tweet"""
+        with self._op_lock:
+            self._op_counter += 1
+            return 1_000_000 + self._op_counter
+
+    def _operation(self, scenario):
+        """fn(acc) -> (success, detail) for one operation of the scenario"""
+        from selenium_manager import reply_to_tweet, like_and_retweet, scrape_tweet_content_and_comments
+        from campaign_engine import build_search_url, search_tweet_urls
+        base = self.server.base_url
+
+        if scenario == 'reply':
+            def op(acc):
+                tweet_id = self._next_id()
+                return reply_to_tweet(acc, tweet_url(base, tweet_id), f"Benchmark reply {tweet_id}, measuring the reply flow.")
+        elif scenario == 'like_retweet':
+            def op(acc):
+                return like_and_retweet(acc, tweet_url(base, self._next_id()))
+        elif scenario == 'scrape':
+            def op(acc):
+                driver = self.driver_manager.get_reader_driver(acc)
+                content, comments = scrape_tweet_content_and_comments(driver, tweet_url(base, self._next_id()))
+                return len(content) > 10, f"{len(comments)} comments"
+        elif scenario == 'search':
+            def op(acc):
+                urls = search_tweet_urls(acc, build_search_url(f'benchmark {self._next_id()}'), SEARCH_MAX_TWEETS,
+                                         log=lambda message: None)
+                return bool(urls), f"{len(urls)} tweets"
+        else:
+            raise ValueError(f"Unknown scenario: {scenario}")
+        return op
+
+    def _warm_up(self, scenario, accounts):
+        """Launch the browsers the scenario uses so launch time stays out of the measurement"""
+        started = time.perf_counter()
+        for acc in accounts:
+            if scenario in ('reply', 'like_retweet'):
+                self.driver_manager.get_driver(acc)
+            else:
+                self.driver_manager.get_reader_driver(acc)
+        return time.perf_counter() - started
+
+    def run(self, scenario, concurrency):
+        accounts = self.accounts(concurrency)
+        launch_seconds = self._warm_up(scenario, accounts)
+        op = self._operation(scenario)
+        latencies, failures = [], []
+        lock = threading.Lock()
+
+        def worker(acc):
+            for _ in range(self.iterations):
+                started = time.perf_counter()
+                try:
+                    result = op(acc)
+                    success = bool(result[0]) if isinstance(result, tuple) else bool(result)
+                    detail = result[1] if isinstance(result, tuple) and len(result) > 1 else ''
+                except Exception as e:
+                    success, detail = False, str(e)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    if not success:
+                        failures.append(f"{acc.label}: {detail}")
+
+        self.server.state.reset()
+        self.tracer.clear()
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(acc,), name=f'bench-{acc.label}') for acc in accounts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+        ordered = sorted(latencies)
+        counts = self.server.state.snapshot()['counts']
+        return {
+            'scenario': scenario,
+            'concurrency': concurrency,
+            'operations': len(latencies),
+            'succeeded': len(latencies) - len(failures),
+            'failed': len(failures),
+            'failures': failures[:5],
+            'wall_seconds': wall,
+            'throughput_per_min': len(latencies) / wall * 60 if wall else 0.0,
+            'p50_seconds': _percentile(ordered, 0.5),
+            'p95_seconds': _percentile(ordered, 0.95),
+            'max_seconds': ordered[-1] if ordered else None,
+            'launch_seconds': launch_seconds,
+            'mock_actions': {kind: count for kind, count in counts.items() if kind != 'page_view'},
+            'page_views': counts.get('page_view', 0),
+            'phases': self._phases(),
+        }
+
+    def _phases(self):
+        """Per-span-name totals and percentiles from the trace buffer"""
+        by_name = {}
+        for name, _, duration_ns, _, _ in self.tracer.spans():
+            if name.startswith('action.'):
+                continue
+            by_name.setdefault(name, []).append(duration_ns / 1e9)
+        phases = {}
+        for name, durations in sorted(by_name.items(), key=lambda item: -sum(item[1]))[:PHASES_SHOWN]:
+            durations.sort()
+            phases[name] = {'count': len(durations), 'total_seconds': sum(durations),
+                            'p50_seconds': _percentile(durations, 0.5), 'p95_seconds': _percentile(durations, 0.95)}
+        return phases
+
+
+def compare(results, baseline, max_regression):
+    """Rows of (key, metric, baseline, current, change %, regressed) for results also in the baseline"""
+    rows = []
+    for key, current in results.items():
+        before = baseline.get('results', {}).get(key)
+        if not before:
+            continue
+        for metric, higher_is_better in (('throughput_per_min', True), ('p50_seconds', False), ('p95_seconds', False)):
+            old, new = before.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better else change
+            regressed = max_regression is not None and metric != 'p50_seconds' and worse > max_regression
+            rows.append((key, metric, old, new, change, regressed))
+    return rows
+
+
+def _fmt(value, digits=2):
+    return '-' if value is None else f"{value:.{digits}f}"
+
+
+def print_report(results, comparison):
+    print("\n📊 Benchmark results")
+    print(f"{'scenario':<16}{'conc':>5}{'ops':>6}{'ok':>5}{'ops/min':>10}{'p50 s':>9}{'p95 s':>9}{'max s':>9}{'launch s':>10}  mock actions")
+    for key, r in results.items():
+        actions = ', '.join(f"{kind}={count}" for kind, count in sorted(r['mock_actions'].items())) or '-'
+        print(f"{r['scenario']:<16}{r['concurrency']:>5}{r['operations']:>6}{r['succeeded']:>5}"
+              f"{_fmt(r['throughput_per_min'], 1):>10}{_fmt(r['p50_seconds']):>9}{_fmt(r['p95_seconds']):>9}"
+              f"{_fmt(r['max_seconds']):>9}{_fmt(r['launch_seconds']):>10}  {actions}")
+        for failure in r['failures']:
+            print(f"    ❌ {failure}")
+
+    for key, r in results.items():
+        if not r['phases']:
+            continue
+        print(f"\n⏱️ Phases for {key} (from trace spans)")
+        for name, phase in r['phases'].items():
+            share = phase['total_seconds'] / (r['wall_seconds'] * r['concurrency']) * 100 if r['wall_seconds'] else 0
+            print(f"    {name:<32}{phase['count']:>5}x  p50 {_fmt(phase['p50_seconds'])}s  "
+                  f"p95 {_fmt(phase['p95_seconds'])}s  {share:5.1f}% of worker time")
+
+    if comparison:
+        print("\n📈 Compared with baseline")
+        for key, metric, old, new, change, regressed in comparison:
+            marker = '❌' if regressed else ('✅' if (change > 0) == (metric == 'throughput_per_min') else '➖')
+            print(f"    {marker} {key:<20}{metric:<20}{_fmt(old):>10} → {_fmt(new):<10}{change:+6.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark browser automation against a local mock X site')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f"comma separated, from {', '.join(SCENARIOS)}")
+    parser.add_argument('--concurrency', default='1,2,4', help='comma separated worker counts')
+    parser.add_argument('--iterations', type=int, default=3, help='operations per worker at each level')
+    parser.add_argument('--latency-ms', type=int, default=DEFAULT_LATENCY_MS)
+    parser.add_argument('--jitter-ms', type=int, default=DEFAULT_JITTER_MS)
+    parser.add_argument('--render-ms', type=int, default=DEFAULT_RENDER_MS)
+    parser.add_argument('--headed', action='store_true', help='show the browser windows')
+    parser.add_argument('--output', metavar='FILE', help='write the results as JSON')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, metavar='FILE', help='baseline to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--max-regression', type=float, default=None, metavar='PERCENT',
+                        help='exit 1 if throughput or p95 latency is this much worse than the baseline')
+    parser.add_argument('--keep-workdir', action='store_true', help="don't delete the temporary working directory")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    levels = sorted({int(level) for level in args.concurrency.split(',') if level.strip()})
+    # The run happens in a temporary directory; keep the paths given relative to where we started
+    start_dir = os.getcwd()
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline)
+
+    server = MockXServer(port=0, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, render_ms=args.render_ms).start()
+    print(f"🧪 Mock X site on {server.base_url}")
+
+    # Read by constants.py and selenium_manager at import, so set before importing the app
+    os.environ['XAUTO_X_BASE_URL'] = server.base_url
+    if not args.headed:
+        os.environ['XAUTO_HEADLESS'] = '1'
+    workdir = tempfile.mkdtemp(prefix='xauto-bench-')
+    sys.path.insert(0, REPO_ROOT)
+    os.chdir(workdir)
+    print(f"📁 Working directory: {workdir}")
+
+    config = {'latency_ms': args.latency_ms, 'jitter_ms': args.jitter_ms, 'render_ms': args.render_ms,
+              'iterations': args.iterations, 'headless': not args.headed}
+    results = {}
+    runner = None
+    try:
+        runner = BenchmarkRunner(server, args.iterations)
+        for scenario in scenarios:
+            for level in levels:
+                print(f"🚀 {scenario} at concurrency {level}...")
+                results[f'{scenario}@{level}'] = runner.run(scenario, level)
+    except KeyboardInterrupt:
+        print("🛑 Interrupted - reporting the levels that finished")
+    finally:
+        if runner:
+            try:
+                runner.driver_manager.close_all_drivers()
+            except Exception as e:
+                print(f"⚠️ Error closing browsers: {e}")
+        server.stop()
+        os.chdir(start_dir)
+        if not args.keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {'created': datetime.now().isoformat(timespec='seconds'), 'config': config, 'results': results}
+
+    baseline = None
+    if os.path.exists(baseline_path) and not args.save_baseline:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        different = [key for key in COMPARABLE_CONFIG if baseline.get('config', {}).get(key) != config[key]]
+        if different:
+            print(f"⚠️ Baseline was recorded with different settings ({', '.join(different)}); compare with care")
+    comparison = compare(results, baseline, args.max_regression) if baseline else []
+    print_report(results, comparison)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {output}")
+    if args.save_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline saved to {baseline_path}")
+
+    return 1 if any(row[5] for row in comparison) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import os
+import sys
+import json
+import threading
+import time
+import urllib.request
+from constants import BROWSER_SESSIONS_FILE
+
+# How long to wait for a recorded DevTools endpoint to answer
+ENDPOINT_TIMEOUT_SECONDS = 2
+
+
+def _pid_alive(pid):
+    """Whether a process with this pid is still running"""
+    if not pid:
+        return False
+    if sys.platform.startswith('win'):
+        # os.kill(pid, 0) terminates the process on Windows, ask the kernel instead
+        try:
+            import ctypes
+            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+            STILL_ACTIVE = 259
+            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                return False
+            exit_code = ctypes.c_ulong()
+            ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            ctypes.windll.kernel32.CloseHandle(handle)
+            return exit_code.value == STILL_ACTIVE
+        except Exception:
+            return True
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except Exception:
+        return False
+
+
+def _endpoint_alive(debugger_address):
+    """Whether a DevTools endpoint answers /json/version"""
+    try:
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version",
+                                    timeout=ENDPOINT_TIMEOUT_SECONDS) as response:
+            return response.status == 200 and b'Browser' in response.read()
+    except Exception:
+        return False
+
+
+class BrowserSessionRegistry:
+    """Running browsers that outlive the app, keyed by account label.
+
+    Each entry records the DevTools debugger address, the browser pid and the
+    profile directory, so a restarted app can reconnect to the browser instead
+    of launching a new one. Entries are validated (process alive and DevTools
+    endpoint answering) before use, and stale ones are dropped.
+    """
+
+    def __init__(self, path=BROWSER_SESSIONS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, sessions):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(sessions, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, label, debugger_address, browser_pid, profile_dir):
+        """Remember a running browser for this account"""
+        if not debugger_address:
+            return
+        with self._lock:
+            sessions = self._load()
+            sessions[label] = {
+                'debugger_address': debugger_address,
+                'browser_pid': browser_pid,
+                'profile_dir': os.path.abspath(profile_dir),
+                'recorded_at': time.time()
+            }
+            self._save(sessions)
+
+    def remove(self, label):
+        with self._lock:
+            sessions = self._load()
+            if sessions.pop(label, None) is not None:
+                self._save(sessions)
+
+    def get(self, label):
+        """The recorded session for this account if it's still alive, else None"""
+        with self._lock:
+            entry = self._load().get(label)
+        if entry and self.is_alive(entry):
+            return entry
+        if entry:
+            print(f"🧹 Dropping stale browser session for {label}")
+            self.remove(label)
+        return None
+
+    def profile_paths(self):
+        """Profile directories of every recorded session, without checking that it is alive"""
+        with self._lock:
+            sessions = self._load()
+        return {entry['profile_dir'] for entry in sessions.values() if entry.get('profile_dir')}
+
+    def is_alive(self, entry):
+        return _pid_alive(entry.get('browser_pid')) and _endpoint_alive(entry.get('debugger_address'))
+
+    def live_sessions(self):
+        """Validate every recorded session, drop the stale ones, return the rest"""
+        with self._lock:
+            sessions = self._load()
+        live = {label: entry for label, entry in sessions.items() if self.is_alive(entry)}
+        stale = set(sessions) - set(live)
+        if stale:
+            print(f"🧹 Dropping {len(stale)} stale browser session(s): {', '.join(sorted(stale))}")
+            with self._lock:
+                current = self._load()
+                for label in stale:
+                    current.pop(label, None)
+                self._save(current)
+        return live
+
+
+_browser_sessions = None
+_browser_sessions_lock = threading.Lock()
+
+def get_browser_sessions():
+    """Get or create the global browser session registry"""
+    global _browser_sessions
+    with _browser_sessions_lock:
+        if _browser_sessions is None:
+            _browser_sessions = BrowserSessionRegistry()
+        return _browser_sessions
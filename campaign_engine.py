@@ -0,0 +1,616 @@
+import re
+import time
+import random
+import threading
+import urllib.parse
+from metrics import timed_stage
+from tracing import span
+from sampling_profiler import profile_tags
+from constants import X_BASE_URL
+from utils import log_to_file
+
+# Job actions a campaign can run
+CAMPAIGN_ACTIONS = ('reply', 'reply_comments', 'like_retweet', 'dm', 'bio', 'yapping')
+
+DEFAULT_MIN_INTERVAL = 30
+DEFAULT_MAX_INTERVAL = 60
+
+# Share of tweets retweeted when a like/retweet job uses random_retweet
+RANDOM_RETWEET_SHARE = 0.2
+
+
+def build_search_url(query):
+    return f"{X_BASE_URL}/search?q={urllib.parse.quote(query)}&src=typed_query&f=top"
+
+
+def base_tweet_url(url):
+    """Tweet URL without /photo/1, /video/1 and similar suffixes"""
+    return url.split('/photo/')[0].split('/video/')[0].split('/gif/')[0]
+
+
+def resolve_accounts(spec, repository=None):
+    """Accounts named by a campaign: 'all', or a list of labels and 'tag:<name>' entries"""
+    if repository is None:
+        from account_manager import get_account_repository
+        repository = get_account_repository()
+    if spec in (None, 'all'):
+        return list(repository.accounts)
+    if isinstance(spec, str):
+        spec = [spec]
+
+    accounts = []
+    for entry in spec:
+        if entry.startswith('tag:'):
+            matches = repository.with_tag(entry[4:])
+        else:
+            acc = repository.get(entry) or repository.get_by_username(entry.lstrip('@'))
+            if acc is None:
+                raise ValueError(f"Unknown account: {entry}")
+            matches = [acc]
+        for acc in matches:
+            if acc not in accounts:
+                accounts.append(acc)
+    return accounts
+
+
+def load_campaign(path):
+    """Read and validate a campaign file"""
+    import json
+    with open(path, 'r', encoding='utf-8') as f:
+        campaign = json.load(f)
+    validate_campaign(campaign)
+    return campaign
+
+
+def validate_campaign(campaign):
+    jobs = campaign.get('jobs')
+    if not isinstance(jobs, list) or not jobs:
+        raise ValueError("Campaign needs a non-empty 'jobs' list")
+    for index, job in enumerate(jobs):
+        if job.get('action') not in CAMPAIGN_ACTIONS:
+            raise ValueError(f"Job {index + 1}: action must be one of {', '.join(CAMPAIGN_ACTIONS)}")
+
+
+@timed_stage('scrape')
+def search_tweet_urls(acc, search_url, max_tweets, log=print):
+    """Tweet URLs from an X search page, scraped in the account's reader session"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium_manager import get_global_driver_manager
+
+    with get_global_driver_manager().lease(acc.label, 'reader'):
+        driver = get_global_driver_manager().get_reader_driver(acc)
+        if not driver:
+            log("❌ Failed to get driver for scraping.")
+            return []
+
+        try:
+            log(f"🌐 Navigating to search URL: {search_url}")
+            driver.get(search_url)
+            time.sleep(5)  # Wait longer for search results to load
+
+            current_url = driver.current_url.lower()
+            if 'login' in current_url or 'i/flow/login' in current_url:
+                log("❌ Account is not logged in. Please log in first.")
+                return []
+
+            if 'search' not in current_url:
+                log("⚠️ Not on search page, trying to navigate again...")
+                driver.get(search_url)
+                time.sleep(3)
+                current_url = driver.current_url.lower()
+                if 'login' in current_url or 'i/flow/login' in current_url:
+                    log("❌ Account is not logged in after retry. Please log in first.")
+                    return []
+
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'article[data-testid="tweet"]'))
+                )
+                log("✅ Search results loaded successfully")
+            except Exception as e:
+                log(f"⚠️ Search results not found: {e}")
+                if 'search' not in driver.current_url.lower():
+                    log("❌ Not on search page. Check if account is logged in.")
+                    return []
+
+            log("📜 Scrolling to load tweets...")
+            for i in range(5):
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(2)
+
+            # First link per tweet article, then any status link if that found too few
+            tweet_urls = []
+            for article in driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]'):
+                try:
+                    for link in article.find_elements(By.CSS_SELECTOR, 'a[href*="/status/"]'):
+                        href = link.get_attribute('href')
+                        if href and '/status/' in href:
+                            url = base_tweet_url(href)
+                            if url not in tweet_urls:
+                                tweet_urls.append(url)
+                            break
+                except Exception:
+                    continue
+
+            if len(tweet_urls) < 5:
+                log("🔄 Trying alternative URL extraction method...")
+                for link in driver.find_elements(By.CSS_SELECTOR, 'a[href*="/status/"]'):
+                    href = link.get_attribute('href')
+                    if href and '/status/' in href:
+                        url = base_tweet_url(href)
+                        if url not in tweet_urls:
+                            tweet_urls.append(url)
+
+            unique_urls = list(dict.fromkeys(tweet_urls))[:max_tweets]
+            log(f"📊 Extracted {len(unique_urls)} unique tweets")
+            if not unique_urls:
+                log("❌ No tweets found in search results. Check if the search query is valid.")
+            return unique_urls
+
+        except Exception:
+            # Drop the reader session so the next search starts from a clean browser
+            get_global_driver_manager().close_reader_driver(acc)
+            raise
+
+
+@timed_stage('scrape')
+def scrape_tweet_comments(acc, tweet_url, max_comments, log=print):
+    """(username, text) of the first replies under a tweet, scraped in the account's reader session"""
+    from selenium.webdriver.common.by import By
+    from selenium_manager import get_global_driver_manager
+
+    with get_global_driver_manager().lease(acc.label, 'reader'):
+        driver = get_global_driver_manager().get_reader_driver(acc)
+        if not driver:
+            log(f"❌ Failed to open reader session for {acc.label}")
+            return []
+
+        try:
+            driver.get(tweet_url)
+            time.sleep(3)
+
+            current_url = driver.current_url
+            if 'login' in current_url or 'i/flow/login' in current_url:
+                log(f"❌ Account {acc.label} is not logged in")
+                return []
+
+            # Scroll to load comments
+            for _ in range(5):
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(1)
+
+            comments = []
+            # Skip the main tweet
+            for article in driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]')[1:max_comments + 1]:
+                try:
+                    username = article.find_element(By.CSS_SELECTOR, 'div[dir="ltr"] span').text
+                    text = article.find_element(By.CSS_SELECTOR, 'div[data-testid="tweetText"]').text
+                    if username and text:
+                        comments.append((username, text))
+                except Exception:
+                    continue
+            return comments
+
+        except Exception:
+            # Drop the reader session so the next tweet starts from a clean browser
+            get_global_driver_manager().close_reader_driver(acc)
+            raise
+
+
+def generate_unique_reply(ai_provider, tweet_content, custom_prompt, account_label, min_chars, max_chars):
+    """AI reply for one account, kept distinct per account and within the length limits"""
+    # Unique markers stop the provider's cache from handing every account the same reply
+    unique_content = (f"{tweet_content}\n\n[Account: {account_label}]\n[Timestamp: {int(time.time())}]\n"
+                      f"[Random: {random.randint(1000, 9999)}]\n[UniqueID: {random.randint(100000, 999999)}]")
+
+    reply_text = ai_provider.generate_comment_from_tweet_with_limits(unique_content, custom_prompt, min_chars, max_chars)
+    if not reply_text:
+        return None
+
+    # Remove hashtags and emojis
+    reply_text = re.sub(r'#\w+', '', reply_text)
+    reply_text = re.sub(r'[^\x00-\x7F\u00A0-\uFFFF]', '', reply_text)
+    reply_text = re.sub(r'\s+', ' ', reply_text).strip()
+
+    if len(reply_text) > max_chars:
+        reply_text = reply_text[:max_chars]
+    elif len(reply_text) < min_chars:
+        reply_text = ai_provider._expand_short_reply_with_limits(reply_text, tweet_content, min_chars, max_chars)
+
+    if len(reply_text) < min_chars:
+        follow_ups = [
+            " What do you think about this?",
+            " I'm curious about your thoughts.",
+            " How has your experience been?",
+            " Any insights to share?",
+            " What's your take on this?"
+        ]
+        reply_text = (reply_text + random.choice(follow_ups))[:max_chars]
+
+    return reply_text
+
+
+def _as_result(result):
+    """Action results come back as (success, message) or a bare bool"""
+    if isinstance(result, tuple):
+        return bool(result[0]), str(result[1]) if len(result) > 1 else ''
+    return bool(result), ''
+
+
+class CampaignEngine:
+    """Runs campaign jobs (reply, like/retweet, DM, bio, yapping) without any UI.
+
+    A campaign is a dict with an optional 'accounts' spec and interval
+    bounds, and a list of jobs, each naming an action and its inputs. Progress
+    is reported as plain dicts to on_event(event) from the running thread;
+    the CLI prints them as JSON lines and the GUI panels turn them into log
+    lines and progress bars. stop() and pause()/resume() may be called from
+    any thread.
+
+    With a RunJournal the engine checkpoints harvested tweet lists, generated
+    replies and every account action, and skips whatever the journal shows
+    as already done, so a run restarted with the same journal carries on
+    where it stopped.
+
+    review(tweet_url, content, comments, replies), if given, is called from
+    the running thread before a yapping tweet's replies are posted. It
+    returns the replies to post (account label -> text, possibly edited) or
+    None to skip the tweet; the GUI uses it for its review dialog.
+    """
+
+    def __init__(self, campaign, on_event=None, repository=None, journal=None, review=None):
+        validate_campaign(campaign)
+        self.campaign = campaign
+        self.on_event = on_event
+        self.repository = repository
+        self.journal = journal
+        self.review = review
+        self.stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self.totals = {'succeeded': 0, 'failed': 0, 'errors': 0}
+
+    def stop(self):
+        self.stop_event.set()
+        self._resume_event.set()
+
+    def pause(self):
+        self._resume_event.clear()
+
+    def resume(self):
+        self._resume_event.set()
+
+    @property
+    def stopped(self):
+        return self.stop_event.is_set()
+
+    @property
+    def paused(self):
+        return not self._resume_event.is_set()
+
+    def emit(self, event, **fields):
+        if self.on_event:
+            try:
+                self.on_event(dict(event=event, ts=time.time(), **fields))
+            except Exception as e:
+                print(f"⚠️ Campaign event handler error: {e}")
+
+    def log(self, message, is_error=False, **fields):
+        self.emit('log', message=message, level='error' if is_error else 'info', **fields)
+
+    def wait(self, seconds):
+        """Sleep between actions; returns False once stopped"""
+        return not self.stop_event.wait(seconds)
+
+    def checkpoint(self):
+        """Block while paused; returns False once stopped"""
+        while not self._resume_event.wait(1):
+            pass
+        return not self.stopped
+
+    def _interval(self, job):
+        low = int(job.get('min_interval', self.campaign.get('min_interval', DEFAULT_MIN_INTERVAL)))
+        high = int(job.get('max_interval', self.campaign.get('max_interval', DEFAULT_MAX_INTERVAL)))
+        return random.randint(min(low, high), max(low, high))
+
+    def run(self):
+        """Run every job in order; returns the summary also sent as 'campaign_finished'"""
+        name = self.campaign.get('name', 'campaign')
+        jobs = self.campaign['jobs']
+        self.emit('campaign_started', campaign=name, jobs=len(jobs))
+        for index, job in enumerate(jobs):
+            if not self.checkpoint():
+                break
+            self.run_job(job, index=index)
+        summary = dict(self.totals, campaign=name, stopped=self.stopped)
+        self.emit('campaign_finished', **summary)
+        return summary
+
+    def run_job(self, job, index=0):
+        """Run a single job; returns its (succeeded, failed) counts"""
+        action = job['action']
+        job_name = job.get('name', f"{action}-{index + 1}")
+        try:
+            accounts = resolve_accounts(job.get('accounts', self.campaign.get('accounts')), self.repository)
+        except ValueError as e:
+            self.totals['errors'] += 1
+            self.log(f"❌ {e}", is_error=True, job=job_name)
+            self.emit('job_finished', job=job_name, action=action, succeeded=0, failed=0, error=str(e))
+            return 0, 0
+        if not accounts:
+            self.log("❌ No accounts matched this job", is_error=True, job=job_name)
+
+        counts = {'succeeded': 0, 'failed': 0}
+        self.emit('job_started', job=job_name, action=action, accounts=[acc.label for acc in accounts])
+        try:
+            handler = getattr(self, f'_run_{action}')
+            handler(job, job_name, accounts, counts)
+        except Exception as e:
+            self.totals['errors'] += 1
+            self.log(f"❌ Error in {action} job: {e}", is_error=True, job=job_name)
+        self.emit('job_finished', job=job_name, action=action, **counts)
+        return counts['succeeded'], counts['failed']
+
+    def _record(self, job_name, action, acc, target, result, counts, started=None):
+        success, message = _as_result(result)
+        key = 'succeeded' if success else 'failed'
+        counts[key] += 1
+        self.totals[key] += 1
+        duration_ms = round((time.monotonic() - started) * 1000) if started is not None else None
+        log_to_file('campaign', f"{'✅' if success else '❌'} {message or action}",
+                    account=acc.label, action=action, job=job_name, target=target, success=success,
+                    duration_ms=duration_ms)
+        self.emit('action', job=job_name, action=action, account=acc.label, target=target,
+                  success=success, message=message)
+        return success
+
+    def _progress(self, job_name, done, total, counts):
+        self.emit('progress', job=job_name, done=done, total=total, **counts)
+
+    def _pending(self, job_name, accounts, target):
+        """Accounts whose action on target the journal doesn't show as done"""
+        if not self.journal:
+            return accounts
+        item = f"{job_name}:{target}"
+        return [acc for acc in accounts if not self.journal.is_handled(item, acc.label)]
+
+    def _journal_queue(self, job_name, name, build):
+        """A work list saved in the journal, built by build() only the first time"""
+        key = f"{job_name}:{name}"
+        if self.journal and self.journal.queue(key) is not None:
+            items = self.journal.queue(key)
+            self.log(f"♻️ Resuming with {len(items)} saved {name}", job=job_name)
+            return items
+        items = build()
+        if self.journal:
+            self.journal.set_queue(key, items)
+        return items
+
+    def _for_each_account(self, job, job_name, action, accounts, target, counts, perform, prepare=None):
+        """Run perform(acc) for each account with the job's interval in between.
+
+        prepare(acc), if given, runs first for work that changes nothing on X
+        (generating a reply); it returns a failed result to skip the account.
+        """
+        item = f"{job_name}:{target}"
+        pending = self._pending(job_name, accounts, target)
+        if len(pending) < len(accounts):
+            self.log(f"⏭️ Skipping {len(accounts) - len(pending)} account(s) already done for {target}", job=job_name)
+        for position, acc in enumerate(pending):
+            if not self.checkpoint():
+                return
+            started = time.monotonic()
+            try:
+                with profile_tags(account=acc.label, action=action), \
+                        span('campaign.account', job=job_name, action=action, account=acc.label, target=target):
+                    result = prepare(acc) if prepare else None
+                    if result is None:
+                        if self.journal:
+                            self.journal.record_attempt(item, acc.label)
+                        result = perform(acc)
+            except Exception as e:
+                result = (False, str(e))
+            success = self._record(job_name, action, acc, target, result, counts, started)
+            if self.journal:
+                self.journal.record_outcome(item, acc.label, success, _as_result(result)[1])
+            if position < len(pending) - 1:
+                wait_time = self._interval(job)
+                if not wait_time:
+                    continue
+                self.log(f"⏱️ Waiting {wait_time} seconds before next account...", job=job_name)
+                if not self.wait(wait_time):
+                    return
+
+    def _run_reply(self, job, job_name, accounts, counts):
+        from selenium_manager import reply_to_tweet
+        tweets = job.get('tweets', [])
+        text = job['text']
+        for position, tweet_url in enumerate(tweets):
+            if not self.checkpoint():
+                return
+            if not self._pending(job_name, accounts, tweet_url):
+                continue
+            self.log(f"📝 Processing tweet {position + 1}/{len(tweets)}: {tweet_url}", job=job_name)
+            self._for_each_account(job, job_name, 'reply', accounts, tweet_url, counts,
+                                   lambda acc: reply_to_tweet(acc, tweet_url, text))
+            self._progress(job_name, position + 1, len(tweets), counts)
+            if position < len(tweets) - 1 and not self.wait(self._interval(job)):
+                return
+
+    def _run_reply_comments(self, job, job_name, accounts, counts):
+        """Reply to the first 'comments' replies under each tweet with every account"""
+        from selenium_manager import reply_to_comment
+        if not accounts:
+            return
+        tweets = job.get('tweets', [])
+        text = job['text']
+        max_comments = int(job.get('comments', 5))
+        log = lambda message: self.log(message, job=job_name)
+        for position, tweet_url in enumerate(tweets):
+            if not self.checkpoint():
+                return
+            self.log(f"📝 Processing tweet {position + 1}/{len(tweets)}: {tweet_url}", job=job_name)
+            comments = [tuple(comment) for comment in self._journal_queue(
+                job_name, f"comments {tweet_url}", lambda: scrape_tweet_comments(accounts[0], tweet_url, max_comments, log=log))]
+            if not comments:
+                self.log(f"❌ No comments found for {tweet_url}", job=job_name)
+            for index, (username, comment_text) in enumerate(comments):
+                target = f"{tweet_url} @{username}"
+                if not self._pending(job_name, accounts, target):
+                    continue
+                if not self.checkpoint():
+                    return
+                self.log(f"💬 Replying to comment {index + 1}/{len(comments)}: @{username}", job=job_name)
+                self._for_each_account(job, job_name, 'reply_comment', accounts, target, counts,
+                                       lambda acc: reply_to_comment(acc, tweet_url, username, text))
+                if index < len(comments) - 1 and not self.wait(self._interval(job)):
+                    return
+            self._progress(job_name, position + 1, len(tweets), counts)
+            if position < len(tweets) - 1 and not self.wait(self._interval(job)):
+                return
+
+    def _run_like_retweet(self, job, job_name, accounts, counts):
+        from selenium_manager import like_and_retweet
+        tweets = job.get('tweets', [])
+        like = job.get('like', True)
+        retweet = job.get('retweet', True)
+
+        retweet_indexes = set(range(len(tweets)))
+        if retweet and job.get('random_retweet') and tweets:
+            count = max(1, int(len(tweets) * RANDOM_RETWEET_SHARE))
+            # Saved so a resumed run retweets the same tweets it picked the first time
+            retweet_indexes = set(self._journal_queue(job_name, 'retweet picks',
+                                                      lambda: random.sample(range(len(tweets)), count)))
+            self.log(f"🎲 Random retweet enabled: Will retweet {count} out of {len(tweets)} tweets", job=job_name)
+
+        for position, tweet_url in enumerate(tweets):
+            if not self.checkpoint():
+                return
+            if not self._pending(job_name, accounts, tweet_url):
+                continue
+            self._progress(job_name, position, len(tweets), counts)
+            should_retweet = retweet and position in retweet_indexes
+            self.log(f"📝 Processing tweet {position + 1}/{len(tweets)}: {tweet_url}", job=job_name)
+            self._for_each_account(job, job_name, 'like_retweet', accounts, tweet_url, counts,
+                                   lambda acc: like_and_retweet(acc, tweet_url, like=like, retweet=should_retweet))
+            if position < len(tweets) - 1:
+                wait_time = self._interval(job)
+                self.log(f"⏱️ Waiting {wait_time} seconds before next tweet...", job=job_name)
+                if not self.wait(wait_time):
+                    return
+        self._progress(job_name, len(tweets), len(tweets), counts)
+
+    def _run_dm(self, job, job_name, accounts, counts):
+        from selenium_manager import send_dm
+        recipient = job['recipient'].lstrip('@')
+        message = job['message']
+        self._for_each_account(job, job_name, 'dm', accounts, recipient, counts,
+                               lambda acc: send_dm(acc, recipient, message))
+        self._progress(job_name, 1, 1, counts)
+
+    def _run_bio(self, job, job_name, accounts, counts):
+        from selenium_manager import change_bio
+        bio = job['bio']
+        self._for_each_account(job, job_name, 'bio', accounts, 'bio', counts,
+                               lambda acc: change_bio(acc, bio))
+        self._progress(job_name, 1, 1, counts)
+
+    def _run_yapping(self, job, job_name, accounts, counts):
+        """Search, then reply to each found tweet with an AI reply per account"""
+        from selenium_manager import (reply_to_tweet, check_tweet_accessibility, get_global_driver_manager,
+                                      scrape_tweet_content_and_comments)
+        from ai_integration import create_ai_integration
+        if not accounts:
+            return
+        prompt = job.get('prompt') or None
+        min_chars = int(job.get('min_chars', 50))
+        max_chars = int(job.get('max_chars', 280))
+        ai_provider = create_ai_integration().provider
+        if not ai_provider or not ai_provider.is_configured:
+            self.log("❌ No AI provider configured", is_error=True, job=job_name)
+            return
+
+        log = lambda message: self.log(message, job=job_name)
+        scraping_account = accounts[0]
+        search_url = job.get('search_url') or build_search_url(job['query'])
+        tweets = self._journal_queue(job_name, 'tweets', lambda: search_tweet_urls(
+            scraping_account, search_url, int(job.get('max_tweets', 10)), log=log))
+        if not tweets:
+            self.log("❌ No tweets found for the search query.", is_error=True, job=job_name)
+        # Tweets replied to by earlier runs
+        exclude = set(job.get('exclude_tweets', []))
+
+        for position, tweet_url in enumerate(tweets):
+            if not self.checkpoint():
+                return
+            if tweet_url in exclude:
+                self.log(f"⏭️ Skipping already replied tweet: {tweet_url}", job=job_name)
+                continue
+            pending = self._pending(job_name, accounts, tweet_url)
+            if not pending:
+                continue
+            self.log(f"📝 Processing tweet {position + 1}/{len(tweets)}: {tweet_url}", job=job_name)
+            with get_global_driver_manager().lease(scraping_account.label, 'reader'):
+                driver = get_global_driver_manager().get_reader_driver(scraping_account)
+                if not driver:
+                    self.log(f"❌ Failed to get driver for {scraping_account.label}", job=job_name)
+                    continue
+                accessible, reason = check_tweet_accessibility(driver, tweet_url)
+                if not accessible:
+                    self.log(f"❌ Tweet is not accessible: {tweet_url} ({reason})", job=job_name)
+                    continue
+                # The accessibility check has just loaded the tweet
+                content, comments = scrape_tweet_content_and_comments(driver, tweet_url, navigate=False)
+            # Same threshold as scrape_tweet_content_and_comments_with_account
+            if len(content.strip()) <= 10:
+                self.log(f"❌ Failed to scrape tweet content: {tweet_url}", job=job_name)
+                continue
+
+            context = content[:500]
+            if comments:
+                context += "\n\n--- Comments Context ---\n" + ''.join(
+                    f"Comment {i + 1}: {comment}\n" for i, comment in enumerate(comments[:5]))
+
+            item = f"{job_name}:{tweet_url}"
+            replies = {}
+
+            def prepare(acc):
+                reply = self.journal.reply_for(item, acc.label) if self.journal else None
+                if not reply:
+                    reply = generate_unique_reply(ai_provider, context, prompt, acc.label, min_chars, max_chars)
+                    if not reply:
+                        return False, "Could not generate a reply"
+                    if self.journal:
+                        self.journal.save_reply(item, acc.label, reply)
+                replies[acc.label] = reply
+                return None
+
+            if self.review:
+                # Every reply is generated up front so they can be reviewed together
+                for acc in pending:
+                    with profile_tags(account=acc.label, action='yapping'):
+                        failed = prepare(acc)
+                    if failed:
+                        self._record(job_name, 'yapping', acc, tweet_url, failed, counts)
+                        if self.journal:
+                            self.journal.record_outcome(item, acc.label, False, failed[1])
+                reviewed = self.review(tweet_url, content, comments, dict(replies)) if replies else None
+                if reviewed is None:
+                    if replies:
+                        self.log(f"⏭️ Skipped tweet in review: {tweet_url}", job=job_name)
+                    self._progress(job_name, position + 1, len(tweets), counts)
+                    continue
+                replies = {label: text for label, text in reviewed.items() if text.strip()}
+                if self.journal:
+                    for label, text in replies.items():
+                        self.journal.save_reply(item, label, text)
+                pending = [acc for acc in pending if acc.label in replies]
+
+            self._for_each_account(job, job_name, 'yapping', pending, tweet_url, counts,
+                                   lambda acc: reply_to_tweet(acc, tweet_url, replies[acc.label]),
+                                   prepare=None if self.review else prepare)
+            self._progress(job_name, position + 1, len(tweets), counts)
+            if position < len(tweets) - 1 and not self.wait(self._interval(job)):
+                return
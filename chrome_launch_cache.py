@@ -0,0 +1,237 @@
+import os
+import re
+import sys
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from constants import DRIVER_CACHE_DIR
+
+# Where Chrome usually lives, checked in order after $CHROME_PATH
+WINDOWS_CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv('USERNAME')),
+]
+MAC_CHROME_PATHS = [
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",
+]
+LINUX_CHROME_PATHS = [
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+    "/opt/google/chrome/chrome",
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/snap/bin/chromium",
+]
+LINUX_CHROME_COMMANDS = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+# Ordered launch phases shown in the per-launch breakdown
+LAUNCH_PHASES = ['chrome_detect', 'extensions', 'driver_patch', 'process_spawn', 'first_page', 'cookie_restore']
+
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+class LaunchProfile:
+    """Per-launch timing breakdown for one browser start"""
+
+    def __init__(self, label):
+        self.label = label
+        self.started_at = time.time()
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """Time a launch phase (repeated phases accumulate)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start)
+
+    @property
+    def total(self):
+        return sum(self.phases.values())
+
+    def summary(self):
+        ordered = [p for p in LAUNCH_PHASES if p in self.phases]
+        ordered += [p for p in self.phases if p not in LAUNCH_PHASES]
+        parts = [f"{name}={self.phases[name]:.2f}s" for name in ordered]
+        return f"{self.label}: total={self.total:.2f}s ({', '.join(parts)})"
+
+    def to_dict(self):
+        return {
+            'label': self.label,
+            'started_at': self.started_at,
+            'total': self.total,
+            'phases': dict(self.phases)
+        }
+
+
+class ChromeLaunchCache:
+    """Process-wide cache of everything a browser launch can reuse.
+
+    Detects the installed Chrome once, patches chromedriver once per Chrome
+    major version into a shared cache directory, remembers which profiles
+    already had their extensions verified, and keeps recent launch profiles.
+    """
+
+    def __init__(self, cache_dir=DRIVER_CACHE_DIR, max_profiles=200):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._chrome_detected = False
+        self._chrome_executable = None
+        self._chrome_version = None
+        self._patched_drivers = {}  # Chrome major version -> patched chromedriver path
+        self._checked_extension_profiles = set()
+        self.launch_profiles = deque(maxlen=max_profiles)
+
+    def get_chrome_executable(self):
+        """Find the installed Chrome executable (detected once per process)"""
+        with self._lock:
+            if not self._chrome_detected:
+                self._chrome_executable = self._detect_chrome_executable()
+                self._chrome_version = self._detect_chrome_version(self._chrome_executable)
+                self._chrome_detected = True
+                if self._chrome_executable:
+                    print(f"🔍 Found system Chrome at: {self._chrome_executable} (version {self._chrome_version or 'unknown'})")
+            return self._chrome_executable
+
+    def get_chrome_version(self):
+        """Installed Chrome version string, e.g. '120.0.6099.109', or None"""
+        self.get_chrome_executable()
+        return self._chrome_version
+
+    def get_chrome_major(self):
+        """Installed Chrome major version, or None when it can't be determined"""
+        version = self.get_chrome_version()
+        if not version:
+            return None
+        return int(version.split('.')[0])
+
+    def _detect_chrome_executable(self):
+        env_path = os.getenv('CHROME_PATH')
+        if env_path and os.path.exists(env_path):
+            return env_path
+
+        if sys.platform.startswith('win'):
+            candidates = WINDOWS_CHROME_PATHS
+        elif sys.platform == 'darwin':
+            candidates = MAC_CHROME_PATHS
+        else:
+            candidates = LINUX_CHROME_PATHS
+
+        for path in candidates:
+            if os.path.exists(path):
+                return path
+
+        if not sys.platform.startswith('win'):
+            for command in LINUX_CHROME_COMMANDS:
+                path = shutil.which(command)
+                if path:
+                    return path
+        return None
+
+    def _detect_chrome_version(self, chrome_executable):
+        if not chrome_executable:
+            return None
+        try:
+            if sys.platform.startswith('win'):
+                # chrome.exe --version prints nothing on Windows; the install
+                # directory contains a folder named after the version instead
+                app_dir = os.path.dirname(chrome_executable)
+                versions = [d for d in os.listdir(app_dir) if _VERSION_RE.fullmatch(d)]
+                if versions:
+                    return max(versions, key=lambda v: tuple(int(p) for p in v.split('.')))
+                return None
+
+            output = subprocess.run(
+                [chrome_executable, '--version'],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+            match = _VERSION_RE.search(output)
+            return match.group(0) if match else None
+        except Exception as e:
+            print(f"⚠️ Could not determine Chrome version: {e}")
+            return None
+
+    def get_patched_driver(self):
+        """Path to a chromedriver patched for the installed Chrome.
+
+        The binary is downloaded and patched by undetected-chromedriver once
+        per Chrome major version, then reused by every account. Returns None
+        when the version is unknown or patching fails, in which case
+        undetected-chromedriver falls back to patching on its own.
+        """
+        version_main = self.get_chrome_major()
+        if not version_main:
+            return None
+
+        with self._lock:
+            cached = self._patched_drivers.get(version_main)
+            if cached and os.path.exists(cached):
+                return cached
+
+            exe_name = 'chromedriver.exe' if sys.platform.startswith('win') else 'chromedriver'
+            target_dir = os.path.abspath(os.path.join(self.cache_dir, str(version_main)))
+            target = os.path.join(target_dir, exe_name)
+
+            if not os.path.exists(target):
+                try:
+                    import undetected_chromedriver as uc
+                    print(f"🔧 Patching chromedriver for Chrome {version_main} (one-time)")
+                    os.makedirs(target_dir, exist_ok=True)
+                    patcher = uc.Patcher(version_main=version_main)
+                    patcher.auto()
+                    shutil.copy2(patcher.executable_path, target)
+                except Exception as e:
+                    print(f"⚠️ Could not cache patched chromedriver: {e}")
+                    return None
+
+            self._patched_drivers[version_main] = target
+            return target
+
+    def extensions_checked(self, profile_dir):
+        """Whether this profile's extensions were already verified in this process"""
+        with self._lock:
+            return os.path.abspath(profile_dir) in self._checked_extension_profiles
+
+    def mark_extensions_checked(self, profile_dir):
+        with self._lock:
+            self._checked_extension_profiles.add(os.path.abspath(profile_dir))
+
+    def record_launch(self, profile):
+        """Store a finished launch profile and print its breakdown"""
+        with self._lock:
+            self.launch_profiles.append(profile)
+        print(f"⏱️ Browser launch {profile.summary()}")
+
+    def get_launch_profiles(self):
+        with self._lock:
+            return list(self.launch_profiles)
+
+    def average_phase_times(self):
+        """Average seconds spent per phase across the recorded launches"""
+        profiles = self.get_launch_profiles()
+        totals = {}
+        counts = {}
+        for profile in profiles:
+            for name, seconds in profile.phases.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+                counts[name] = counts.get(name, 0) + 1
+        return {name: totals[name] / counts[name] for name in totals}
+
+
+_launch_cache = None
+_launch_cache_lock = threading.Lock()
+
+def get_launch_cache():
+    """Get or create the process-wide launch cache"""
+    global _launch_cache
+    with _launch_cache_lock:
+        if _launch_cache is None:
+            _launch_cache = ChromeLaunchCache()
+        return _launch_cache
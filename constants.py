@@ -1,4 +1,6 @@
 # Color palette and file paths for the Twitter Selenium GUI
+import os
+
 COLOR_DARK = '#151515'
 COLOR_PURPLE = '#301B3F'
 COLOR_BLUEGRAY = '#3C415C'
@@ -6,4 +8,14 @@ COLOR_TAUPE = '#B4A5A5'
 COLOR_WHITE = '#FFFFFF'
 
 COOKIE_DIR = 'cookies'
-ACCOUNTS_FILE = 'accounts.json' 
\ No newline at end of file
+ACCOUNTS_FILE = 'accounts.json'
+ACCOUNTS_DB = 'accounts.db'
+HISTORY_DB = 'history.db'
+DRIVER_CACHE_DIR = 'driver_cache'
+AVATAR_DIR = 'avatars'
+BROWSER_SESSIONS_FILE = 'browser_sessions.json'
+SETTINGS_FILE = 'settings_state.json'
+SCHEDULE_FILE = 'scheduled_jobs.json'
+
+# Where X is reached; XAUTO_X_BASE_URL points automation at another host (the benchmark mock site)
+X_BASE_URL = os.getenv('XAUTO_X_BASE_URL', 'https://x.com').rstrip('/')
\ No newline at end of file
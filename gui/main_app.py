@@ -1,46 +1,145 @@
+import time
+# Taken before the other imports so the startup report includes them
+STARTUP_STARTED_AT = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
-from account_manager import load_accounts, SeleniumAccount
-from gui.panels.dashboard_panel import DashboardPanel
-from gui.panels.reply_panel import ReplyPanel
-from gui.panels.dm_panel import DmPanel
-from gui.panels.bio_panel import BioPanel
-from gui.panels.profile_pic_panel import ProfilePicPanel
-from gui.panels.accounts_panel import AccountsPanel
-from gui.panels.yapping_panel import YappingPanel
-from gui.panels.ai_settings_panel import AISettingsPanel
-from gui.panels.settings_panel import SettingsPanel
-from gui.panels.scheduled_tasks_panel import ScheduledTasksPanel
-from gui.panels.history_panel import HistoryPanel
-from gui.panels.reply_comment_panel import ReplyCommentPanel
-from gui.panels.like_retweet_panel import LikeRetweetPanel
-from selenium_manager import get_global_driver_manager, cleanup_chrome_profile_cache
+import sys
+import importlib
+import threading
+from account_manager import get_account_repository
+from profile_maintenance import get_profile_maintenance
+from account_health import get_health_checker
+from avatar_cache import get_avatar_cache
+from log_bus import get_log_bus
+from ui_events import get_ui_events
+from ui_watchdog import get_ui_watchdog
+from utils import load_settings
+
+# Sidebar panels: (key, menu label, module, class, takes the account list).
+# Panel modules pull in selenium, openai and friends, so each one is only
+# imported and constructed on its first visit (or by the warm-up thread).
+PANEL_REGISTRY = [
+    ('dashboard', 'Dashboard', 'gui.panels.dashboard_panel', 'DashboardPanel', False),
+    ('reply', 'Reply to Tweet', 'gui.panels.reply_panel', 'ReplyPanel', True),
+    ('reply_comment', 'Reply to Comment', 'gui.panels.reply_comment_panel', 'ReplyCommentPanel', True),
+    ('like_retweet', 'Like and Retweet', 'gui.panels.like_retweet_panel', 'LikeRetweetPanel', True),
+    ('dm', 'Send DM', 'gui.panels.dm_panel', 'DmPanel', True),
+    ('bio', 'Change Bio', 'gui.panels.bio_panel', 'BioPanel', True),
+    ('profile_pic', 'Change Profile Pic', 'gui.panels.profile_pic_panel', 'ProfilePicPanel', True),
+    ('yapping', '🤖 Yapping', 'gui.panels.yapping_panel', 'YappingPanel', True),
+    ('ai_settings', '🤖 AI Settings', 'gui.panels.ai_settings_panel', 'AISettingsPanel', False),
+    ('accounts', 'Accounts', 'gui.panels.accounts_panel', 'AccountsPanel', True),
+    ('settings', 'Settings', 'gui.panels.settings_panel', 'SettingsPanel', False),
+    ('scheduled_tasks', 'Scheduled Tasks', 'gui.panels.scheduled_tasks_panel', 'ScheduledTasksPanel', False),
+    ('history', 'History', 'gui.panels.history_panel', 'HistoryPanel', False),
+]
+
+# Imported by the warm-up thread once the window is up, before the panels
+WARMUP_MODULES = ['selenium_manager', 'ai_integration']
 
 class TwitterSeleniumGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("P_Tweet_Desk - X (Twitter) Browser Automation GUI")
-        self.accounts = load_accounts()
-        self.panels = {}
+        self.startup_marks = [('imports and Tk', time.perf_counter())]
+        # One shared, indexed account list for every panel
+        self.account_repository = get_account_repository()
+        self.accounts = self.account_repository.accounts
+        self.account_repository.start_watching()
+        self.startup_marks.append(('accounts', time.perf_counter()))
+        self.panels = {}  # only panels that have been visited
         self.current_panel = None
         
-        # Clean up existing Chrome profiles at startup
-        self._cleanup_existing_profiles()
-        
         self._setup_gui()
+        self.startup_marks.append(('window', time.perf_counter()))
+        
+        # Panel logs are written from worker threads and drained here in batches
+        get_log_bus().start(self.root)
+        get_ui_events().start(self.root)
+        
+        # Catch and attribute stalls of the Tk event loop
+        get_ui_watchdog().start(self.root)
+        
+        # Report startup time and warm up heavy imports once the first frame is drawn
+        self.root.after_idle(self._on_first_frame)
+        
+        # Prune Chrome profile caches in the background once the window is up
+        self.root.after(1000, self._start_profile_maintenance)
+        
+        # Reconnect to browsers left running by the previous run
+        self.root.after(1500, self._start_session_reattach)
+        
+        # Start running scheduled jobs (catching up on any missed while closed)
+        self.root.after(2000, self._start_scheduler)
         
         # Set up proper cleanup on window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-    def _cleanup_existing_profiles(self):
-        """Clean up existing Chrome profiles with multiple cache directories"""
-        try:
-            print("🧹 Cleaning up existing Chrome profiles...")
-            for acc in self.accounts:
-                cleanup_chrome_profile_cache(acc)
-            print("✅ Chrome profile cleanup completed")
-        except Exception as e:
-            print(f"⚠️ Error during profile cleanup: {e}")
+    def _on_first_frame(self):
+        self.startup_marks.append(('first frame', time.perf_counter()))
+        self._report_startup()
+        threading.Thread(target=self._warm_up, name='warm-up', daemon=True).start()
+
+    def _report_startup(self):
+        """Print how long each startup phase took"""
+        previous = STARTUP_STARTED_AT
+        phases = []
+        for name, mark in self.startup_marks:
+            phases.append(f"{name} {(mark - previous) * 1000:.0f}ms")
+            previous = mark
+        total = (self.startup_marks[-1][1] - STARTUP_STARTED_AT) * 1000
+        print(f"⏱️ Startup: {total:.0f}ms to first frame ({', '.join(phases)})")
+
+    def _warm_up(self):
+        """Import the heavy modules in the background so first visits are quick"""
+        started = time.perf_counter()
+        modules = WARMUP_MODULES + [entry[2] for entry in PANEL_REGISTRY]
+        for module_name in modules:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"⚠️ Warm-up import of {module_name} failed: {e}")
+        print(f"⏱️ Warm-up imports finished in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    def _start_profile_maintenance(self):
+        """Start the background Chrome profile cache maintenance"""
+        def worker():
+            try:
+                # Importing selenium here keeps it off the Tk thread
+                from selenium_manager import get_global_driver_manager
+                # Registers which profiles are in use before the first prune
+                get_global_driver_manager()
+                get_profile_maintenance().start()
+                from resource_monitor import get_resource_monitor
+                get_resource_monitor().start()
+                from run_journal import prune_runs
+                prune_runs()
+            except Exception as e:
+                print(f"⚠️ Error starting profile maintenance: {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _start_session_reattach(self):
+        """Reattach to live browser sessions in the background"""
+        def worker():
+            try:
+                from selenium_manager import get_global_driver_manager
+                count = get_global_driver_manager().reattach_sessions()
+                if count:
+                    print(f"🔗 Reattached {count} running browser session(s)")
+            except Exception as e:
+                print(f"⚠️ Error reattaching browser sessions: {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _start_scheduler(self):
+        """Start the persistent job scheduler in the background"""
+        def worker():
+            try:
+                from scheduler import get_scheduler
+                get_scheduler().start()
+            except Exception as e:
+                print(f"⚠️ Error starting job scheduler: {e}")
+        threading.Thread(target=worker, daemon=True).start()
 
     def _setup_gui(self):
         self.root.geometry('1000x650')
@@ -50,19 +149,8 @@ class TwitterSeleniumGUI:
         self.sidebar.pack(side='left', fill='y')
         self.sidebar.pack_propagate(False)
         self.menu_items = [
-            ('Dashboard', self.show_dashboard),
-            ('Reply to Tweet', self.show_reply),
-            ('Reply to Comment', self.show_reply_comment),
-            ('Like and Retweet', self.show_like_retweet),
-            ('Send DM', self.show_dm),
-            ('Change Bio', self.show_bio),
-            ('Change Profile Pic', self.show_profile_pic),
-            ('🤖 Yapping', self.show_yapping),
-            ('🤖 AI Settings', self.show_ai_settings),
-            ('Accounts', self.show_accounts),
-            ('Settings', self.show_settings),
-            ('Scheduled Tasks', self.show_scheduled_tasks),
-            ('History', self.show_history)
+            (label, lambda key=key: self._show_panel(key))
+            for key, label, _, _, _ in PANEL_REGISTRY
         ]
         self.menu_buttons = []
         for idx, (label, cmd) in enumerate(self.menu_items):
@@ -72,28 +160,27 @@ class TwitterSeleniumGUI:
         # Main content area
         self.content = ttk.Frame(self.root)
         self.content.pack(side='left', fill='both', expand=True)
-        # Initialize panels
-        self.panels['dashboard'] = DashboardPanel(self.content)
-        self.panels['reply'] = ReplyPanel(self.content, self.accounts)
-        self.panels['reply_comment'] = ReplyCommentPanel(self.content, self.accounts)
-        self.panels['like_retweet'] = LikeRetweetPanel(self.content, self.accounts)
-        self.panels['dm'] = DmPanel(self.content, self.accounts)
-        self.panels['bio'] = BioPanel(self.content, self.accounts)
-        self.panels['profile_pic'] = ProfilePicPanel(self.content, self.accounts)
-        self.panels['yapping'] = YappingPanel(self.content, self.accounts)
-        self.panels['ai_settings'] = AISettingsPanel(self.content)
-        self.panels['accounts'] = AccountsPanel(self.content, self.accounts)
-        self.panels['settings'] = SettingsPanel(self.content)
-        self.panels['scheduled_tasks'] = ScheduledTasksPanel(self.content)
-        self.panels['history'] = HistoryPanel(self.content)
-        # Show dashboard by default
+        # Show dashboard by default; other panels are built on first visit
         self.show_dashboard()
 
+    def get_panel(self, key):
+        """The panel for this key, importing and constructing it on first use"""
+        panel = self.panels.get(key)
+        if panel is None:
+            started = time.perf_counter()
+            _, label, module_name, class_name, takes_accounts = next(
+                entry for entry in PANEL_REGISTRY if entry[0] == key)
+            panel_class = getattr(importlib.import_module(module_name), class_name)
+            panel = panel_class(self.content, self.accounts) if takes_accounts else panel_class(self.content)
+            self.panels[key] = panel
+            print(f"⏱️ Loaded {label} panel in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return panel
+
     def _show_panel(self, key):
         if self.current_panel:
             self.current_panel.pack_forget()
         
-        panel = self.panels[key]
+        panel = self.get_panel(key)
         # Check if the panel has a build_panel method and hasn't been built yet
         if hasattr(panel, 'build_panel') and not hasattr(panel, '_built'):
             panel.build_panel()
@@ -134,11 +221,36 @@ class TwitterSeleniumGUI:
 
     def on_closing(self):
         """Clean up resources before closing"""
+        get_profile_maintenance().stop()
+        get_health_checker().shutdown()
+        get_avatar_cache().shutdown()
+        get_ui_watchdog().stop()
+        
+        # Stop dispatching scheduled jobs; the queue is already on disk
+        scheduler_module = sys.modules.get('scheduler')
+        if scheduler_module:
+            scheduler_module.get_scheduler().stop()
+        resource_monitor_module = sys.modules.get('resource_monitor')
+        if resource_monitor_module:
+            resource_monitor_module.get_resource_monitor().stop()
+        
+        # Stop waiting on any account logins still in the queue
+        onboarding_queue = getattr(self.panels.get('accounts'), 'onboarding_queue', None)
+        if onboarding_queue:
+            onboarding_queue.shutdown()
+        self.account_repository.stop_watching()
+        
         try:
             # Close the global driver manager (this will save cookies for all accounts)
+            from selenium_manager import get_global_driver_manager
             driver_manager = get_global_driver_manager()
-            driver_manager.close_driver()
-            print("✅ Browser drivers closed and cookies saved successfully")
+            if load_settings().get('keep_browsers_open', False):
+                # Browsers keep running and are reattached on the next start
+                driver_manager.detach_all_drivers()
+                print("✅ Cookies saved, browsers left running for the next start")
+            else:
+                driver_manager.close_driver()
+                print("✅ Browser drivers closed and cookies saved successfully")
         except Exception as e:
             print(f"⚠️ Error closing browser drivers: {e}")
         
@@ -1,30 +1,41 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
-from account_manager import SeleniumAccount, save_accounts
-from selenium_manager import open_browser_with_profile, get_account_status_and_avatar
+from account_manager import SeleniumAccount, get_account_repository
+from selenium_manager import open_browser_with_profile
+from account_health import get_health_checker
+from avatar_cache import get_avatar_cache
+from log_bus import get_log_bus
+from ui_events import get_ui_events
 import shutil
 import os
 import threading
 import requests
-import csv
-import time
-import pickle
-import json
+
+ACCOUNT_COLUMNS = ('label', 'username', 'status', 'tags', 'proxy', 'browser')
+ACCOUNT_HEADINGS = ('Label', 'Username', 'Status', 'Tags', 'Proxy', 'Browser')
+ACCOUNT_COLUMN_WIDTHS = (120, 140, 80, 160, 180, 80)
 
 class AccountsPanel(ttk.Frame):
     def __init__(self, parent, accounts):
         super().__init__(parent)
         self.parent = parent
         self.accounts = accounts
+        self.repository = get_account_repository()
         self.log_text = None
-        self.status_labels = {}  # Map acc.label to status label widget
+        self.log_channel = get_log_bus().channel('accounts')
+        self.ui_events = get_ui_events()
+        self.accounts_tree = None
+        self._row_accounts = {}  # Treeview item id -> account
+        self._sort_keys = {}     # Treeview item id -> {column: sort key}
+        self._row_images = {}    # Treeview item id -> avatar PhotoImage shown in that row
+        self._sort_column = None
+        self._sort_reverse = False
         self.selected_tag = tk.StringVar(value='All')
         self.tag_filter_dropdown = None
         # State persistence
         self.state = {
-            'selected_tag': 'All',
-            'log_messages': []
+            'selected_tag': 'All'
         }
 
     def build_panel(self):
@@ -53,26 +64,69 @@ class AccountsPanel(ttk.Frame):
         self.setup_proxies_btn = ttk.Button(controls_frame, text="Setup Proxies", command=self.setup_proxy_plugins)
         self.setup_proxies_btn.pack(side='left', padx=5)
         
-        # Create table frame
+        # Filter bar: tag filter and free-text search
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(fill='x', padx=10, pady=(5, 0))
+        
+        ttk.Label(filter_frame, text="Tag:").pack(side='left')
+        self.tag_filter_dropdown = ttk.Combobox(filter_frame, textvariable=self.selected_tag, width=15, state='readonly')
+        self.tag_filter_dropdown.pack(side='left', padx=5)
+        self.tag_filter_dropdown.bind('<<ComboboxSelected>>', self.on_tag_filter_change)
+        
+        ttk.Label(filter_frame, text="Search:").pack(side='left', padx=(10, 0))
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, width=25)
+        search_entry.pack(side='left', padx=5)
+        self.search_var.trace_add('write', lambda *args: self.refresh_accounts_table())
+        
+        self.count_label = ttk.Label(filter_frame, text="")
+        self.count_label.pack(side='right')
+        
+        # Accounts table: a Treeview only draws the visible rows, so the number
+        # of Tk widgets stays constant however many accounts there are
         self.accounts_table_frame = ttk.Frame(self)
         self.accounts_table_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        # Create table headers
-        headers = ['Label', 'Username', 'Status', 'Tags', 'Proxy', 'Browser', 'Actions']
+        self.accounts_tree = ttk.Treeview(self.accounts_table_frame, columns=ACCOUNT_COLUMNS,
+                                          show='tree headings', selectmode='extended')
+        # The tree column (#0) holds the avatar thumbnail
+        self.accounts_tree.heading('#0', text='')
+        self.accounts_tree.column('#0', width=40, stretch=False)
+        for column, heading, width in zip(ACCOUNT_COLUMNS, ACCOUNT_HEADINGS, ACCOUNT_COLUMN_WIDTHS):
+            self.accounts_tree.heading(column, text=heading, command=lambda c=column: self.sort_accounts_table(c))
+            self.accounts_tree.column(column, width=width, anchor='w')
+        self.accounts_tree.tag_configure('Active', foreground='green')
+        self.accounts_tree.tag_configure('Inactive', foreground='red')
+        
+        tree_scroll = ttk.Scrollbar(self.accounts_table_frame, orient='vertical', command=self.accounts_tree.yview)
+        self.accounts_tree.configure(yscrollcommand=tree_scroll.set)
+        self.accounts_tree.pack(side='left', fill='both', expand=True)
+        tree_scroll.pack(side='right', fill='y')
+        
+        self.accounts_tree.bind('<Double-1>', lambda e: self.edit_selected_account())
+        self.accounts_tree.bind('<Button-3>', self.show_account_context_menu)
+        self.accounts_tree.bind('<Delete>', lambda e: self.delete_selected_accounts())
         
-        for i, header in enumerate(headers):
-            header_label = ttk.Label(self.accounts_table_frame, text=header, font=('Arial', 10, 'bold'))
-            header_label.grid(row=0, column=i, padx=5, pady=5, sticky='w')
-            header_label.is_header = True # Mark headers so they don't get destroyed during refresh
+        # Row context menu (actions apply to all selected accounts)
+        self.account_menu = tk.Menu(self, tearoff=0)
+        self.account_menu.add_command(label="🌐 Open/Close Browser", command=self.toggle_selected_browsers)
+        self.account_menu.add_command(label="✏️ Edit Account", command=self.edit_selected_account)
+        self.account_menu.add_command(label="🏷️ Edit Tags", command=self.edit_selected_tags)
+        self.account_menu.add_command(label="🔧 Manage Proxy", command=self.proxy_selected_account)
+        self.account_menu.add_command(label="💾 Save Cookies", command=self.save_selected_cookies)
+        self.account_menu.add_command(label="🔍 Check Status", command=self.check_selected_accounts_status)
+        self.account_menu.add_separator()
+        self.account_menu.add_command(label="🗑️ Delete", command=self.delete_selected_accounts)
         
-        # Configure column widths for better display
-        self.accounts_table_frame.grid_columnconfigure(0, minsize=80)  # Label
-        self.accounts_table_frame.grid_columnconfigure(1, minsize=120) # Username
-        self.accounts_table_frame.grid_columnconfigure(2, minsize=80)  # Status
-        self.accounts_table_frame.grid_columnconfigure(3, minsize=120) # Tags (increased for button)
-        self.accounts_table_frame.grid_columnconfigure(4, minsize=100) # Proxy
-        self.accounts_table_frame.grid_columnconfigure(5, minsize=80)  # Browser
-        self.accounts_table_frame.grid_columnconfigure(6, minsize=120) # Actions (reduced for compact buttons)
+        # Selection actions
+        actions_frame = ttk.Frame(self)
+        actions_frame.pack(fill='x', padx=10)
+        ttk.Button(actions_frame, text="🌐 Open/Close", command=self.toggle_selected_browsers).pack(side='left', padx=2)
+        ttk.Button(actions_frame, text="✏️ Edit", command=self.edit_selected_account).pack(side='left', padx=2)
+        ttk.Button(actions_frame, text="🏷️ Tags", command=self.edit_selected_tags).pack(side='left', padx=2)
+        ttk.Button(actions_frame, text="🔧 Proxy", command=self.proxy_selected_account).pack(side='left', padx=2)
+        ttk.Button(actions_frame, text="💾 Save Cookies", command=self.save_selected_cookies).pack(side='left', padx=2)
+        ttk.Button(actions_frame, text="🗑️ Delete", command=self.delete_selected_accounts).pack(side='left', padx=2)
         
         # Populate table with accounts
         self.refresh_accounts_table()
@@ -88,169 +142,240 @@ class AccountsPanel(ttk.Frame):
         # Restore state
         self.restore_log_messages()
         
-        # Initial table population (redundant, but harmless after first call)
-        self.refresh_accounts_table()
+        # Redraw when accounts change anywhere (other panels, file edits)
+        self.repository.subscribe(self._on_accounts_changed)
         
         # Start browser polling
         self.start_browser_polling()
 
+    def _on_accounts_changed(self, event, accounts):
+        """Repository subscriber; may be called from any thread"""
+        def apply():
+            if event == 'reloaded':
+                self.refresh_accounts_table()
+                return
+            for acc in accounts:
+                if event == 'removed':
+                    self._remove_row(acc)
+                else:
+                    self._update_row(acc)
+            self._refresh_tag_choices()
+            self._update_count_label()
+        # Ordered, never merged: an 'added' must not be swallowed by a later 'removed'
+        self.ui_events.call(apply)
+
     def on_tag_filter_change(self, event=None):
         """Handle tag filter change and save state"""
         self.state['selected_tag'] = self.selected_tag.get()
         self.refresh_accounts_table()
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for message in self.state['log_messages']:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
+
+    def _row_id(self, acc):
+        return str(id(acc))
+
+    def _row_values(self, acc):
+        tags_str = ", ".join(acc.tags) if acc.tags else "None"
+        proxy_str = acc.proxy or "None"
+        if len(proxy_str) > 30:
+            proxy_str = proxy_str[:27] + "..."
+        browser = "🟢 Open" if acc.label in self.browser_drivers else "⚪ Closed"
+        return (acc.label, acc.username, acc.status or "Unknown", tags_str, proxy_str, browser)
+
+    def _matches_filter(self, acc):
+        tag = self.selected_tag.get() if self.selected_tag is not None else 'All'
+        if tag != 'All' and tag not in (acc.tags or []):
+            return False
+        search = self.search_var.get().strip().lower() if hasattr(self, 'search_var') else ''
+        if search and search not in acc.label.lower() and search not in acc.username.lower():
+            return False
+        return True
+
+    def _update_row(self, acc):
+        """Insert, update or hide a single account's row in place"""
+        if self.accounts_tree is None:
+            return
+        iid = self._row_id(acc)
+        if not self._matches_filter(acc):
+            self._remove_row(acc)
+            return
+        values = self._row_values(acc)
+        tags = (acc.status,) if acc.status in ('Active', 'Inactive') else ()
+        self._sort_keys[iid] = {column: str(value).lower() for column, value in zip(ACCOUNT_COLUMNS, values)}
+        photo = self._avatar_for(acc)
+        if photo is not None:
+            self._row_images[iid] = photo
+        image = self._row_images.get(iid, '')
+        if self.accounts_tree.exists(iid):
+            self.accounts_tree.item(iid, values=values, tags=tags, image=image)
+        else:
+            self._row_accounts[iid] = acc
+            self.accounts_tree.insert('', 'end', iid=iid, values=values, tags=tags, image=image)
+
+    def _avatar_for(self, acc):
+        """Cached avatar thumbnail; fetched in the background the first time"""
+        if not acc.avatar_url:
+            return None
+        def on_ready(url):
+            if url == acc.avatar_url:
+                self.ui_events.state((self, 'row', id(acc)), self._update_row, acc)
+        try:
+            return get_avatar_cache().get_photo(acc.avatar_url, on_ready=on_ready)
+        except Exception as e:
+            print(f"⚠️ Error loading avatar for {acc.label}: {e}")
+            return None
+
+    def _remove_row(self, acc):
+        if self.accounts_tree is None:
+            return
+        iid = self._row_id(acc)
+        self._row_accounts.pop(iid, None)
+        self._sort_keys.pop(iid, None)
+        self._row_images.pop(iid, None)
+        if self.accounts_tree.exists(iid):
+            self.accounts_tree.delete(iid)
+
+    def _refresh_tag_choices(self):
+        if self.tag_filter_dropdown is not None:
+            self.tag_filter_dropdown['values'] = ['All'] + self.repository.tags()
+
+    def _update_count_label(self):
+        if hasattr(self, 'count_label'):
+            self.count_label.config(text=f"{len(self._row_accounts)} of {len(self.accounts)} accounts")
 
     def refresh_accounts_table(self):
-        # Clear previous table rows (but keep headers)
-        for widget in self.accounts_table_frame.winfo_children():
-            if hasattr(widget, 'is_header') and widget.is_header:
-                continue  # Skip headers
-            widget.destroy()
-        
-        # Filter accounts by tag
-        if hasattr(self, 'selected_tag') and self.selected_tag is not None:
-            tag = self.selected_tag.get()
+        """Rebuild the table rows from the repository (filter via the tag index)"""
+        if self.accounts_tree is None:
+            return
+        try:
+            self.accounts_tree.delete(*self.accounts_tree.get_children())
+            self._row_accounts = {}
+            self._sort_keys = {}
+            self._row_images = {}
+            
+            tag = self.selected_tag.get() if self.selected_tag is not None else 'All'
+            for acc in self.repository.with_tag(tag):
+                self._update_row(acc)
+            
+            if self._sort_column:
+                self._apply_sort()
+            self._refresh_tag_choices()
+            self._update_count_label()
+        except Exception as e:
+            import traceback
+            print(f"❌ Error refreshing accounts table: {e}")
+            traceback.print_exc()
+
+    def sort_accounts_table(self, column):
+        """Sort by a column; clicking the same heading again reverses the order"""
+        if self._sort_column == column:
+            self._sort_reverse = not self._sort_reverse
         else:
-            tag = 'All'
-        filtered_accounts = [a for a in self.accounts if tag == 'All' or tag in a.tags]
-        
-        self.selected_accounts = {}
-        self.browser_status_labels = {}
-        self.browser_buttons = {}
-        
-        for i, acc in enumerate(filtered_accounts):
-            # Label
-            label_lbl = ttk.Label(self.accounts_table_frame, text=acc.label)
-            label_lbl.grid(row=i+1, column=0, padx=5, pady=2, sticky='w')
-            
-            # Username
-            username_lbl = ttk.Label(self.accounts_table_frame, text=acc.username)
-            username_lbl.grid(row=i+1, column=1, padx=5, pady=2, sticky='w')
-            
-            # Status
-            status_text = acc.status if acc.status else "Unknown"
-            status_fg = 'green' if acc.status == 'Active' else ('red' if acc.status == 'Inactive' else 'gray')
-            status_lbl = ttk.Label(self.accounts_table_frame, text=status_text, foreground=status_fg)
-            status_lbl.grid(row=i+1, column=2, padx=5, pady=2, sticky='w')
-            self.status_labels[acc.label] = status_lbl
-            
-            # Tags display with edit button
-            tags_frame = ttk.Frame(self.accounts_table_frame)
-            tags_frame.grid(row=i+1, column=3, padx=5, pady=2, sticky='w')
-            
-            tags_str = ", ".join(acc.tags) if acc.tags else "None"
-            tags_lbl = ttk.Label(tags_frame, text=tags_str)
-            tags_lbl.pack(side='left')
-            
-            # Tags edit button
-            def edit_tags(account):
-                self.edit_tags_dialog(account, tags_lbl)
-            
-            tags_btn = ttk.Button(tags_frame, text="✏️", width=3,
-                                command=lambda a=acc: edit_tags(a))
-            tags_btn.pack(side='right', padx=(5, 0))
-            
-            # Proxy display
-            proxy_str = acc.proxy if acc.proxy else "None"
-            proxy_lbl = ttk.Label(self.accounts_table_frame, text=proxy_str)
-            proxy_lbl.grid(row=i+1, column=4, padx=5, pady=2, sticky='w')
-            
-            # Browser Status indicator
-            status_dot = "🟢" if acc.label in self.browser_drivers else "⚪"
-            browser_status_lbl = ttk.Label(self.accounts_table_frame, text=status_dot, font=("Segoe UI", 12))
-            browser_status_lbl.grid(row=i+1, column=5, padx=5, pady=2, sticky='w')
-            self.browser_status_labels[acc.label] = browser_status_lbl
-            
-            # Actions frame (contains all action buttons) - compact layout
-            actions_frame = ttk.Frame(self.accounts_table_frame)
-            actions_frame.grid(row=i+1, column=6, padx=5, pady=2, sticky='w')
-            
-            print(f"Creating actions frame for account: {acc.label}")
-            
-            # Delete button (compact)
-            def confirm_delete(account):
-                result = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete account '{account.label}'?\n\nThis will permanently remove the account and all associated data.")
-                if result:
-                    self.delete_account(account)
-            
-            del_btn = tk.Button(actions_frame, text="🗑️", 
-                               command=lambda a=acc: confirm_delete(a),
-                               bg='#ff4444', fg='white', 
-                               font=('Arial', 8, 'bold'),
-                               relief='raised', bd=1, width=4)
-            del_btn.pack(side='left', padx=1)
-            
-            print(f"✅ Created delete button for account: {acc.label}")
-            
-            # Open/Close Browser button (compact)
-            open_btn = ttk.Button(actions_frame, text="🌐", width=4)
-            def toggle_browser(a=acc, btn=open_btn):
-                if a.label in self.browser_drivers:
-                    try:
-                        self.browser_drivers[a.label].quit()
-                    except Exception:
-                        pass
-                    from selenium_manager import log_browser_close
-                    log_browser_close(a, "closed")
-                    del self.browser_drivers[a.label]
-                    btn.config(text="🌐")
-                    self.log(f"Closed browser for {a.label}")
-                else:
-                    self.log(f"Opening browser for {a.label}...")
-                    try:
-                        from selenium_manager import open_browser_with_profile
-                        driver = open_browser_with_profile(a)
-                        if driver:
-                            self.browser_drivers[a.label] = driver
-                            btn.config(text="❌")
-                            self.log(f"✅ Successfully opened browser for {a.label}")
-                        else:
-                            self.log(f"❌ Failed to open browser for {a.label}", is_error=True)
-                    except Exception as e:
-                        self.log(f"❌ Error opening browser for {a.label}: {e}", is_error=True)
-            open_btn.config(text="❌" if acc.label in self.browser_drivers else "🌐", command=toggle_browser)
-            open_btn.pack(side='left', padx=1)
-            self.browser_buttons[acc.label] = open_btn
-            
-            # Manage Proxy button (compact)
-            proxy_btn = ttk.Button(actions_frame, text="🔧", width=4,
-                                 command=lambda a=acc: self.assign_proxy_to_account(a.label))
-            proxy_btn.pack(side='left', padx=1)
-            
-            # Save Cookies button (compact)
-            def save_cookies_for_account(account):
-                from selenium_manager import manual_save_cookies
-                self.log(f"💾 Manually saving cookies for {account.label}...")
-                success = manual_save_cookies(account)
-                if success:
-                    self.log(f"✅ Cookies saved for {account.label}")
+            self._sort_column = column
+            self._sort_reverse = False
+        self._apply_sort()
+
+    def _apply_sort(self):
+        column = self._sort_column
+        ordered = sorted(self._sort_keys, key=lambda iid: self._sort_keys[iid].get(column, ''),
+                         reverse=self._sort_reverse)
+        for index, iid in enumerate(ordered):
+            self.accounts_tree.move(iid, '', index)
+
+    def get_selected_accounts(self):
+        if self.accounts_tree is None:
+            return []
+        return [self._row_accounts[iid] for iid in self.accounts_tree.selection() if iid in self._row_accounts]
+
+    def show_account_context_menu(self, event):
+        iid = self.accounts_tree.identify_row(event.y)
+        if iid and iid not in self.accounts_tree.selection():
+            self.accounts_tree.selection_set(iid)
+        if self.accounts_tree.selection():
+            self.account_menu.tk_popup(event.x_root, event.y_root)
+
+    def toggle_browser(self, acc):
+        """Open the account's browser, or close it if it's already open"""
+        if acc.label in self.browser_drivers:
+            try:
+                self.browser_drivers[acc.label].quit()
+            except Exception:
+                pass
+            from selenium_manager import log_browser_close
+            log_browser_close(acc, "closed")
+            del self.browser_drivers[acc.label]
+            self._update_row(acc)
+            self.log(f"Closed browser for {acc.label}")
+        else:
+            self.log(f"Opening browser for {acc.label}...")
+            try:
+                from selenium_manager import open_browser_with_profile
+                driver = open_browser_with_profile(acc)
+                if driver:
+                    self.browser_drivers[acc.label] = driver
+                    self._update_row(acc)
+                    self.log(f"✅ Successfully opened browser for {acc.label}")
                 else:
-                    self.log(f"❌ Failed to save cookies for {account.label}", is_error=True)
-            
-            save_cookies_btn = ttk.Button(actions_frame, text="💾", width=4,
-                                        command=lambda a=acc: save_cookies_for_account(a))
-            save_cookies_btn.pack(side='left', padx=1)
-            
-            print(f"✅ Created browser button for account: {acc.label}")
-            print(f"📊 Actions frame children count: {len(actions_frame.winfo_children())}")
+                    self.log(f"❌ Failed to open browser for {acc.label}", is_error=True)
+            except Exception as e:
+                self.log(f"❌ Error opening browser for {acc.label}: {e}", is_error=True)
+
+    def toggle_selected_browsers(self):
+        for acc in self.get_selected_accounts():
+            self.toggle_browser(acc)
+
+    def edit_selected_account(self):
+        selected = self.get_selected_accounts()
+        if selected:
+            self.edit_account_dialog(selected[0])
+
+    def edit_selected_tags(self):
+        selected = self.get_selected_accounts()
+        if not selected:
+            return
+        if len(selected) == 1:
+            self.edit_tags_dialog(selected[0])
+            return
+        new_tags = simpledialog.askstring("Edit Tags", f"Enter tags for {len(selected)} accounts (comma-separated):")
+        if new_tags is not None:
+            tags = [t.strip() for t in new_tags.split(",") if t.strip()]
+            with self.repository.batch():
+                for acc in selected:
+                    self.repository.update(acc, tags=list(tags))
+
+    def proxy_selected_account(self):
+        selected = self.get_selected_accounts()
+        if selected:
+            self.assign_proxy_to_account(selected[0].label)
+
+    def save_selected_cookies(self):
+        from selenium_manager import manual_save_cookies
+        for acc in self.get_selected_accounts():
+            self.log(f"💾 Manually saving cookies for {acc.label}...")
+            if manual_save_cookies(acc):
+                self.log(f"✅ Cookies saved for {acc.label}")
+            else:
+                self.log(f"❌ Failed to save cookies for {acc.label}", is_error=True)
+
+    def delete_selected_accounts(self):
+        selected = self.get_selected_accounts()
+        if not selected:
+            return
+        names = selected[0].label if len(selected) == 1 else f"{len(selected)} accounts"
+        result = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{names}'?\n\nThis will permanently remove the account and all associated data.")
+        if result:
+            for acc in selected:
+                self.delete_account(acc)
 
     def start_browser_polling(self):
         """Start polling for browser status updates"""
         try:
             # Only poll if the panel is visible and table exists
             if hasattr(self, 'accounts_table_frame') and self.winfo_exists():
-                # Check browser status for all accounts
-                from account_manager import load_accounts
-                accounts = load_accounts()
-                
-                if accounts:
+                # Accounts live in memory; no need to touch the account store here
+                if self.accounts:
                     # Update browser status in table (but don't rebuild everything)
                     self.update_browser_status_only()
                 
@@ -266,57 +391,24 @@ class AccountsPanel(ttk.Frame):
             self.after(5000, self.start_browser_polling)
     
     def update_browser_status_only(self):
-        """Update only browser status without rebuilding the entire table"""
+        """Update only the browser column of rows whose state changed"""
         try:
-            # Update browser status labels directly using stored references
-            for account_label, status_label in self.browser_status_labels.items():
-                if status_label is not None:
-                    try:
-                        status = "🟢 Open" if account_label in self.browser_drivers else "🔴 Closed"
-                        status_label.config(text=status)
-                    except Exception as e:
-                        print(f"⚠️ Error updating browser status for {account_label}: {e}")
+            for iid, acc in list(self._row_accounts.items()):
+                browser = "🟢 Open" if acc.label in self.browser_drivers else "⚪ Closed"
+                if self.accounts_tree.set(iid, 'browser') != browser:
+                    self.accounts_tree.set(iid, 'browser', browser)
         except Exception as e:
             print(f"Error updating browser status: {e}")
 
     def log(self, message, is_error=False):
         if is_error:
             message = f"❌ {message}"
-        
-        # Check if log_text exists before using it
-        if not hasattr(self, 'log_text') or self.log_text is None:
-            print(f"⚠️ Log text widget not available: {message}")
-            return
-            
-        try:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
-            # Save to state
-            self.state['log_messages'].append(message)
-            # Keep only last 100 messages to prevent memory issues
-            if len(self.state['log_messages']) > 100:
-                self.state['log_messages'] = self.state['log_messages'][-100:]
-        except Exception as e:
-            print(f"⚠️ Error logging message: {e}")
-            print(f"Original message: {message}")
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error)
 
     def log_message(self, message):
         """Add message to log"""
-        # Check if log_text exists before using it
-        if not hasattr(self, 'log_text') or self.log_text is None:
-            print(f"⚠️ Log text widget not available: {message}")
-            return
-            
-        try:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', f"{message}\n")
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
-        except Exception as e:
-            print(f"Error logging message: {e}")
-            print(f"Original message: {message}")
+        self.log_channel.write(message)
     
     def open_browser_for_account(self, acc):
         """Open browser for a specific account"""
@@ -378,9 +470,8 @@ class AccountsPanel(ttk.Frame):
         self.account_form_dialog("Add Account")
 
     def delete_account_dialog(self):
-        # This method is deprecated since we now use a table with individual delete buttons
-        # Users can delete accounts by editing them and removing them
-        messagebox.showinfo("Delete Account", "To delete an account, edit it and remove all data, or manually edit accounts.json")
+        # This method is deprecated since the table has its own Delete button
+        messagebox.showinfo("Delete Account", "To delete an account, select it in the table and click 🗑️ Delete")
 
     def get_selected_account_index(self):
         # Since we're using a table with checkboxes now, this method is deprecated
@@ -466,29 +557,35 @@ class AccountsPanel(ttk.Frame):
                 self.log("Label and Username are required.", is_error=True)
                 return
             
-            # Check for duplicate username (except when editing the same account)
-            existing_acc = next((a for a in self.accounts if a.username == username), None)
+            # Check for duplicate username and label (except when editing the same account)
+            existing_acc = self.repository.get_by_username(username)
             if existing_acc and (not acc or existing_acc != acc):
                 self.log(f"Username '{username}' already exists.", is_error=True)
                 return
+            existing_acc = self.repository.get(label)
+            if existing_acc and (not acc or existing_acc != acc):
+                self.log(f"Label '{label}' already exists.", is_error=True)
+                return
             
             if acc:
-                # Update existing account
-                acc.label = label
-                acc.username = username
-                acc.tags = tags
-                # Password is not persisted but stored in memory
-                acc.password = password
-                acc.proxy = proxy
+                # Update existing account (password is not persisted but stored in memory)
+                try:
+                    self.repository.update(acc, label=label, username=username, tags=tags,
+                                           password=password, proxy=proxy)
+                except Exception as e:
+                    self.log(f"Error updating account: {e}", is_error=True)
+                    return
                 self.log(f"Updated account: {label}")
             else:
                 # Create new account
                 new_acc = SeleniumAccount(label, username, password=password, tags=tags, proxy=proxy)
-                self.accounts.append(new_acc)
+                try:
+                    self.repository.add(new_acc)
+                except ValueError as e:
+                    self.log(str(e), is_error=True)
+                    return
                 self.log(f"Added account: {label}")
             
-            save_accounts(self.accounts)
-            self.refresh_accounts_table()
             dialog.destroy()
         
         def on_cancel():
@@ -531,9 +628,7 @@ class AccountsPanel(ttk.Frame):
             self.log(f"📊 Accounts before deletion: {len(self.accounts)}")
             
             # Remove from accounts list
-            if acc in self.accounts:
-                self.accounts.remove(acc)
-                save_accounts(self.accounts)
+            if self.repository.remove(acc):
                 self.log(f"✅ Removed account '{acc.label}' from accounts list")
                 self.log(f"📊 Accounts after deletion: {len(self.accounts)}")
             else:
@@ -570,51 +665,60 @@ class AccountsPanel(ttk.Frame):
             else:
                 self.log(f"⚠️ Cookie file not found for {acc.label}")
             
-            # Remove from browser buttons and status labels
-            if acc.label in self.browser_buttons:
-                del self.browser_buttons[acc.label]
-            if acc.label in self.browser_status_labels:
-                del self.browser_status_labels[acc.label]
-            if acc.label in self.status_labels:
-                del self.status_labels[acc.label]
-            
             self.log(f"✅ Account '{acc.label}' completely deleted")
             
-            # Refresh the table to update UI
-            self.log(f"🔄 Refreshing table with {len(self.accounts)} accounts")
-            self.refresh_accounts_table()
-            
         except Exception as e:
             self.log(f"❌ Error deleting account {acc.label}: {e}", is_error=True)
 
     def check_all_accounts_status_and_avatar(self):
-        for acc in self.accounts:
-            self.update_account_status_and_avatar(acc)
+        self.run_status_check(list(self.accounts), persist=False)
 
     def check_selected_accounts_status(self):
-        for acc in self.accounts:
-            self.update_account_status_and_avatar(acc, persist=True)
+        # Selected rows, or every account when nothing is selected
+        self.run_status_check(self.get_selected_accounts() or list(self.accounts), persist=True, force=True)
 
     def update_account_status_and_avatar(self, acc, persist=False):
-        def worker():
-            status, avatar_url = get_account_status_and_avatar(acc, headless=False)
-            acc.status = status
-            acc.avatar_url = avatar_url
-            
-            # Check if the status label still exists before updating
-            if acc.label in self.status_labels and self.status_labels[acc.label] is not None:
+        self.run_status_check([acc], persist=persist, force=True)
+
+    def run_status_check(self, accounts, persist=False, force=False):
+        """Check account status with a bounded number of browsers, updating rows as results arrive.
+
+        With persist=True the results are saved together as one batch once the sweep finishes.
+        """
+        total = len(accounts)
+        if not total:
+            return
+        checker = get_health_checker()
+        self.log(f"🔍 Checking status of {total} account(s), {checker.max_workers} at a time...")
+        progress = {'done': 0}
+        progress_lock = threading.Lock()
+        
+        def on_result(acc, result):
+            with progress_lock:
+                progress['done'] += 1
+                done = progress['done']
+            if not persist:
+                acc.status = result['status']
+                acc.avatar_url = result['avatar_url']
+                self.ui_events.state((self, 'row', id(acc)), self._update_row, acc)
+            self.log(f"[{done}/{total}] {acc.label}: {result['status']} ({result['source']})")
+        
+        def on_done(results):
+            if persist and results:
+                # One transaction for the sweep; rows redraw through the repository events
+                by_label = {acc.label: acc for acc in accounts}
                 try:
-                    if status == 'Active':
-                        self.status_labels[acc.label].config(text='Active', foreground='green')
-                    else:
-                        self.status_labels[acc.label].config(text='Inactive', foreground='red')
+                    with self.repository.batch():
+                        for label, result in results.items():
+                            acc = by_label.get(label)
+                            if acc is not None:
+                                self.repository.update(acc, status=result['status'], avatar_url=result['avatar_url'])
                 except Exception as e:
-                    print(f"⚠️ Error updating status label for {acc.label}: {e}")
-            
-            if persist:
-                from account_manager import save_accounts
-                save_accounts(self.accounts)
-        threading.Thread(target=worker, daemon=True).start() 
+                    self.log(f"❌ Error saving status check results: {e}", is_error=True)
+            active = sum(1 for r in results.values() if r['status'] == 'Active')
+            self.log(f"✅ Status check finished: {active}/{len(results)} active")
+        
+        checker.check_accounts(accounts, on_result=on_result, on_done=on_done, force=force)
 
     def bulk_open_browsers(self):
         for acc in self.accounts:
@@ -622,18 +726,7 @@ class AccountsPanel(ttk.Frame):
                 from selenium_manager import open_browser_with_profile
                 driver = open_browser_with_profile(acc)
                 self.browser_drivers[acc.label] = driver
-                btn = self.browser_buttons.get(acc.label)
-                if btn and btn is not None:
-                    try:
-                        btn.config(text="Close")
-                    except Exception as e:
-                        print(f"⚠️ Error updating browser button for {acc.label}: {e}")
-                lbl = self.browser_status_labels.get(acc.label)
-                if lbl and lbl is not None:
-                    try:
-                        lbl.config(text="🟢")
-                    except Exception as e:
-                        print(f"⚠️ Error updating browser status for {acc.label}: {e}")
+                self._update_row(acc)
 
     def bulk_close_browsers(self):
         from selenium_manager import get_global_driver_manager
@@ -651,19 +744,7 @@ class AccountsPanel(ttk.Frame):
                 from selenium_manager import log_browser_close
                 log_browser_close(acc, "closed")
                 del self.browser_drivers[acc.label]
-                
-                btn = self.browser_buttons.get(acc.label)
-                if btn and btn is not None:
-                    try:
-                        btn.config(text="Open")
-                    except Exception as e:
-                        print(f"⚠️ Error updating browser button for {acc.label}: {e}")
-                lbl = self.browser_status_labels.get(acc.label)
-                if lbl and lbl is not None:
-                    try:
-                        lbl.config(text="⚪")
-                    except Exception as e:
-                        print(f"⚠️ Error updating browser status for {acc.label}: {e}")
+                self._update_row(acc)
         self.log("✅ All browser sessions closed")
 
     def verify_all_profiles(self):
@@ -676,7 +757,13 @@ class AccountsPanel(ttk.Frame):
                     self.log(f"📋 Checking profile for {acc.label}...")
                     
                     # Import the verification function
-                    from selenium_manager import check_profile_session_data, cleanup_chrome_profile_cache
+                    from selenium_manager import (check_profile_session_data, cleanup_chrome_profile_cache,
+                                                  profile_needs_verification, clear_profile_verification_flag)
+                    
+                    # Browsers killed at the shutdown deadline leave a marker behind
+                    flagged = profile_needs_verification(acc)
+                    if flagged:
+                        self.log(f"🚩 {acc.label}: Browser was force-closed last session")
                     
                     # Clean up cache directories
                     cleanup_chrome_profile_cache(acc)
@@ -686,6 +773,8 @@ class AccountsPanel(ttk.Frame):
                     
                     if has_session:
                         self.log(f"✅ {acc.label}: Profile has session data")
+                        if flagged:
+                            clear_profile_verification_flag(acc)
                     else:
                         self.log(f"⚠️ {acc.label}: No session data found")
                 
@@ -721,15 +810,12 @@ class AccountsPanel(ttk.Frame):
         
         threading.Thread(target=worker, daemon=True).start()
 
-    def edit_tags_dialog(self, acc, label_widget):
+    def edit_tags_dialog(self, acc):
         import tkinter.simpledialog
         tags_str = ", ".join(acc.tags) if acc.tags else ""
         new_tags = tkinter.simpledialog.askstring("Edit Tags", f"Enter tags for {acc.label} (comma-separated):", initialvalue=tags_str)
         if new_tags is not None:
-            acc.tags = [t.strip() for t in new_tags.split(",") if t.strip()]
-            label_widget.config(text=", ".join(acc.tags))
-            from account_manager import save_accounts
-            save_accounts(self.accounts) 
+            self.repository.update(acc, tags=[t.strip() for t in new_tags.split(",") if t.strip()])
 
     def quick_send_dm(self, acc):
         recipient = simpledialog.askstring("Send DM", f"Recipient username for {acc.label}:")
@@ -802,6 +888,7 @@ class AccountsPanel(ttk.Frame):
         
         try:
             imported_accounts = []
+            seen_usernames = set()
             with open(file_path, 'r', encoding='utf-8') as file:
                 for line_num, line in enumerate(file, 1):
                     line = line.strip()
@@ -827,10 +914,11 @@ class AccountsPanel(ttk.Frame):
                         self.log(f"Empty username on line {line_num}", is_error=True)
                         continue
                     
-                    # Check for duplicate username
-                    if any(acc.username == username for acc in self.accounts):
+                    # Check for duplicate username, in the app or earlier in this file
+                    if self.repository.get_by_username(username) or username in seen_usernames:
                         self.log(f"Skipping duplicate username: {username}", is_error=True)
                         continue
+                    seen_usernames.add(username)
                     
                     # Create account with username as label
                     label = username
@@ -849,77 +937,103 @@ class AccountsPanel(ttk.Frame):
             self.log(f"Error importing accounts: {e}", is_error=True)
 
     def auto_login_imported_accounts(self, accounts_to_import):
-        """Automatically login imported accounts one at a time"""
-        def worker():
-            for i, acc in enumerate(accounts_to_import, 1):
-                self.log(f"Processing account {i}/{len(accounts_to_import)}: {acc.username}")
-                
-                try:
-                    # Add account to list first
-                    self.accounts.append(acc)
-                    save_accounts(self.accounts)
-                    self.refresh_accounts_table()
-                    
-                    # Open browser for manual login
-                    self.log(f"Opening browser for {acc.username}...")
-                    driver = open_browser_with_profile(acc)
-                    
-                    if not driver:
-                        self.log(f"Failed to open browser for {acc.username}", is_error=True)
-                        continue
-                    
-                    # Navigate to login page
-                    driver.get('https://x.com/login')
-                    self.log(f"Please log in manually for {acc.username}")
-                    
-                    # Wait for user to complete login
-                    input(f"Press Enter in terminal after logging in for {acc.username}...")
-                    
-                    # Wait 15-30 seconds to verify login success
-                    self.log(f"Verifying login success for {acc.username}...")
-                    time.sleep(20)  # 20 second delay
-                    
-                    # Check if login was successful
-                    driver.get('https://x.com/home')
-                    time.sleep(5)
-                    
-                    if 'login' in driver.current_url:
-                        self.log(f"Login verification failed for {acc.username} - still on login page", is_error=True)
-                        driver.quit()
-                        continue
-                    
-                    # Save cookies
-                    cookies = driver.get_cookies()
-                    cookie_path = acc.get_cookie_path()
-                    os.makedirs(os.path.dirname(cookie_path), exist_ok=True)
-                    with open(cookie_path, 'wb') as f:
-                        pickle.dump(cookies, f)
-                    
-                    # Update account status
-                    acc.status = 'Active'
-                    save_accounts(self.accounts)
-                    self.refresh_accounts_table()
-                    
-                    self.log(f"✅ Successfully imported and logged in {acc.username}")
-                    
-                    # Close browser
-                    driver.quit()
-                    
-                    # Small delay before next account
-                    time.sleep(3)
-                    
-                except Exception as e:
-                    self.log(f"Error processing {acc.username}: {e}", is_error=True)
-                    try:
-                        driver.quit()
-                    except:
-                        pass
-                    continue
-            
-            self.log(f"Import process completed. {len(accounts_to_import)} accounts processed.")
+        """Queue imported accounts for login, several browsers at a time"""
+        try:
+            with self.repository.batch():
+                for acc in accounts_to_import:
+                    self.repository.add(acc)
+        except Exception as e:
+            self.log(f"Error saving imported accounts, nothing was imported: {e}", is_error=True)
+            return
         
-        # Run in background thread
-        threading.Thread(target=worker, daemon=True).start()
+        if getattr(self, 'onboarding_queue', None) is None:
+            from onboarding import OnboardingQueue
+            self.onboarding_queue = OnboardingQueue(on_change=self._on_onboarding_change)
+        self.onboarding_queue.add(accounts_to_import)
+        self.log(f"Queued {len(accounts_to_import)} accounts for login "
+                 f"({self.onboarding_queue.max_concurrent} browsers at a time)")
+        self.show_onboarding_dialog()
+
+    def _on_onboarding_change(self, job):
+        """Onboarding queue callback; runs on a worker thread"""
+        message = f"{job.acc.username}: {job.state}" + (f" - {job.message}" if job.message else "")
+        self.log(message, is_error=job.state == 'Failed')
+        self.ui_events.state((self, 'onboarding_dialog'), self._refresh_onboarding_dialog)
+
+    def show_onboarding_dialog(self):
+        """Window listing the login queue, with skip and retry actions"""
+        dialog = getattr(self, 'onboarding_dialog', None)
+        if dialog is not None and dialog.winfo_exists():
+            dialog.lift()
+            self._refresh_onboarding_dialog()
+            return
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("Account Login Queue")
+        dialog.geometry("620x380")
+        dialog.transient(self)
+        self.onboarding_dialog = dialog
+        
+        ttk.Label(dialog, text="Log in to each account in its browser window. Sessions are saved automatically "
+                               "as soon as the login completes.", wraplength=580).pack(anchor='w', padx=10, pady=(10, 5))
+        
+        columns = ('username', 'state', 'elapsed', 'message')
+        tree = ttk.Treeview(dialog, columns=columns, show='headings', selectmode='extended')
+        for column, heading, width in zip(columns, ('Username', 'State', 'Time', 'Details'), (140, 120, 60, 260)):
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, anchor='w')
+        tree.pack(fill='both', expand=True, padx=10, pady=5)
+        self.onboarding_tree = tree
+        self._onboarding_labels = {}  # tree item id -> account label
+        
+        summary_label = ttk.Label(dialog, text="")
+        summary_label.pack(anchor='w', padx=10)
+        self.onboarding_summary_label = summary_label
+        
+        def selected_labels():
+            # The queue is keyed by account label, which may differ from the username shown
+            return [self._onboarding_labels[iid] for iid in tree.selection() if iid in self._onboarding_labels]
+        
+        def skip_selected():
+            for label in selected_labels():
+                self.onboarding_queue.skip(label)
+        
+        def retry_selected():
+            for label in selected_labels():
+                self.onboarding_queue.retry(label)
+            self._refresh_onboarding_dialog()
+        
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill='x', padx=10, pady=10)
+        ttk.Button(button_frame, text="⏭️ Skip", command=skip_selected).pack(side='left', padx=(0, 5))
+        ttk.Button(button_frame, text="🔁 Retry", command=retry_selected).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Close", command=dialog.destroy).pack(side='right')
+        
+        self._refresh_onboarding_dialog()
+        self._tick_onboarding_dialog()
+
+    def _tick_onboarding_dialog(self):
+        """Keep the elapsed times moving while the dialog is open"""
+        dialog = getattr(self, 'onboarding_dialog', None)
+        if dialog is not None and dialog.winfo_exists():
+            self._refresh_onboarding_dialog()
+            self.after(1000, self._tick_onboarding_dialog)
+
+    def _refresh_onboarding_dialog(self):
+        dialog = getattr(self, 'onboarding_dialog', None)
+        if dialog is None or not dialog.winfo_exists() or getattr(self, 'onboarding_queue', None) is None:
+            return
+        tree = self.onboarding_tree
+        for job in self.onboarding_queue.snapshot():
+            iid = str(id(job))
+            self._onboarding_labels[iid] = job.acc.label
+            values = (job.acc.username, job.state, f"{job.elapsed:.0f}s", job.message)
+            if tree.exists(iid):
+                tree.item(iid, values=values)
+            else:
+                tree.insert('', 'end', iid=iid, values=values)
+        counts = self.onboarding_queue.counts()
+        self.onboarding_summary_label.config(text=", ".join(f"{state}: {count}" for state, count in counts.items()))
 
     def export_accounts_dialog(self):
         """Export accounts to a file"""
@@ -931,9 +1045,8 @@ class AccountsPanel(ttk.Frame):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    json.dump([acc.to_dict() for acc in self.accounts], f, indent=2)
-                self.log(f"Exported {len(self.accounts)} accounts to {file_path}")
+                count = self.repository.export_json(file_path)
+                self.log(f"Exported {count} accounts to {file_path}")
             except Exception as e:
                 self.log(f"Error exporting accounts: {e}", is_error=True) 
 
@@ -984,13 +1097,8 @@ class AccountsPanel(ttk.Frame):
             status_frame = ttk.LabelFrame(main_frame, text="Current Proxy Status")
             status_frame.pack(fill='x', pady=(0, 20))
             
-            from account_manager import load_accounts
-            accounts = load_accounts()
-            current_proxy = None
-            for acc in accounts:
-                if acc.label == account_label:
-                    current_proxy = acc.proxy
-                    break
+            account = self.repository.get(account_label)
+            current_proxy = account.proxy if account else None
             
             if current_proxy:
                 ttk.Label(status_frame, text=f"✅ Proxy configured:", font=('Arial', 10, 'bold')).pack(anchor='w', pady=(10, 5))
@@ -1030,18 +1138,10 @@ class AccountsPanel(ttk.Frame):
                 if proxy:
                     try:
                         # Update account
-                        from account_manager import load_accounts, save_accounts
-                        accounts = load_accounts()
-                        
-                        account_updated = False
-                        for acc in accounts:
-                            if acc.label == account_label:
-                                acc.proxy = proxy
-                                account_updated = True
-                                break
+                        acc = self.repository.get(account_label)
                         
-                        if account_updated:
-                            save_accounts(accounts)
+                        if acc:
+                            self.repository.update(acc, proxy=proxy)
                             
                             # Create proxy plugin
                             from create_proxy_plugin import setup_proxy_for_account
@@ -1063,18 +1163,10 @@ class AccountsPanel(ttk.Frame):
             def clear_proxy():
                 try:
                     # Remove proxy from account
-                    from account_manager import load_accounts, save_accounts
-                    accounts = load_accounts()
-                    
-                    account_updated = False
-                    for acc in accounts:
-                        if acc.label == account_label:
-                            acc.proxy = None
-                            account_updated = True
-                            break
+                    acc = self.repository.get(account_label)
                     
-                    if account_updated:
-                        save_accounts(accounts)
+                    if acc:
+                        self.repository.update(acc, proxy=None)
                         self.log_message(f"✅ Proxy removed from {account_label}")
                         # Update the display
                         self.update_proxy_display(account_label, "None")
@@ -1128,174 +1220,6 @@ class AccountsPanel(ttk.Frame):
     
     def update_proxy_display(self, account_label, proxy_text):
         """Update proxy display for a specific account without refreshing entire table"""
-        try:
-            # Find the proxy label for this account and update it
-            for widget in self.accounts_table_frame.winfo_children():
-                if hasattr(widget, 'grid_info') and widget.grid_info()['row'] > 0:
-                    # Find the account row
-                    for child in widget.master.winfo_children():
-                        if (hasattr(child, 'grid_info') and 
-                            child.grid_info()['row'] == widget.grid_info()['row'] and 
-                            child.grid_info()['column'] == 1):  # Label column
-                            if child.cget("text") == account_label:
-                                # Found the account row, now find the proxy column (column 5)
-                                for proxy_child in widget.master.winfo_children():
-                                    if (hasattr(proxy_child, 'grid_info') and 
-                                        proxy_child.grid_info()['row'] == widget.grid_info()['row'] and 
-                                        proxy_child.grid_info()['column'] == 5):
-                                        # Update proxy display
-                                        display_text = proxy_text
-                                        if len(display_text) > 30:
-                                            display_text = display_text[:27] + "..."
-                                        proxy_child.config(text=display_text)
-                                        return
-        except Exception as e:
-            print(f"Error updating proxy display: {e}")
-    
-    def refresh_accounts_table(self):
-        """Refresh the accounts table with current data"""
-        try:
-            # Only refresh if the table exists and has been built
-            if not hasattr(self, 'accounts_table_frame'):
-                return
-            
-            # Initialize browser_buttons if it doesn't exist
-            if not hasattr(self, 'browser_buttons'):
-                self.browser_buttons = {}
-            
-            # Initialize other required attributes
-            if not hasattr(self, 'selected_accounts'):
-                self.selected_accounts = {}
-            if not hasattr(self, 'browser_status_labels'):
-                self.browser_status_labels = {}
-            if not hasattr(self, 'status_labels'):
-                self.status_labels = {}
-            if not hasattr(self, 'browser_drivers'):
-                self.browser_drivers = {}
-            
-            # Clear existing rows (but keep headers)
-            for widget in self.accounts_table_frame.winfo_children():
-                if hasattr(widget, 'grid_info') and widget.grid_info()['row'] > 0:
-                    widget.destroy()
-            
-            # Use self.accounts instead of loading from file to maintain synchronization
-            accounts = self.accounts
-            
-            self.log(f"🔄 Refreshing table with {len(accounts)} accounts")
-            for acc in accounts:
-                self.log(f"📋 Account in list: {acc.label}")
-            
-            if not accounts:
-                return
-            
-            # Populate table
-            for i, acc in enumerate(accounts):
-                try:
-                    row = i + 1  # Start after headers
-                    
-                    # Account info
-                    ttk.Label(self.accounts_table_frame, text=acc.label).grid(row=row, column=0, padx=5, pady=2, sticky='w')
-                    ttk.Label(self.accounts_table_frame, text=acc.username).grid(row=row, column=1, padx=5, pady=2, sticky='w')
-                    ttk.Label(self.accounts_table_frame, text=acc.status or "Unknown").grid(row=row, column=2, padx=5, pady=2, sticky='w')
-                    
-                    # Tags column with button
-                    tags_frame = ttk.Frame(self.accounts_table_frame)
-                    tags_frame.grid(row=row, column=3, padx=5, pady=2, sticky='w')
-                    
-                    # Tags display
-                    tags_text = ", ".join(acc.tags) if acc.tags else "None"
-                    tags_label = ttk.Label(tags_frame, text=tags_text)
-                    tags_label.pack(side='left')
-                    
-                    # Tags edit button
-                    def edit_tags(account):
-                        self.edit_tags_dialog(account, tags_label)
-                    
-                    tags_btn = ttk.Button(tags_frame, text="✏️", width=3,
-                                        command=lambda a=acc: edit_tags(a))
-                    tags_btn.pack(side='right', padx=(5, 0))
-                    
-                    # Proxy info
-                    proxy_text = acc.proxy or "None"
-                    if len(proxy_text) > 30:
-                        proxy_text = proxy_text[:27] + "..."
-                    ttk.Label(self.accounts_table_frame, text=proxy_text).grid(row=row, column=4, padx=5, pady=2, sticky='w')
-                    
-                    # Browser status
-                    browser_status = "🟢 Open" if acc.label in self.browser_drivers else "🔴 Closed"
-                    ttk.Label(self.accounts_table_frame, text=browser_status).grid(row=row, column=5, padx=5, pady=2, sticky='w')
-                    
-                    # Action buttons - reorganized for better fit
-                    button_frame = ttk.Frame(self.accounts_table_frame)
-                    button_frame.grid(row=row, column=6, padx=5, pady=2, sticky='w')
-                    
-                    # Delete button (compact)
-                    def confirm_delete(account):
-                        result = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete account '{account.label}'?\n\nThis will permanently remove the account and all associated data.")
-                        if result:
-                            self.delete_account(account)
-                    
-                    del_btn = tk.Button(button_frame, text="🗑️", 
-                                       command=lambda a=acc: confirm_delete(a),
-                                       bg='#ff4444', fg='white', 
-                                       font=('Arial', 8, 'bold'),
-                                       relief='raised', bd=1, width=4)
-                    del_btn.pack(side='left', padx=1)
-                    
-                    # Open/Close Browser button (compact)
-                    open_btn = ttk.Button(button_frame, text="🌐", width=4)
-                    def toggle_browser(a=acc, btn=open_btn):
-                        if a.label in self.browser_drivers:
-                            try:
-                                self.browser_drivers[a.label].quit()
-                            except Exception:
-                                pass
-                            from selenium_manager import log_browser_close
-                            log_browser_close(a, "closed")
-                            del self.browser_drivers[a.label]
-                            btn.config(text="🌐")
-                            self.log(f"Closed browser for {a.label}")
-                        else:
-                            self.log(f"Opening browser for {a.label}...")
-                            try:
-                                from selenium_manager import open_browser_with_profile
-                                driver = open_browser_with_profile(a)
-                                if driver:
-                                    self.browser_drivers[a.label] = driver
-                                    btn.config(text="❌")
-                                    self.log(f"✅ Successfully opened browser for {a.label}")
-                                else:
-                                    self.log(f"❌ Failed to open browser for {a.label}", is_error=True)
-                            except Exception as e:
-                                self.log(f"❌ Error opening browser for {a.label}: {e}", is_error=True)
-                    open_btn.config(text="❌" if acc.label in self.browser_drivers else "🌐", command=toggle_browser)
-                    open_btn.pack(side='left', padx=1)
-                    self.browser_buttons[acc.label] = open_btn
-                    
-                    # Manage Proxy button (compact)
-                    proxy_btn = ttk.Button(button_frame, text="🔧", width=4,
-                                         command=lambda a=acc: self.assign_proxy_to_account(a.label))
-                    proxy_btn.pack(side='left', padx=1)
-                    
-                    # Save Cookies button (compact)
-                    def save_cookies_for_account(account):
-                        from selenium_manager import manual_save_cookies
-                        self.log(f"💾 Manually saving cookies for {account.label}...")
-                        success = manual_save_cookies(account)
-                        if success:
-                            self.log(f"✅ Cookies saved for {account.label}")
-                        else:
-                            self.log(f"❌ Failed to save cookies for {account.label}", is_error=True)
-                    
-                    save_cookies_btn = ttk.Button(button_frame, text="💾", width=4,
-                                                command=lambda a=acc: save_cookies_for_account(a))
-                    save_cookies_btn.pack(side='left', padx=1)
-                    
-                except Exception as e:
-                    print(f"❌ Error creating row for account {acc.label}: {e}")
-                    continue
-        except Exception as e:
-            import traceback
-            print(f"❌ Error refreshing accounts table: {e}")
-            print(f"📋 Full traceback:")
-            traceback.print_exc() 
\ No newline at end of file
+        acc = self.repository.get(account_label)
+        if acc:
+            self._update_row(acc)
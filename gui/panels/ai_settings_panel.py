@@ -3,7 +3,6 @@ from tkinter import ttk, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
 import os
 import json
-from ai_integration import create_ai_integration
 from datetime import datetime
 from utils import log_to_file
 from dotenv import load_dotenv
@@ -15,7 +14,7 @@ class AISettingsPanel(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self.ai_manager = create_ai_integration()
+        self._ai_manager = None  # created on first use
         self.provider_var = None
         self.api_key_entry = None
         self.usage_label = None
@@ -47,6 +46,13 @@ class AISettingsPanel(ttk.Frame):
             }
         }
 
+    @property
+    def ai_manager(self):
+        if self._ai_manager is None:
+            from ai_integration import create_ai_integration
+            self._ai_manager = create_ai_integration()
+        return self._ai_manager
+
     def load_state(self):
         """Load saved state from file"""
         try:
@@ -381,8 +387,8 @@ class AISettingsPanel(ttk.Frame):
         self.saved_state['api_keys'][current_provider] = api_key
         self.save_state()
         
-        # Reinitialize AI manager
-        self.ai_manager = create_ai_integration()
+        # Reinitialize AI manager (recreated with the new key on next use)
+        self._ai_manager = None
         
         # Update provider status
         self.update_provider_status_display()
@@ -3,7 +3,8 @@ from tkinter import ttk, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
 import threading
 from selenium_manager import change_bio
-from utils import log_to_file
+from log_bus import get_log_bus
+from tracing import traced
 
 class BioPanel(ttk.Frame):
     def __init__(self, parent, accounts):
@@ -14,13 +15,13 @@ class BioPanel(ttk.Frame):
         self.accounts_listbox = None
         self.bio_entry = None
         self.log_text = None
+        self.log_channel = get_log_bus().channel('bio', file_name='bio')
         self.selected_tag = None
         self.tag_filter_dropdown = None
         # State persistence
         self.state = {
             'selected_tag': 'All',
             'bio_text': '',
-            'log_messages': []
         }
 
     def build_panel(self):
@@ -91,12 +92,8 @@ class BioPanel(ttk.Frame):
         self.refresh_accounts_list()
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for message in self.state['log_messages']:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
 
     def refresh_accounts_list(self):
         """Refresh the accounts listbox based on selected tag filter"""
@@ -107,19 +104,11 @@ class BioPanel(ttk.Frame):
             tags_text = f" [{', '.join(acc.tags)}]" if acc.tags else ""
             self.accounts_listbox.insert('end', f"{acc.label} ({acc.username}){tags_text}")
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         if is_error:
             message = f"❌ {message}"
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        self.log_text.config(state='disabled')
-        # Save to state
-        self.state['log_messages'].append(message)
-        # Keep only last 100 messages to prevent memory issues
-        if len(self.state['log_messages']) > 100:
-            self.state['log_messages'] = self.state['log_messages'][-100:]
-        log_to_file('bio', message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error, **fields)
 
     def change_bio_bulk(self):
         selected_indices = self.accounts_listbox.curselection()
@@ -138,11 +127,12 @@ class BioPanel(ttk.Frame):
         
         threading.Thread(target=self._change_bio_sequential, args=(selected_accounts, bio)).start()
 
+    @traced()
     def _change_bio_sequential(self, accounts, bio):
         for acc in accounts:
             self.log(f"[{acc.label}] Changing bio...")
             success, msg = change_bio(acc, bio)
             if success:
-                self.log(f"[{acc.label}] ✅ {msg}")
+                self.log(f"[{acc.label}] ✅ {msg}", account=acc.label, action='bio')
             else:
-                self.log(f"[{acc.label}] {msg}", is_error=True) 
\ No newline at end of file
+                self.log(f"[{acc.label}] {msg}", is_error=True, account=acc.label, action='bio') 
\ No newline at end of file
@@ -1,13 +1,219 @@
+import threading
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
+from metrics import get_metrics, STAGES
+from ui_events import get_ui_events
+from tracing import get_tracer
+from sampling_profiler import get_profiler
+
+# How often the dashboard takes a metrics snapshot while it is visible
+DASHBOARD_REFRESH_MS = 2000
 
 class DashboardPanel(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self.metrics = get_metrics()
+        self.ui_events = get_ui_events()
+        self.summary_labels = {}
+        self.throughput_tree = None
+        self.latency_tree = None
+        self.failures_tree = None
+        self.openai_tree = None
+        self.browsers_tree = None
+        self.stalls_tree = None
+        self._refreshing = False
+        self.tracer = get_tracer()
+        self.tracing_enabled = None
+        self.profiler = get_profiler()
+        self.profile_button = None
 
     def build_panel(self):
         title = tk.Label(self, text="Dashboard", font=('Segoe UI', 18, 'bold'), bg=COLOR_TAUPE, fg=COLOR_DARK, anchor='w')
         title.pack(anchor='nw', padx=20, pady=(20, 10))
-        # Add more widgets as needed 
\ No newline at end of file
+        # Summary cards
+        cards = tk.Frame(self, bg=COLOR_TAUPE)
+        cards.pack(fill='x', padx=20, pady=5)
+        for key, heading in (('actions', 'Actions / min'), ('browsers', 'Browsers'), ('memory', 'Browser Memory'),
+                             ('openai', 'OpenAI Requests'), ('spend', 'OpenAI Spend'), ('ui', 'UI Stalls')):
+            card = tk.Frame(cards, bg=COLOR_DARK, padx=12, pady=8)
+            card.pack(side='left', padx=(0, 8), fill='x', expand=True)
+            tk.Label(card, text=heading, font=('Segoe UI', 9), bg=COLOR_DARK, fg=COLOR_TAUPE).pack(anchor='w')
+            value = tk.Label(card, text='-', font=('Segoe UI', 13, 'bold'), bg=COLOR_DARK, fg=COLOR_WHITE)
+            value.pack(anchor='w')
+            self.summary_labels[key] = value
+        # Tracing controls
+        trace_frame = tk.Frame(self, bg=COLOR_TAUPE)
+        trace_frame.pack(anchor='nw', padx=20, pady=5)
+        self.tracing_enabled = tk.BooleanVar(value=self.tracer.enabled)
+        ttk.Checkbutton(trace_frame, text="Record trace spans", variable=self.tracing_enabled,
+                        command=self.toggle_tracing).pack(side='left')
+        ttk.Button(trace_frame, text="Export Trace", command=self.export_trace).pack(side='left', padx=(10, 2))
+        ttk.Button(trace_frame, text="Clear Trace", command=self.tracer.clear).pack(side='left', padx=2)
+        self.profile_button = ttk.Button(trace_frame, command=self.toggle_profiler,
+                                         text="Stop Profiler" if self.profiler.running else "Start Profiler")
+        self.profile_button.pack(side='left', padx=(10, 2))
+        # Tables
+        tables = ttk.Frame(self)
+        tables.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        self.throughput_tree = self._make_table(tables, "Throughput by Action", 0, 0,
+                                                ('action', 'minute', 'hour', 'failed'),
+                                                ('Action', 'Last Min', 'Last Hour', 'Failed (1h)'))
+        self.latency_tree = self._make_table(tables, "Stage Latency", 0, 1,
+                                             ('stage', 'p50', 'p95', 'samples'),
+                                             ('Stage', 'p50', 'p95', 'Samples'))
+        self.failures_tree = self._make_table(tables, "Failures by Cause", 1, 0,
+                                              ('cause', 'hour', 'share'),
+                                              ('Cause', 'Last Hour', 'Share'))
+        self.openai_tree = self._make_table(tables, "OpenAI Limits", 1, 1,
+                                            ('metric', 'used', 'limit'),
+                                            ('Metric', 'Used', 'Limit'))
+        self.browsers_tree = self._make_table(tables, "Browser Resources", 2, 0,
+                                              ('account', 'kind', 'memory', 'cpu', 'processes', 'age', 'status'),
+                                              ('Account', 'Kind', 'Memory', 'CPU', 'Processes', 'Age', 'Status'),
+                                              columnspan=2)
+        self.stalls_tree = self._make_table(tables, "UI Stalls", 3, 0,
+                                            ('time', 'duration', 'origin'),
+                                            ('Time', 'Duration', 'Origin'),
+                                            columnspan=2)
+        self.stalls_tree.column('origin', width=400)
+        tables.columnconfigure((0, 1), weight=1)
+        tables.rowconfigure((0, 1, 2, 3), weight=1)
+        self.after(0, self._schedule_refresh)
+
+    def _make_table(self, parent, heading, row, column, columns, headings, columnspan=1):
+        frame = ttk.LabelFrame(parent, text=heading, padding=5)
+        frame.grid(row=row, column=column, columnspan=columnspan, sticky='nsew', padx=(0, 8), pady=(0, 8))
+        tree = ttk.Treeview(frame, columns=columns, show='headings', height=6)
+        for name, text in zip(columns, headings):
+            tree.heading(name, text=text)
+            tree.column(name, width=90, anchor='w')
+        tree.pack(fill='both', expand=True)
+        return tree
+
+    def toggle_tracing(self):
+        if self.tracing_enabled.get():
+            self.tracer.enable()
+            print("🔬 Tracing enabled")
+        else:
+            self.tracer.disable()
+            print("🔬 Tracing disabled")
+
+    def export_trace(self):
+        """Save the recorded spans as Chrome trace JSON or JSON lines"""
+        path = filedialog.asksaveasfilename(
+            title="Export Trace", defaultextension='.json',
+            filetypes=[('Chrome trace', '*.json'), ('JSON Lines files', '*.jsonl')])
+        if not path:
+            return
+        try:
+            count = self.tracer.export(path)
+        except Exception as e:
+            messagebox.showerror("Export Trace", f"Export failed: {e}")
+            return
+        messagebox.showinfo("Export Trace", f"Exported {count} spans to {path}")
+
+    def toggle_profiler(self):
+        """Start the sampling profiler, or stop it and save the flame graph stacks"""
+        if not self.profiler.running:
+            self.profiler.start()
+            self.profile_button.config(text="Stop Profiler")
+            print("🔬 Sampling profiler started")
+            return
+        self.profiler.stop()
+        self.profile_button.config(text="Start Profiler")
+        print("🔬 Sampling profiler stopped")
+        path = filedialog.asksaveasfilename(
+            title="Save Profile", defaultextension='.folded',
+            filetypes=[('Collapsed stacks (flame graph)', '*.folded'), ('Text files', '*.txt')])
+        if not path:
+            return
+        try:
+            summary_path = self.profiler.write(path)
+        except Exception as e:
+            messagebox.showerror("Save Profile", f"Saving the profile failed: {e}")
+            return
+        messagebox.showinfo("Save Profile", f"Saved stacks to {path}\nand the blocked/CPU summary to {summary_path}")
+
+    def _schedule_refresh(self):
+        """Fixed-cadence refresh; snapshots are taken off the Tk thread and skipped while hidden"""
+        if self.winfo_ismapped() and not self._refreshing:
+            self._refreshing = True
+            threading.Thread(target=self._take_snapshot, name='dashboard-snapshot', daemon=True).start()
+        self.after(DASHBOARD_REFRESH_MS, self._schedule_refresh)
+
+    def _take_snapshot(self):
+        try:
+            snapshot = self.metrics.snapshot()
+            self.ui_events.state((self, 'snapshot'), self.show_snapshot, snapshot)
+        finally:
+            self._refreshing = False
+
+    def _fill(self, tree, rows):
+        tree.delete(*tree.get_children())
+        for values in rows:
+            tree.insert('', 'end', values=values)
+
+    def _format_seconds(self, seconds):
+        if seconds is None:
+            return '-'
+        return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+    def show_snapshot(self, snapshot):
+        counts = snapshot['counts']
+        sources = snapshot['sources']
+        actions = counts.get('actions', {})
+        failures = counts.get('action_failures', {})
+
+        self.summary_labels['actions'].config(text=str(sum(entry['minute'] for entry in actions.values())))
+        self._fill(self.throughput_tree, [
+            (action, entry['minute'], entry['hour'], failures.get(action, {}).get('hour', 0))
+            for action, entry in sorted(actions.items())])
+
+        latency = snapshot['latency']
+        self._fill(self.latency_tree, [
+            (stage, self._format_seconds(latency.get(stage, {}).get('p50')),
+             self._format_seconds(latency.get(stage, {}).get('p95')), latency.get(stage, {}).get('samples', 0))
+            for stage in STAGES])
+
+        causes = counts.get('failure_causes', {})
+        failed_hour = sum(entry['hour'] for entry in causes.values())
+        self._fill(self.failures_tree, [
+            (cause, entry['hour'], f"{entry['hour'] / failed_hour:.0%}")
+            for cause, entry in sorted(causes.items(), key=lambda item: -item[1]['hour']) if entry['hour']])
+
+        browsers = sources.get('browsers')
+        if browsers and 'error' not in browsers:
+            self.summary_labels['browsers'].config(text=f"{browsers['writers']} + {browsers['readers']} reader")
+            memory = browsers.get('memory_mb')
+            self.summary_labels['memory'].config(text=f"{memory:.0f} MB" if memory is not None else 'n/a')
+            self._fill(self.browsers_tree, [
+                (row['label'], row['kind'],
+                 f"{row['rss_mb']:.0f} MB" if row['rss_mb'] is not None else 'n/a',
+                 f"{row['cpu_percent']:.0f}%" if row['cpu_percent'] is not None else '-',
+                 row['processes'],
+                 f"{row['age_seconds'] / 60:.0f} min" if row['age_seconds'] is not None else '-',
+                 f"recycle: {row['recycle']}" if row['recycle'] else 'ok')
+                for row in browsers.get('browsers', [])])
+
+        openai_usage = sources.get('openai')
+        requests = counts.get('openai_requests', {})
+        if openai_usage and 'error' not in openai_usage:
+            self.summary_labels['openai'].config(
+                text=f"{openai_usage['requests_minute']} / {openai_usage['limit_minute']} per min")
+            self.summary_labels['spend'].config(
+                text=f"${openai_usage['spend_today']:.2f} / ${openai_usage['daily_budget']:.2f} today")
+            self._fill(self.openai_tree, [
+                ('Requests (1 min)', openai_usage['requests_minute'], openai_usage['limit_minute']),
+                ('Requests (1 hour)', openai_usage['requests_hour'], openai_usage['limit_hour']),
+                ('Failed requests (1 hour)', requests.get('failed', {}).get('hour', 0), '-'),
+                ('Spend today', f"${openai_usage['spend_today']:.2f}", f"${openai_usage['daily_budget']:.2f}"),
+                ('Spend this month', f"${openai_usage['spend_month']:.2f}", f"${openai_usage['monthly_budget']:.2f}"),
+            ])
+
+        ui = sources.get('ui')
+        if ui and 'error' not in ui:
+            self.summary_labels['ui'].config(text=f"{ui['stalls_total']} (worst {ui['max_lag_ms']:.0f} ms)")
+            self._fill(self.stalls_tree, [
+                (stall['time'], f"{stall['duration_ms']:.0f} ms", stall['origin']) for stall in ui['recent']])
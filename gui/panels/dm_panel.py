@@ -2,8 +2,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
 import threading
-from selenium_manager import send_dm
-from utils import log_to_file
+from campaign_engine import CampaignEngine
+from log_bus import get_log_bus
+from tracing import traced
 
 class DmPanel(ttk.Frame):
     def __init__(self, parent, accounts):
@@ -14,6 +15,7 @@ class DmPanel(ttk.Frame):
         self.recipient_entry = None
         self.message_entry = None
         self.log_text = None
+        self.log_channel = get_log_bus().channel('dm', file_name='dm')
         self.selected_tag = None
         self.tag_filter_dropdown = None
         # State persistence
@@ -21,7 +23,6 @@ class DmPanel(ttk.Frame):
             'selected_tag': 'All',
             'recipient': '',
             'message': '',
-            'log_messages': []
         }
 
     def build_panel(self):
@@ -111,12 +112,8 @@ class DmPanel(ttk.Frame):
         self.refresh_accounts_list()
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for message in self.state['log_messages']:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
 
     def refresh_accounts_list(self):
         """Refresh the accounts listbox based on selected tag filter"""
@@ -127,19 +124,11 @@ class DmPanel(ttk.Frame):
             tags_text = f" [{', '.join(acc.tags)}]" if acc.tags else ""
             self.accounts_listbox.insert('end', f"{acc.label} ({acc.username}){tags_text}")
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         if is_error:
             message = f"❌ {message}"
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        self.log_text.config(state='disabled')
-        # Save to state
-        self.state['log_messages'].append(message)
-        # Keep only last 100 messages to prevent memory issues
-        if len(self.state['log_messages']) > 100:
-            self.state['log_messages'] = self.state['log_messages'][-100:]
-        log_to_file('dm', message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error, **fields)
 
     def send_dm_bulk(self):
         selected_indices = self.accounts_listbox.curselection()
@@ -157,13 +146,36 @@ class DmPanel(ttk.Frame):
         filtered_accounts = [a for a in self.accounts if tag == 'All' or tag in a.tags]
         selected_accounts = [filtered_accounts[i] for i in selected_indices]
         
-        threading.Thread(target=self._send_dm_sequential, args=(selected_accounts, recipient, message)).start()
+        # The same campaign engine the headless runner uses
+        campaign = {
+            'name': 'dm',
+            'min_interval': 0,
+            'max_interval': 0,
+            'jobs': [{
+                'action': 'dm',
+                'recipient': recipient,
+                'message': message,
+                'accounts': [acc.label for acc in selected_accounts]
+            }]
+        }
+        engine = CampaignEngine(campaign, on_event=self._on_engine_event)
+        threading.Thread(target=self._send_dm_sequential, args=(engine,), daemon=True).start()
+
+    @traced()
+    def _send_dm_sequential(self, engine):
+        try:
+            engine.run()
+        except Exception as e:
+            self.log(f"Error sending DMs: {e}", is_error=True)
 
-    def _send_dm_sequential(self, accounts, recipient, message):
-        for acc in accounts:
-            self.log(f"[{acc.label}] Sending DM...")
-            success, msg = send_dm(acc, recipient, message)
-            if success:
-                self.log(f"[{acc.label}] ✅ {msg}")
+    def _on_engine_event(self, event):
+        """Campaign engine events (worker thread) as log lines"""
+        kind = event['event']
+        if kind == 'log':
+            self.log(event['message'], is_error=event['level'] == 'error')
+        elif kind == 'action':
+            if event['success']:
+                self.log(f"[{event['account']}] ✅ {event['message']}", account=event['account'], action=event['action'])
             else:
-                self.log(f"[{acc.label}] {msg}", is_error=True) 
\ No newline at end of file
+                self.log(f"[{event['account']}] {event['message']}", is_error=True,
+                         account=event['account'], action=event['action'])
@@ -1,37 +1,158 @@
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime, timedelta
 from constants import COLOR_TAUPE, COLOR_DARK
+from history_store import get_history_store
+from ui_events import get_ui_events
+
+# Rows shown per page
+HISTORY_PAGE_SIZE = 100
+
+OUTCOME_FILTERS = {'All': None, 'Success': True, 'Failed': False}
 
 class HistoryPanel(ttk.Frame):
-    def __init__(self, parent, history=None):
+    def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self.history = history or ["Sample action 1", "Sample action 2"]
-        self.history_listbox = None
+        self.store = get_history_store()
+        self.ui_events = get_ui_events()
+        self.history_tree = None
+        self.page_label = None
+        self.cursors = [None]  # cursor for each visited page; the last one is the current page
+        self.next_cursor = None
 
     def build_panel(self):
         title = tk.Label(self, text="History", font=('Segoe UI', 16, 'bold'), bg=COLOR_TAUPE, fg=COLOR_DARK)
         title.pack(anchor='nw', padx=20, pady=(20, 10))
-        # History list
-        self.history_listbox = tk.Listbox(self, height=8)
-        self.refresh_history_listbox()
-        self.history_listbox.pack(anchor='nw', padx=20, pady=5)
-        # Action buttons
+        # Filters
+        filter_frame = tk.Frame(self, bg=COLOR_TAUPE)
+        filter_frame.pack(anchor='nw', padx=20, pady=5)
+        ttk.Label(filter_frame, text="Account:").pack(side='left')
+        self.account_filter = ttk.Combobox(filter_frame, width=18, state='readonly', postcommand=self._load_account_choices)
+        self.account_filter.set('All')
+        self.account_filter.pack(side='left', padx=(2, 10))
+        ttk.Label(filter_frame, text="Outcome:").pack(side='left')
+        self.outcome_filter = ttk.Combobox(filter_frame, width=9, state='readonly', values=list(OUTCOME_FILTERS))
+        self.outcome_filter.set('All')
+        self.outcome_filter.pack(side='left', padx=(2, 10))
+        ttk.Label(filter_frame, text="From (YYYY-MM-DD):").pack(side='left')
+        self.since_entry = ttk.Entry(filter_frame, width=11)
+        self.since_entry.pack(side='left', padx=(2, 10))
+        ttk.Label(filter_frame, text="To:").pack(side='left')
+        self.until_entry = ttk.Entry(filter_frame, width=11)
+        self.until_entry.pack(side='left', padx=(2, 10))
+        ttk.Button(filter_frame, text="Apply", command=self.refresh_history).pack(side='left')
+        # History table
+        columns = ('time', 'account', 'action', 'target', 'outcome', 'latency', 'error')
+        headings = ('Time', 'Account', 'Action', 'Target', 'Outcome', 'Latency', 'Error')
+        widths = (130, 110, 90, 220, 70, 70, 200)
+        table_frame = ttk.Frame(self)
+        table_frame.pack(fill='both', expand=True, padx=20, pady=5)
+        self.history_tree = ttk.Treeview(table_frame, columns=columns, show='headings')
+        for column, heading, width in zip(columns, headings, widths):
+            self.history_tree.heading(column, text=heading)
+            self.history_tree.column(column, width=width, anchor='w')
+        scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.history_tree.yview)
+        self.history_tree.configure(yscrollcommand=scrollbar.set)
+        self.history_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        # Paging and action buttons
         btn_frame = tk.Frame(self, bg=COLOR_TAUPE)
-        btn_frame.pack(anchor='nw', padx=20, pady=5)
+        btn_frame.pack(anchor='nw', padx=20, pady=(5, 20))
+        ttk.Button(btn_frame, text="◀ Newer", command=self.previous_page).pack(side='left', padx=2)
+        ttk.Button(btn_frame, text="Older ▶", command=self.next_page).pack(side='left', padx=2)
+        self.page_label = tk.Label(btn_frame, text="", bg=COLOR_TAUPE, fg=COLOR_DARK)
+        self.page_label.pack(side='left', padx=10)
         ttk.Button(btn_frame, text="Clear History", command=self.clear_history).pack(side='left', padx=2)
         ttk.Button(btn_frame, text="Export History", command=self.export_history).pack(side='left', padx=2)
+        self.refresh_history()
+
+    def _load_account_choices(self):
+        self.account_filter['values'] = ['All'] + self.store.accounts()
+
+    def _parse_day(self, entry, label):
+        text = entry.get().strip()
+        if not text:
+            return None
+        try:
+            return datetime.strptime(text, '%Y-%m-%d')
+        except ValueError:
+            raise ValueError(f"{label} date must look like 2024-01-31")
+
+    def get_filters(self):
+        """Store filters from the filter widgets (the To day is inclusive)"""
+        since = self._parse_day(self.since_entry, "From")
+        until = self._parse_day(self.until_entry, "To")
+        account = self.account_filter.get()
+        return {
+            'account': None if account == 'All' else account,
+            'success': OUTCOME_FILTERS.get(self.outcome_filter.get()),
+            'since': since.timestamp() if since else None,
+            'until': (until + timedelta(days=1)).timestamp() if until else None,
+        }
 
-    def refresh_history_listbox(self):
-        if self.history_listbox:
-            self.history_listbox.delete(0, 'end')
-            for item in self.history:
-                self.history_listbox.insert('end', str(item))
+    def refresh_history(self):
+        """Go back to the newest page with the current filters"""
+        self.cursors = [None]
+        self.show_page()
+
+    def show_page(self):
+        if not self.history_tree:
+            return
+        try:
+            filters = self.get_filters()
+        except ValueError as e:
+            messagebox.showerror("History", str(e))
+            return
+        rows, self.next_cursor = self.store.query(limit=HISTORY_PAGE_SIZE, cursor=self.cursors[-1], **filters)
+        self.history_tree.delete(*self.history_tree.get_children())
+        for row in rows:
+            latency = f"{row['latency_ms'] / 1000:.1f}s" if row['latency_ms'] is not None else '-'
+            error = f"{row['error_class']}: {row['message']}" if not row['success'] else ''
+            self.history_tree.insert('', 'end', iid=str(row['id']), values=(
+                datetime.fromtimestamp(row['ts']).strftime('%Y-%m-%d %H:%M:%S'), row['account'], row['action'],
+                row['target'] or '', 'success' if row['success'] else 'failed', latency, error))
+        total = self.store.count(**filters)
+        pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+        self.page_label.config(text=f"Page {len(self.cursors)} of {pages} ({total} actions)")
+
+    def next_page(self):
+        if self.next_cursor is not None:
+            self.cursors.append(self.next_cursor)
+            self.show_page()
+
+    def previous_page(self):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+            self.show_page()
 
     def clear_history(self):
         confirm = messagebox.askyesno("Clear History", "Are you sure you want to clear all history?")
         if confirm:
-            self.history.clear()
-            self.refresh_history_listbox()
-            print("[HISTORY PANEL] Cleared history.")
-            messagebox.showinfo("Clear History", "History cleared.") 
\ No newline at end of file
+            removed = self.store.clear()
+            self.refresh_history()
+            print(f"[HISTORY PANEL] Cleared {removed} history rows.")
+            messagebox.showinfo("Clear History", "History cleared.")
+
+    def export_history(self):
+        """Export the rows matching the current filters to CSV or JSONL"""
+        try:
+            filters = self.get_filters()
+        except ValueError as e:
+            messagebox.showerror("Export History", str(e))
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export History", defaultextension='.csv',
+            filetypes=[('CSV files', '*.csv'), ('JSON Lines files', '*.jsonl')])
+        if not path:
+            return
+        fmt = 'jsonl' if path.lower().endswith(('.jsonl', '.json')) else 'csv'
+
+        def worker():
+            try:
+                written = self.store.export(path, fmt=fmt, **filters)
+                self.ui_events.call(messagebox.showinfo, "Export History", f"Exported {written} actions to {path}")
+            except Exception as e:
+                self.ui_events.call(messagebox.showerror, "Export History", f"Export failed: {e}")
+        threading.Thread(target=worker, name='history-export', daemon=True).start()
@@ -3,12 +3,11 @@ from tkinter import ttk, messagebox, scrolledtext
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
 import threading
 import time
-import random
-from selenium_manager import get_global_driver_manager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from log_bus import get_log_bus
+from ui_events import get_ui_events
+from tracing import traced
+from campaign_engine import CampaignEngine
+from run_journal import RunJournal, latest_unfinished_run
 
 class LikeRetweetPanel(ttk.Frame):
     def __init__(self, parent, accounts):
@@ -16,10 +15,13 @@ class LikeRetweetPanel(ttk.Frame):
         self.parent = parent
         self.accounts = accounts
         self.log_text = None
+        self.log_channel = get_log_bus().channel('like_retweet')
+        self.ui_events = get_ui_events()
         self.progress_bar = None
         self.progress_label = None
         self.is_running = False
         self.paused = False
+        self.engine = None
         
         # State persistence
         self.state = {
@@ -28,8 +30,7 @@ class LikeRetweetPanel(ttk.Frame):
             'max_interval': '30',
             'enable_retweet': True,
             'enable_like': True,
-            'enable_random_retweet': False,
-            'log_messages': []
+            'enable_random_retweet': False
         }
 
     def build_panel(self):
@@ -160,16 +161,8 @@ class LikeRetweetPanel(ttk.Frame):
         timestamp = time.strftime("%H:%M:%S")
         log_message = f"[{timestamp}] {message}"
         
-        if self.log_text:
-            self.log_text.config(state='normal')
-            self.log_text.insert(tk.END, log_message + "\n")
-            self.log_text.see(tk.END)
-            self.log_text.config(state='disabled')
-        
-        # Store in state
-        self.state['log_messages'].append(log_message)
-        if len(self.state['log_messages']) > 100:  # Keep only last 100 messages
-            self.state['log_messages'] = self.state['log_messages'][-100:]
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(log_message, is_error)
 
     def restore_state(self):
         """Restore panel state"""
@@ -178,12 +171,7 @@ class LikeRetweetPanel(ttk.Frame):
             self.tweet_urls_text.insert('1.0', self.state['tweet_urls'])
         
         # Restore log messages
-        if self.state['log_messages']:
-            for message in self.state['log_messages']:
-                if self.log_text:
-                    self.log_text.config(state='normal')
-                    self.log_text.insert(tk.END, message + "\n")
-                    self.log_text.config(state='disabled')
+        self.log_channel.attach(self.log_text)
 
     def save_state(self):
         """Save current panel state"""
@@ -198,6 +186,16 @@ class LikeRetweetPanel(ttk.Frame):
         """Start the like and retweet process"""
         # Save state
         self.save_state()
+
+        # A run cut short by a crash or Stop can pick up where it left off
+        journal = latest_unfinished_run('like_retweet')
+        if journal:
+            if messagebox.askyesno("Resume Run", f"An unfinished like/retweet run was found ({journal.describe()}).\n\n"
+                                                 "Resume it where it stopped?"):
+                self.log(f"♻️ Resuming run {journal.run_id}")
+                self._start_engine(journal.params, journal)
+                return
+            journal.finish('abandoned')
         
         # Get settings
         tweet_urls_text = self.tweet_urls_text.get('1.0', tk.END).strip()
@@ -224,7 +222,26 @@ class LikeRetweetPanel(ttk.Frame):
         # Parse tweet URLs
         tweet_urls = [url.strip() for url in tweet_urls_text.split('\n') if url.strip()]
         
-        # Start processing
+        # The same campaign engine the headless runner uses
+        campaign = {
+            'name': 'like_retweet',
+            'min_interval': min_interval,
+            'max_interval': max_interval,
+            'jobs': [{
+                'action': 'like_retweet',
+                'tweets': tweet_urls,
+                'accounts': [acc.label for acc in selected_accounts],
+                'like': self.enable_like_var.get(),
+                'retweet': self.enable_retweet_var.get(),
+                'random_retweet': self.enable_random_retweet_var.get()
+            }]
+        }
+        self.log(f"🚀 Starting like/retweet process with {len(selected_accounts)} accounts")
+        self.log(f"📊 Total tweets to process: {len(tweet_urls)}")
+        self._start_engine(campaign, RunJournal.create('like_retweet', campaign))
+
+    def _start_engine(self, campaign, journal):
+        """Run a campaign in the worker thread, checkpointed to journal"""
         self.is_running = True
         self.paused = False
         
@@ -233,15 +250,15 @@ class LikeRetweetPanel(ttk.Frame):
         self.stop_button.config(state='normal')
         self.pause_button.config(state='normal')
         
-        # Start worker thread
-        threading.Thread(target=self._like_retweet_worker, 
-                       args=(tweet_urls, selected_accounts, min_interval, max_interval),
-                       daemon=True).start()
+        self.engine = CampaignEngine(campaign, on_event=self._on_engine_event, journal=journal)
+        threading.Thread(target=self._like_retweet_worker, args=(self.engine,), daemon=True).start()
 
     def stop_like_retweet(self):
         """Stop the like and retweet process"""
         self.is_running = False
         self.paused = False
+        if self.engine:
+            self.engine.stop()
         
         # Update UI
         self.start_button.config(state='normal')
@@ -255,10 +272,14 @@ class LikeRetweetPanel(ttk.Frame):
         """Pause/resume the like and retweet process"""
         if self.paused:
             self.paused = False
+            if self.engine:
+                self.engine.resume()
             self.pause_button.config(text="⏸️ Pause")
             self.log("▶️ Process resumed")
         else:
             self.paused = True
+            if self.engine:
+                self.engine.pause()
             self.pause_button.config(text="▶️ Resume")
             self.log("⏸️ Process paused")
 
@@ -278,182 +299,37 @@ class LikeRetweetPanel(ttk.Frame):
             messagebox.showerror("Error", f"Error loading URLs from file: {e}")
             self.log(f"Error loading URLs from file: {e}", is_error=True)
 
-    def _like_retweet_worker(self, tweet_urls, accounts, min_interval, max_interval):
+    @traced()
+    def _like_retweet_worker(self, engine):
         """Worker thread for like and retweet processing"""
         try:
-            total_tweets = len(tweet_urls)
-            processed = 0
-            success_count = 0
-            failed_count = 0
-            
-            # Determine which tweets to retweet if random retweet is enabled
-            tweets_to_retweet = set()
-            if self.enable_random_retweet_var.get():
-                import random
-                # Select 20% of tweets randomly for retweeting
-                num_to_retweet = max(1, int(total_tweets * 0.2))  # At least 1 tweet
-                tweets_to_retweet = set(random.sample(range(total_tweets), num_to_retweet))
-                self.log(f"🎲 Random retweet enabled: Will retweet {len(tweets_to_retweet)} out of {total_tweets} tweets (20%)")
-            
-            self.log(f"🚀 Starting like/retweet process with {len(accounts)} accounts")
-            self.log(f"📊 Total tweets to process: {total_tweets}")
-            
-            for i, tweet_url in enumerate(tweet_urls):
-                if not self.is_running:
-                    break
-                
-                # Wait if paused
-                while self.paused and self.is_running:
-                    time.sleep(1)
-                
-                if not self.is_running:
-                    break
-                
-                # Update progress
-                processed += 1
-                progress = (processed / total_tweets) * 100
-                
-                self.after(0, lambda p=progress, proc=processed, succ=success_count, fail=failed_count: 
-                          self._update_progress(p, proc, succ, fail))
-                
-                # Check if this tweet should be retweeted (for random retweet mode)
-                should_retweet_this_tweet = i in tweets_to_retweet if self.enable_random_retweet_var.get() else True
-                
-                self.log(f"📝 Processing tweet {processed}/{total_tweets}: {tweet_url}")
-                if self.enable_random_retweet_var.get():
-                    retweet_status = "🎲 Will retweet" if should_retweet_this_tweet else "⏭️ Skip retweet"
-                    self.log(f"  {retweet_status}")
-                
-                # Process with each account
-                for account in accounts:
-                    if not self.is_running:
-                        break
-                    
-                    try:
-                        success = self._process_tweet_with_account(account, tweet_url, min_interval, max_interval, should_retweet_this_tweet)
-                        if success:
-                            success_count += 1
-                        else:
-                            failed_count += 1
-                    except Exception as e:
-                        self.log(f"❌ Error processing with {account.label}: {e}", is_error=True)
-                        failed_count += 1
-                    
-                    # Wait between accounts
-                    if account != accounts[-1]:
-                        wait_time = random.randint(min_interval, max_interval)
-                        self.log(f"⏱️ Waiting {wait_time} seconds before next account...")
-                        time.sleep(wait_time)
-                
-                # Wait between tweets
-                if i < len(tweet_urls) - 1:
-                    wait_time = random.randint(min_interval, max_interval)
-                    self.log(f"⏱️ Waiting {wait_time} seconds before next tweet...")
-                    time.sleep(wait_time)
-            
-            # Final update
-            self.after(0, lambda: self._update_progress(100, processed, success_count, failed_count))
-            self.log(f"✅ Process completed! Success: {success_count}, Failed: {failed_count}")
-            
+            summary = engine.run()
+            if summary['stopped']:
+                engine.journal.close()
+                self.log("💾 Progress saved - press Start to resume this run")
+            else:
+                engine.journal.finish('completed')
+                self.log(f"✅ Process completed! Success: {summary['succeeded']}, Failed: {summary['failed']}")
         except Exception as e:
+            engine.journal.close()
             self.log(f"❌ Error in worker thread: {e}", is_error=True)
         finally:
-            self.after(0, self.stop_like_retweet)
-
-    def _process_tweet_with_account(self, account, tweet_url, min_interval, max_interval, should_retweet):
-        """Process a single tweet with one account"""
-        try:
-            driver_manager = get_global_driver_manager()
-            driver = driver_manager.get_driver(account)
-            
-            if not driver:
-                self.log(f"❌ No browser session for {account.label}")
-                return False
-            
-            # Navigate to tweet
-            self.log(f"🌐 Navigating to tweet with {account.label}")
-            driver.get(tweet_url)
-            time.sleep(3)
-            
-            # Check if logged in
-            current_url = driver.current_url
-            if 'login' in current_url or 'i/flow/login' in current_url:
-                self.log(f"❌ {account.label} is not logged in")
-                return False
-            
-            success = True
-            
-            # Like the tweet
-            if self.enable_like_var.get():
-                if self._like_tweet(driver):
-                    self.log(f"❤️ Liked tweet with {account.label}")
-                else:
-                    self.log(f"❌ Failed to like tweet with {account.label}")
-                    success = False
-            
-            # Retweet the tweet (only if should_retweet is True)
-            if self.enable_retweet_var.get() and should_retweet:
-                if self._retweet_tweet(driver):
-                    self.log(f"🔄 Retweeted with {account.label}")
-                else:
-                    self.log(f"❌ Failed to retweet with {account.label}")
-                    success = False
-            elif self.enable_retweet_var.get() and not should_retweet:
-                self.log(f"⏭️ Skipped retweet with {account.label} (random mode)")
-            
-            return success
-            
-        except Exception as e:
-            self.log(f"❌ Error processing tweet with {account.label}: {e}", is_error=True)
-            return False
+            self.ui_events.call(self.stop_like_retweet)
 
-    def _like_tweet(self, driver):
-        """Like a tweet"""
-        try:
-            # Find and click like button
-            like_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="like"]'))
-            )
-            
-            # Check if already liked
-            aria_label = like_button.get_attribute('aria-label')
-            if 'Liked' in aria_label:
-                return True  # Already liked
-            
-            like_button.click()
-            time.sleep(2)
-            return True
-            
-        except (TimeoutException, NoSuchElementException) as e:
-            return False
-
-    def _retweet_tweet(self, driver):
-        """Retweet a tweet"""
-        try:
-            # Find and click retweet button
-            retweet_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweet"]'))
-            )
-            
-            # Check if already retweeted
-            aria_label = retweet_button.get_attribute('aria-label')
-            if 'Retweeted' in aria_label:
-                return True  # Already retweeted
-            
-            retweet_button.click()
-            time.sleep(1)
-            
-            # Click "Retweet" in the dropdown
-            retweet_confirm = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="retweetConfirm"]'))
-            )
-            retweet_confirm.click()
-            time.sleep(2)
-            
-            return True
-            
-        except (TimeoutException, NoSuchElementException) as e:
-            return False
+    def _on_engine_event(self, event):
+        """Campaign engine events (worker thread) as log lines and progress"""
+        kind = event['event']
+        if kind == 'log':
+            self.log(event['message'], is_error=event['level'] == 'error')
+        elif kind == 'action':
+            if event['success']:
+                self.log(f"❤️ {event['message'] or 'Done'} with {event['account']}")
+            else:
+                self.log(f"❌ {event['message'] or 'Failed'} with {event['account']}", is_error=True)
+        elif kind == 'progress':
+            progress = (event['done'] / event['total']) * 100 if event['total'] else 100
+            self.ui_events.progress((self, 'progress'), self._update_progress,
+                                    progress, event['done'], event['succeeded'], event['failed'])
 
     def _update_progress(self, progress, processed, success, failed):
         """Update progress bar and stats"""
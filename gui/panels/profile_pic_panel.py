@@ -3,7 +3,8 @@ from tkinter import ttk, messagebox, filedialog
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
 import threading
 from selenium_manager import change_profile_pic
-from utils import log_to_file
+from log_bus import get_log_bus
+from tracing import traced
 
 class ProfilePicPanel(ttk.Frame):
     def __init__(self, parent, accounts):
@@ -14,6 +15,7 @@ class ProfilePicPanel(ttk.Frame):
         self.account_var = None
         self.image_path_var = None
         self.log_text = None
+        self.log_channel = get_log_bus().channel('profile_pic', file_name='profile_pic')
         self.selected_tag = None
         self.tag_filter_dropdown = None
         self.account_dropdown = None
@@ -22,7 +24,6 @@ class ProfilePicPanel(ttk.Frame):
             'selected_tag': 'All',
             'selected_account': '',
             'image_path': '',
-            'log_messages': []
         }
 
     def build_panel(self):
@@ -71,12 +72,8 @@ class ProfilePicPanel(ttk.Frame):
         self.refresh_accounts_dropdown()
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for message in self.state['log_messages']:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled')
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
 
     def refresh_accounts_dropdown(self):
         """Refresh the accounts dropdown based on selected tag filter"""
@@ -97,19 +94,11 @@ class ProfilePicPanel(ttk.Frame):
             self.account_var.set('')
             self.state['selected_account'] = ''
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         if is_error:
             message = f"❌ {message}"
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        self.log_text.config(state='disabled')
-        # Save to state
-        self.state['log_messages'].append(message)
-        # Keep only last 100 messages to prevent memory issues
-        if len(self.state['log_messages']) > 100:
-            self.state['log_messages'] = self.state['log_messages'][-100:]
-        log_to_file('profile_pic', message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error, **fields)
 
     def browse_image(self):
         path = filedialog.askopenfilename(title="Select Profile Picture", filetypes=[("Image Files", "*.png;*.jpg;*.jpeg")])
@@ -146,9 +135,10 @@ class ProfilePicPanel(ttk.Frame):
         self.log(f"[{acc.label}] Uploading profile pic...")
         threading.Thread(target=self._upload_pic_task, args=(acc, image_path)).start()
 
+    @traced()
     def _upload_pic_task(self, acc, image_path):
         success, msg = change_profile_pic(acc, image_path)
         if success:
-            self.log(f"[{acc.label}] ✅ {msg}")
+            self.log(f"[{acc.label}] ✅ {msg}", account=acc.label, action='profile_pic')
         else:
-            self.log(f"[{acc.label}] {msg}", is_error=True) 
\ No newline at end of file
+            self.log(f"[{acc.label}] {msg}", is_error=True, account=acc.label, action='profile_pic') 
\ No newline at end of file
@@ -2,17 +2,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK
 import threading
-from selenium_manager import reply_to_tweet, reply_to_comment, scrape_tweet_content_and_comments
-from utils import log_to_file
-from selenium.webdriver.chrome.options import Options
-import undetected_chromedriver as uc
+from selenium_manager import reply_to_tweet, scrape_tweet_content_and_comments, get_global_driver_manager
+from log_bus import get_log_bus
+from ui_events import get_ui_events
+from tracing import traced
+from campaign_engine import CampaignEngine
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import os
-import pickle
-import random
 import re
 
 class ReplyCommentPanel(ttk.Frame):
@@ -26,6 +25,9 @@ class ReplyCommentPanel(ttk.Frame):
         self.comments_listbox = None
         self.reply_entry = None
         self.log_text = None
+        self.log_channel = get_log_bus().channel('reply_comment', file_name='reply_comment')
+        self.auto_log_channel = get_log_bus().channel('reply_comment_auto', file_name='reply_comment_auto')
+        self.ui_events = get_ui_events()
         self.comments = []  # List of (username, text)
         self.driver = None  # Keep browser open after loading comments
         
@@ -39,6 +41,7 @@ class ReplyCommentPanel(ttk.Frame):
         self.auto_running = False
         self.auto_paused = False
         self.auto_stats = {'processed': 0, 'successful': 0, 'failed': 0}
+        self.auto_engine = None
 
     def build_panel(self):
         title = tk.Label(self, text="Reply to Comments", font=('Segoe UI', 16, 'bold'), bg=COLOR_TAUPE, fg=COLOR_DARK)
@@ -106,6 +109,7 @@ class ReplyCommentPanel(ttk.Frame):
         
         self.log_text = tk.Text(log_frame, height=8, state='disabled', bg=COLOR_DARK, fg='white')
         self.log_text.pack(fill='both', expand=True)
+        self.log_channel.attach(self.log_text)
 
     def _build_auto_tab(self):
         """Build the auto reply tab"""
@@ -195,6 +199,7 @@ class ReplyCommentPanel(ttk.Frame):
         
         self.auto_log_text = tk.Text(auto_log_frame, height=8, state='disabled', bg=COLOR_DARK, fg='white')
         self.auto_log_text.pack(fill='both', expand=True)
+        self.auto_log_channel.attach(self.auto_log_text)
 
     def refresh_accounts_list(self):
         """Refresh the accounts list in manual tab"""
@@ -210,23 +215,16 @@ class ReplyCommentPanel(ttk.Frame):
             for acc in self.accounts:
                 self.auto_accounts_listbox.insert('end', f"{acc.label} ({acc.username})")
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         if is_error:
             message = f"❌ {message}"
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        self.log_text.config(state='disabled')
-        log_to_file('reply_comment', message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error, **fields)
 
-    def auto_log(self, message, is_error=False):
+    def auto_log(self, message, is_error=False, **fields):
         if is_error:
             message = f"❌ {message}"
-        self.auto_log_text.config(state='normal')
-        self.auto_log_text.insert('end', message + '\n')
-        self.auto_log_text.see('end')
-        self.auto_log_text.config(state='disabled')
-        log_to_file('reply_comment_auto', message)
+        self.auto_log_channel.write(message, is_error, **fields)
 
     def load_comments(self):
         tweet_url = self.tweet_url_entry.get().strip()
@@ -241,82 +239,47 @@ class ReplyCommentPanel(ttk.Frame):
         self.log(f"Loading comments for {tweet_url} using [{acc.label}]...")
         threading.Thread(target=self._scrape_comments, args=(acc, tweet_url)).start()
 
+    @traced()
     def _scrape_comments(self, acc, tweet_url):
         try:
-            options = Options()
-            options.add_argument('--start-maximized')
-            # Add anti-detection options
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            # Core optimizations (reduced for faster startup)
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-plugins')
-            options.add_argument('--disable-images')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-dev-shm-usage')
-            
-            # Memory optimizations
-            options.add_argument('--disable-background-timer-throttling')
-            options.add_argument('--disable-backgrounding-occluded-windows')
-            options.add_argument('--disable-renderer-backgrounding')
-            
-            # Startup optimizations
-            options.add_argument('--no-first-run')
-            options.add_argument('--no-default-browser-check')
-            options.add_argument('--disable-default-apps')
-            options.add_argument('--disable-sync')
-            
-            if acc.proxy:
-                options.add_argument(f'--proxy-server={acc.proxy}')
-            
-            driver = uc.Chrome(options=options)
-            
-            # Execute script to remove webdriver property
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver = driver  # Keep browser open for future use
-            cookie_path = acc.get_cookie_path()
-            if os.path.exists(cookie_path):
-                with open(cookie_path, 'rb') as f:
-                    cookies = pickle.load(f)
-                driver.get('https://x.com/')
-                time.sleep(2)  # Reduced from default
-                for cookie in cookies:
+            # Scrape in the account's headless reader session (kept open for reuse)
+            with get_global_driver_manager().lease(acc.label, 'reader'):
+                driver = get_global_driver_manager().get_reader_driver(acc)
+                if not driver:
+                    self.log(f"Failed to open reader session for [{acc.label}]", is_error=True)
+                    return
+                self.driver = driver
+                driver.get(tweet_url)
+                time.sleep(3)  # Reduced from 5 to 3 seconds
+                # Scroll to load more comments
+                for _ in range(3):
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    time.sleep(1)  # Reduced from 2 to 1 second
+                # Scrape visible comments (replies)
+                comments = []
+                articles = driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]')
+                self.log(f"[DEBUG] Found {len(articles)} article[data-testid='tweet'] elements.")
+                for idx, article in enumerate(articles[1:], start=1):  # Skip the first (main tweet)
                     try:
-                        driver.add_cookie(cookie)
+                        user_elem = article.find_element(By.CSS_SELECTOR, 'div[dir="ltr"] span')
+                        username = user_elem.text
                     except Exception:
-                        pass
-            driver.get(tweet_url)
-            time.sleep(3)  # Reduced from 5 to 3 seconds
-            # Scroll to load more comments
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)  # Reduced from 2 to 1 second
-            # Scrape visible comments (replies)
-            comments = []
-            articles = driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]')
-            self.log(f"[DEBUG] Found {len(articles)} article[data-testid='tweet'] elements.")
-            for idx, article in enumerate(articles[1:], start=1):  # Skip the first (main tweet)
-                try:
-                    user_elem = article.find_element(By.CSS_SELECTOR, 'div[dir="ltr"] span')
-                    username = user_elem.text
-                except Exception:
-                    username = None
-                try:
-                    text_elem = article.find_element(By.CSS_SELECTOR, 'div[data-testid="tweetText"]')
-                    text = text_elem.text[:80]
-                except Exception:
+                        username = None
                     try:
-                        text_elem = article.find_element(By.CSS_SELECTOR, 'span')
+                        text_elem = article.find_element(By.CSS_SELECTOR, 'div[data-testid="tweetText"]')
                         text = text_elem.text[:80]
                     except Exception:
-                        text = None
-                if username and text:
-                    comments.append((username, text))
-            # Do NOT close the browser here
-            self.comments = comments
-            self._update_comments_listbox()
-            self.log(f"Loaded {len(comments)} comments.")
+                        try:
+                            text_elem = article.find_element(By.CSS_SELECTOR, 'span')
+                            text = text_elem.text[:80]
+                        except Exception:
+                            text = None
+                    if username and text:
+                        comments.append((username, text))
+                # Do NOT close the browser here
+                self.comments = comments
+                self.ui_events.state((self, 'comments'), self._update_comments_listbox)
+                self.log(f"Loaded {len(comments)} comments.")
         except Exception as e:
             self.log(f"Error loading comments: {e}", is_error=True)
 
@@ -347,15 +310,16 @@ class ReplyCommentPanel(ttk.Frame):
         selected_comment = self.comments[comment_idx[0]] if self.comments else (None, None)
         threading.Thread(target=self._reply_comment_sequential, args=(selected_accounts, tweet_url, reply_text, selected_comment)).start()
 
+    @traced()
     def _reply_comment_sequential(self, accounts, tweet_url, reply_text, selected_comment):
         for acc in accounts:
             self.log(f"[{acc.label}] Sending reply to comment @{selected_comment[0]}: {selected_comment[1]}")
             # For now, still reply to parent tweet (can be enhanced to reply to comment directly)
             success, msg = reply_to_tweet(acc, tweet_url, reply_text)
             if success:
-                self.log(f"[{acc.label}] ✅ {msg}")
+                self.log(f"[{acc.label}] ✅ {msg}", account=acc.label, action='reply')
             else:
-                self.log(f"[{acc.label}] {msg}", is_error=True)
+                self.log(f"[{acc.label}] {msg}", is_error=True, account=acc.label, action='reply')
 
     # Auto reply methods
     def start_auto_reply(self):
@@ -399,213 +363,92 @@ class ReplyCommentPanel(ttk.Frame):
         self.auto_stats = {'processed': 0, 'successful': 0, 'failed': 0}
         
         # Update UI
-        self.start_auto_btn.config(state='disabled')
-        self.stop_auto_btn.config(state='normal')
-        self.pause_auto_btn.config(state='normal')
-        
-        # Start worker thread
-        threading.Thread(target=self._auto_reply_worker, 
-                       args=(urls, selected_accounts, reply_text, comments_count, min_interval, max_interval)).start()
+        self._set_auto_buttons(True)
+        
+        # The same campaign engine the headless runner uses
+        campaign = {
+            'name': 'reply_comment_auto',
+            'min_interval': min_interval,
+            'max_interval': max_interval,
+            'jobs': [{
+                'action': 'reply_comments',
+                'tweets': urls,
+                'text': reply_text,
+                'comments': comments_count,
+                'accounts': [acc.label for acc in selected_accounts]
+            }]
+        }
+        self.auto_log(f"🚀 Starting Auto Reply with {len(selected_accounts)} accounts...")
+        self.auto_log(f"📊 Comments to scrape per tweet: {comments_count}")
+        self.auto_log(f"⏱️ Time interval: {min_interval}-{max_interval} seconds")
+        self.auto_log(f"📝 Reply text: {reply_text[:50]}...")
+        self.auto_engine = CampaignEngine(campaign, on_event=self._on_auto_engine_event)
+        threading.Thread(target=self._auto_reply_worker, args=(self.auto_engine,), daemon=True).start()
 
     def stop_auto_reply(self):
         """Stop the auto reply process"""
         self.auto_running = False
         self.auto_paused = False
-        self.start_auto_btn.config(state='normal')
-        self.stop_auto_btn.config(state='disabled')
-        self.pause_auto_btn.config(state='disabled')
+        if self.auto_engine:
+            self.auto_engine.stop()
+        self._set_auto_buttons(False)
         self.auto_log("⏹️ Auto reply stopped by user.")
 
+    def _set_auto_buttons(self, running):
+        """Enable the auto reply controls for a running or stopped process"""
+        self.start_auto_btn.config(state='disabled' if running else 'normal')
+        self.stop_auto_btn.config(state='normal' if running else 'disabled')
+        self.pause_auto_btn.config(state='normal' if running else 'disabled')
+
     def pause_auto_reply(self):
         """Pause/resume the auto reply process"""
         if self.auto_paused:
             self.auto_paused = False
+            if self.auto_engine:
+                self.auto_engine.resume()
             self.pause_auto_btn.config(text="Pause")
             self.auto_log("▶️ Auto reply resumed.")
         else:
             self.auto_paused = True
+            if self.auto_engine:
+                self.auto_engine.pause()
             self.pause_auto_btn.config(text="Resume")
             self.auto_log("⏸️ Auto reply paused.")
 
-    def _auto_reply_worker(self, urls, accounts, reply_text, comments_count, min_interval, max_interval):
+    @traced()
+    def _auto_reply_worker(self, engine):
         """Worker thread for auto reply process"""
         try:
-            self.auto_log(f"🚀 Starting Auto Reply with {len(accounts)} accounts...")
-            self.auto_log(f"📊 Comments to scrape per tweet: {comments_count}")
-            self.auto_log(f"⏱️ Time interval: {min_interval}-{max_interval} seconds")
-            self.auto_log(f"📝 Reply text: {reply_text[:50]}...")
-            
-            for url_index, tweet_url in enumerate(urls):
-                if not self.auto_running:
-                    break
-                
-                self.auto_log(f"📝 Processing tweet {url_index + 1}/{len(urls)}: {tweet_url}")
-                
-                # Scrape comments for this tweet
-                comments = self._scrape_comments_for_auto(tweet_url, comments_count)
-                
-                if not comments:
-                    self.auto_log(f"❌ No comments found for {tweet_url}")
-                    continue
-                
-                self.auto_log(f"📊 Found {len(comments)} comments to reply to")
-                
-                # Reply to each comment
-                for comment_index, (username, comment_text) in enumerate(comments):
-                    if not self.auto_running:
-                        break
-                    
-                    while self.auto_paused:
-                        time.sleep(1)
-                        if not self.auto_running:
-                            return
-                    
-                    self.auto_log(f"💬 Replying to comment {comment_index + 1}/{len(comments)}: @{username}")
-                    
-                    # Reply with each account
-                    for account_index, account in enumerate(accounts):
-                        if not self.auto_running:
-                            break
-                        
-                        self.auto_log(f"🤖 Replying with account: {account.label}")
-                        
-                        try:
-                            success, msg = reply_to_comment(account, tweet_url, username, reply_text)
-                            
-                            if success:
-                                self.auto_log(f"✅ Successfully replied with {account.label}")
-                                self.auto_stats['successful'] += 1
-                            else:
-                                self.auto_log(f"❌ Failed to reply with {account.label}: {msg}", is_error=True)
-                                self.auto_stats['failed'] += 1
-                            
-                            self.auto_stats['processed'] += 1
-                            self._update_auto_progress()
-                            
-                            # Wait between accounts
-                            if account_index < len(accounts) - 1:
-                                wait_time = random.randint(min_interval, max_interval)
-                                self.auto_log(f"⏱️ Waiting {wait_time} seconds before next account...")
-                                time.sleep(wait_time)
-                                
-                        except Exception as e:
-                            self.auto_log(f"❌ Error replying with {account.label}: {e}", is_error=True)
-                            self.auto_stats['failed'] += 1
-                            self.auto_stats['processed'] += 1
-                            self._update_auto_progress()
-                    
-                    # Wait between comments
-                    if comment_index < len(comments) - 1:
-                        wait_time = random.randint(min_interval, max_interval)
-                        self.auto_log(f"⏱️ Waiting {wait_time} seconds before next comment...")
-                        time.sleep(wait_time)
-                
-                # Wait between tweets
-                if url_index < len(urls) - 1:
-                    wait_time = random.randint(min_interval, max_interval)
-                    self.auto_log(f"⏱️ Waiting {wait_time} seconds before next tweet...")
-                    time.sleep(wait_time)
-            
-            self.auto_log("🎉 Auto reply completed!")
-            
+            summary = engine.run()
+            if not summary['stopped']:
+                self.auto_log("🎉 Auto reply completed!")
         except Exception as e:
             self.auto_log(f"❌ Error in auto reply: {e}", is_error=True)
         finally:
-            # Update UI
-            self.start_auto_btn.config(state='normal')
-            self.stop_auto_btn.config(state='disabled')
-            self.pause_auto_btn.config(state='disabled')
+            # Update UI on the main thread
+            self.ui_events.state((self, 'auto_buttons'), self._set_auto_buttons, False)
             self.auto_running = False
 
-    def _scrape_comments_for_auto(self, tweet_url, max_comments):
-        """Scrape comments for auto reply process"""
-        try:
-            if not self.accounts:
-                return []
-            
-            # Use first account for scraping
-            account = self.accounts[0]
-            
-            # Create driver
-            options = Options()
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-plugins')
-            options.add_argument('--disable-images')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-background-timer-throttling')
-            options.add_argument('--disable-backgrounding-occluded-windows')
-            options.add_argument('--disable-renderer-backgrounding')
-            options.add_argument('--no-first-run')
-            options.add_argument('--no-default-browser-check')
-            options.add_argument('--disable-default-apps')
-            options.add_argument('--disable-sync')
-            
-            if account.proxy:
-                options.add_argument(f'--proxy-server={account.proxy}')
-            
-            driver = uc.Chrome(options=options)
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            try:
-                # Load cookies
-                cookie_path = account.get_cookie_path()
-                if os.path.exists(cookie_path):
-                    with open(cookie_path, 'rb') as f:
-                        cookies = pickle.load(f)
-                    driver.get('https://x.com/')
-                    time.sleep(2)
-                    for cookie in cookies:
-                        try:
-                            driver.add_cookie(cookie)
-                        except Exception:
-                            pass
-                
-                # Navigate to tweet
-                driver.get(tweet_url)
-                time.sleep(3)
-                
-                # Check if logged in
-                current_url = driver.current_url
-                if 'login' in current_url or 'i/flow/login' in current_url:
-                    self.auto_log(f"❌ Account {account.label} is not logged in")
-                    return []
-                
-                # Scroll to load comments
-                for _ in range(5):  # More scrolls to load more comments
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)
-                
-                # Scrape comments
-                comments = []
-                articles = driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]')
-                
-                for article in articles[1:max_comments+1]:  # Skip main tweet, limit to max_comments
-                    try:
-                        # Get username
-                        user_elem = article.find_element(By.CSS_SELECTOR, 'div[dir="ltr"] span')
-                        username = user_elem.text
-                        
-                        # Get comment text
-                        text_elem = article.find_element(By.CSS_SELECTOR, 'div[data-testid="tweetText"]')
-                        text = text_elem.text
-                        
-                        if username and text:
-                            comments.append((username, text))
-                            
-                    except Exception as e:
-                        continue
-                
-                return comments
-                
-            finally:
-                driver.quit()
-                
-        except Exception as e:
-            self.auto_log(f"❌ Error scraping comments: {e}", is_error=True)
-            return []
+    def _on_auto_engine_event(self, event):
+        """Campaign engine events (worker thread) as log lines and stats"""
+        kind = event['event']
+        if kind == 'log':
+            self.auto_log(event['message'], is_error=event['level'] == 'error')
+        elif kind == 'action':
+            if event['success']:
+                self.auto_log(f"✅ Successfully replied with {event['account']}",
+                              account=event['account'], action=event['action'])
+            else:
+                self.auto_log(f"❌ Failed to reply with {event['account']}: {event['message']}", is_error=True,
+                              account=event['account'], action=event['action'])
+            self.ui_events.stats((self, 'auto_stats'), self._apply_auto_stats, processed=1,
+                                 successful=int(event['success']), failed=int(not event['success']))
+
+    def _apply_auto_stats(self, deltas):
+        """Add a worker's stat deltas to the auto reply totals (main thread)"""
+        for name, delta in deltas.items():
+            self.auto_stats[name] = self.auto_stats.get(name, 0) + delta
+        self._update_auto_progress()
 
     def _update_auto_progress(self):
         """Update auto reply progress display"""
@@ -4,50 +4,10 @@ import threading
 import time
 import random
 from constants import COLOR_TAUPE, COLOR_DARK, COLOR_WHITE
-from selenium_manager import reply_to_tweet, scrape_tweet_content_and_comments
-from utils import log_to_file
-
-def scrape_tweet_content_and_comments_with_account(account, tweet_url: str) -> tuple:
-    """Scrape tweet content and comments using a specific account"""
-    try:
-        from selenium_manager import get_global_driver_manager
-        
-        # Get driver from the driver manager (reuses existing sessions)
-        driver = get_global_driver_manager().get_driver(account)
-        if not driver:
-            print(f"❌ Failed to get driver for {account.label}")
-            return "", [], False
-        
-        try:
-            # Navigate to tweet
-            driver.get(tweet_url)
-            time.sleep(3)
-            
-            # Check if logged in
-            current_url = driver.current_url
-            if 'login' in current_url or 'i/flow/login' in current_url:
-                print(f"❌ Account {account.label} is not logged in (redirected to login)")
-                return "", [], False
-            
-            # Scrape tweet content and comments
-            tweet_content, comments = scrape_tweet_content_and_comments(driver, tweet_url)
-            
-            # Consider successful if we got tweet content
-            success = len(tweet_content.strip()) > 10
-            
-            if success:
-                print(f"✅ Successfully scraped tweet for {account.label}: {len(tweet_content)} chars, {len(comments)} comments")
-            else:
-                print(f"❌ Failed to scrape tweet for {account.label}")
-            
-            return tweet_content, comments, success
-        except Exception as e:
-            print(f"❌ Error during scraping for {account.label}: {e}")
-            return "", [], False
-                
-    except Exception as e:
-        print(f"❌ Error scraping tweet with account {account.label}: {e}")
-        return "", [], False
+from selenium_manager import reply_to_tweet, scrape_tweet_content_and_comments_with_account
+from log_bus import get_log_bus
+from ui_events import get_ui_events
+from tracing import traced
 
 class ReplyPanel(ttk.Frame):
     def __init__(self, parent, accounts):
@@ -57,6 +17,8 @@ class ReplyPanel(ttk.Frame):
         self.panel = None
         self.accounts_listbox = None
         self.log_text = None
+        self.log_channel = get_log_bus().channel('reply_panel', file_name='reply_panel')
+        self.ui_events = get_ui_events()
         self.selected_tag = None
         self.tag_filter_dropdown = None
         
@@ -86,7 +48,6 @@ class ReplyPanel(ttk.Frame):
         # State persistence
         self.state = {
             'selected_tag': 'All',
-            'log_messages': [],
             'min_interval': '30',
             'max_interval': '60'
         }
@@ -264,9 +225,8 @@ class ReplyPanel(ttk.Frame):
         self.refresh_accounts_list()
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for msg in self.state.get('log_messages', []):
-            self.log(msg)
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
 
     def refresh_accounts_list(self):
         """Refresh the accounts listbox based on tag filter"""
@@ -281,29 +241,13 @@ class ReplyPanel(ttk.Frame):
             if selected_tag == 'All' or selected_tag in (account.tags or []):
                 self.accounts_listbox.insert(tk.END, account.label)
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         """Add message to log with timestamp"""
         timestamp = time.strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
         
-        # Save to state
-        if 'log_messages' not in self.state:
-            self.state['log_messages'] = []
-        self.state['log_messages'].append(formatted_message)
-        
-        # Keep only last 100 messages
-        if len(self.state['log_messages']) > 100:
-            self.state['log_messages'] = self.state['log_messages'][-100:]
-        
-        # Update UI
-        if hasattr(self, 'log_text') and self.log_text is not None:
-            self.log_text.config(state='normal')
-            self.log_text.insert(tk.END, formatted_message + '\n')
-            self.log_text.see(tk.END)
-            self.log_text.config(state='disabled')
-        
-        # Also log to file
-        log_to_file("reply_panel", formatted_message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(formatted_message, is_error, **fields)
 
     def update_button_state(self, enabled=True):
         """Update button states based on processing status"""
@@ -335,6 +279,7 @@ class ReplyPanel(ttk.Frame):
         thread.daemon = True
         thread.start()
 
+    @traced()
     def _load_tweet_contents_worker(self, urls):
         """Worker thread to load tweet contents"""
         try:
@@ -343,13 +288,13 @@ class ReplyPanel(ttk.Frame):
             # Get first account for scraping
             selected_accounts = self._get_selected_accounts()
             if not selected_accounts:
-                self.after(0, lambda: self.log("❌ No accounts selected", is_error=True))
+                self.log("❌ No accounts selected", is_error=True)
                 return
             
             account = selected_accounts[0]  # Use first account for scraping
             
             for i, url in enumerate(urls):
-                self.after(0, lambda url=url, i=i: self.log(f"📄 Loading tweet {i+1}/{len(urls)}: {url}"))
+                self.log(f"📄 Loading tweet {i+1}/{len(urls)}: {url}")
                 
                 try:
                     content, comments, success = scrape_tweet_content_and_comments_with_account(account, url)
@@ -364,12 +309,12 @@ class ReplyPanel(ttk.Frame):
                     self.tweets_data.append(tweet_data)
                     
                     if success:
-                        self.after(0, lambda url=url: self.log(f"✅ Loaded tweet: {len(content)} chars"))
+                        self.log(f"✅ Loaded tweet: {len(content)} chars")
                     else:
-                        self.after(0, lambda url=url: self.log(f"❌ Failed to load tweet: {url}", is_error=True))
+                        self.log(f"❌ Failed to load tweet: {url}", is_error=True)
                         
                 except Exception as e:
-                    self.after(0, lambda e=e, url=url: self.log(f"❌ Error loading tweet {url}: {e}", is_error=True))
+                    self.log(f"❌ Error loading tweet {url}: {e}", is_error=True)
                     self.tweets_data.append({
                         'url': url,
                         'content': f"Error: {str(e)}",
@@ -377,13 +322,13 @@ class ReplyPanel(ttk.Frame):
                         'reply_text': ''
                     })
             
-            self.after(0, lambda: self._update_tweet_display())
-            self.after(0, lambda: self.log(f"🎉 Loaded {len(self.tweets_data)} tweets"))
+            self.ui_events.state((self, 'tweet_display'), self._update_tweet_display)
+            self.log(f"🎉 Loaded {len(self.tweets_data)} tweets")
             
         except Exception as e:
-            self.after(0, lambda e=e: self.log(f"❌ Error in load process: {e}", is_error=True))
+            self.log(f"❌ Error in load process: {e}", is_error=True)
         finally:
-            self.after(0, lambda: self.update_button_state(True))
+            self.ui_events.state((self, 'buttons'), self.update_button_state, True)
 
     def _update_tweet_display(self):
         """Update the tweet display with current tweet"""
@@ -473,6 +418,7 @@ class ReplyPanel(ttk.Frame):
         thread.daemon = True
         thread.start()
 
+    @traced()
     def _send_single_reply_worker(self, tweet_data, selected_accounts, reply_text):
         """Worker to send a single reply"""
         try:
@@ -483,17 +429,17 @@ class ReplyPanel(ttk.Frame):
                 try:
                     success, msg = reply_to_tweet(account, tweet_data['url'], reply_text)
                     if success:
-                        self.after(0, lambda acc=account: self.log(f"[{acc.label}] ✅ Reply sent successfully"))
+                        self.log(f"[{account.label}] ✅ Reply sent successfully", account=account.label, action='reply')
                         success_count += 1
                     else:
-                        self.after(0, lambda acc=account, msg=msg: self.log(f"[{acc.label}] ❌ {msg}", is_error=True))
+                        self.log(f"[{account.label}] ❌ {msg}", is_error=True, account=account.label, action='reply')
                 except Exception as e:
-                    self.after(0, lambda acc=account, e=e: self.log(f"[{acc.label}] ❌ Error: {e}", is_error=True))
+                    self.log(f"[{account.label}] ❌ Error: {e}", is_error=True, account=account.label, action='reply')
             
-            self.after(0, lambda: self.log(f"🎉 Reply sent: {success_count}/{total_count} accounts successful"))
+            self.log(f"🎉 Reply sent: {success_count}/{total_count} accounts successful")
             
         except Exception as e:
-            self.after(0, lambda e=e: self.log(f"❌ Error sending reply: {e}", is_error=True))
+            self.log(f"❌ Error sending reply: {e}", is_error=True)
 
     def start_replying(self):
         """Start the auto reply process"""
@@ -540,6 +486,7 @@ class ReplyPanel(ttk.Frame):
         thread.daemon = True
         thread.start()
 
+    @traced()
     def _reply_worker(self, selected_accounts, min_interval, max_interval):
         """Worker thread for auto reply process"""
         try:
@@ -554,11 +501,11 @@ class ReplyPanel(ttk.Frame):
                 if not self.is_replying:
                     break
                 
-                self.after(0, lambda i=i: self.log(f"📝 Processing tweet {i+1}/{len(self.tweets_data)}"))
+                self.log(f"📝 Processing tweet {i+1}/{len(self.tweets_data)}")
                 
                 reply_text = tweet_data.get('reply_text', '').strip()
                 if not reply_text:
-                    self.after(0, lambda: self.log(f"⏭️ Skipping tweet {i+1} (no reply text)"))
+                    self.log(f"⏭️ Skipping tweet {i+1} (no reply text)")
                     continue
                 
                 # Send reply to all accounts
@@ -572,28 +519,27 @@ class ReplyPanel(ttk.Frame):
                     try:
                         success, msg = reply_to_tweet(account, tweet_data['url'], reply_text)
                         if success:
-                            self.after(0, lambda acc=account: self.log(f"[{acc.label}] ✅ Reply sent"))
+                            self.log(f"[{account.label}] ✅ Reply sent", account=account.label, action='reply')
                             success_count += 1
                         else:
-                            self.after(0, lambda acc=account, msg=msg: self.log(f"[{acc.label}] ❌ {msg}", is_error=True))
+                            self.log(f"[{account.label}] ❌ {msg}", is_error=True, account=account.label, action='reply')
                     except Exception as e:
-                        self.after(0, lambda acc=account, e=e: self.log(f"[{acc.label}] ❌ Error: {e}", is_error=True))
+                        self.log(f"[{account.label}] ❌ Error: {e}", is_error=True, account=account.label, action='reply')
                 
-                self.after(0, lambda i=i, success=success_count, total=total_count: 
-                          self.log(f"📊 Tweet {i+1} completed: {success}/{total} accounts"))
+                self.log(f"📊 Tweet {i+1} completed: {success_count}/{total_count} accounts")
                 
                 # Wait before next tweet (if not the last one)
                 if i < len(self.tweets_data) - 1 and self.is_replying:
                     interval = random.randint(min_interval, max_interval)
-                    self.after(0, lambda interval=interval: self.log(f"⏱️ Waiting {interval} seconds before next tweet..."))
+                    self.log(f"⏱️ Waiting {interval} seconds before next tweet...")
                     time.sleep(interval)
             
-            self.after(0, lambda: self.log("🎉 Auto reply process completed!"))
+            self.log("🎉 Auto reply process completed!")
             
         except Exception as e:
-            self.after(0, lambda e=e: self.log(f"❌ Error in auto reply process: {e}", is_error=True))
+            self.log(f"❌ Error in auto reply process: {e}", is_error=True)
         finally:
-            self.after(0, lambda: self._stop_replying())
+            self.ui_events.call(self._stop_replying)
 
     def _get_selected_accounts(self):
         """Get selected accounts from listbox"""
@@ -1,58 +1,213 @@
+import json
+import time
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import ttk, messagebox, scrolledtext
+from datetime import datetime
 from constants import COLOR_TAUPE, COLOR_DARK
+from log_bus import get_log_bus
+from ui_events import get_ui_events
+from campaign_engine import CAMPAIGN_ACTIONS
+from scheduler import get_scheduler, INTERVAL, CRON, ONCE
 
 class ScheduledTasksPanel(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self.tasks = []
-        self.tasks_listbox = None
+        self.scheduler = get_scheduler()
+        self.ui_events = get_ui_events()
+        self.log_channel = get_log_bus().channel('scheduler', file_name='scheduler')
+        self.jobs_tree = None
+        self.log_text = None
+        self.scheduler.subscribe(self._on_scheduler_event)
 
     def build_panel(self):
         title = tk.Label(self, text="Scheduled Tasks", font=('Segoe UI', 16, 'bold'), bg=COLOR_TAUPE, fg=COLOR_DARK)
         title.pack(anchor='nw', padx=20, pady=(20, 10))
-        # Tasks list
-        self.tasks_listbox = tk.Listbox(self, height=8)
-        self.refresh_tasks_listbox()
-        self.tasks_listbox.pack(anchor='nw', padx=20, pady=5)
+        # Jobs table
+        columns = ('name', 'action', 'trigger', 'next_run', 'last_run', 'result', 'priority', 'enabled')
+        headings = ('Name', 'Action', 'Trigger', 'Next Run', 'Last Run', 'Last Result', 'Priority', 'Enabled')
+        widths = (150, 90, 130, 120, 120, 130, 60, 60)
+        self.jobs_tree = ttk.Treeview(self, columns=columns, show='headings', height=10)
+        for column, heading, width in zip(columns, headings, widths):
+            self.jobs_tree.heading(column, text=heading)
+            self.jobs_tree.column(column, width=width, anchor='w')
+        self.jobs_tree.pack(fill='x', padx=20, pady=5)
         # Action buttons
         btn_frame = tk.Frame(self, bg=COLOR_TAUPE)
         btn_frame.pack(anchor='nw', padx=20, pady=5)
         ttk.Button(btn_frame, text="Add Task", command=self.add_task_dialog).pack(side='left', padx=2)
         ttk.Button(btn_frame, text="Remove Task", command=self.remove_task_dialog).pack(side='left', padx=2)
+        ttk.Button(btn_frame, text="Run Now", command=self.run_selected_now).pack(side='left', padx=2)
+        ttk.Button(btn_frame, text="Enable/Disable", command=self.toggle_selected).pack(side='left', padx=2)
+        # Log
+        ttk.Label(self, text="Scheduler Log:", font=('Segoe UI', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 0))
+        self.log_text = scrolledtext.ScrolledText(self, height=10, wrap='word')
+        self.log_text.pack(fill='both', expand=True, padx=20, pady=(5, 20))
+        self.log_channel.attach(self.log_text)
+        self.refresh_jobs()
 
-    def refresh_tasks_listbox(self):
-        if self.tasks_listbox:
-            self.tasks_listbox.delete(0, 'end')
-            for task in self.tasks:
-                self.tasks_listbox.insert('end', str(task))
+    def log(self, message, is_error=False):
+        if is_error:
+            message = f"❌ {message}"
+        self.log_channel.write(message, is_error)
+
+    def _format_time(self, timestamp):
+        if not timestamp:
+            return '-'
+        return datetime.fromtimestamp(timestamp).strftime('%m-%d %H:%M')
+
+    def _format_result(self, result):
+        if not result:
+            return '-'
+        if 'error' in result:
+            return f"error: {result['error']}"
+        return f"{result.get('succeeded', 0)} ok / {result.get('failed', 0)} failed"
+
+    def refresh_jobs(self):
+        if not self.jobs_tree:
+            return
+        selection = self.jobs_tree.selection()
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        for job in self.scheduler.jobs():
+            next_run = 'running' if self.scheduler.is_running(job.id) else self._format_time(job.next_run)
+            self.jobs_tree.insert('', 'end', iid=job.id, values=(
+                job.name, job.job.get('action'), job.describe_trigger(), next_run,
+                self._format_time(job.last_run), self._format_result(job.last_result),
+                job.priority, 'yes' if job.enabled else 'no'))
+        existing = [iid for iid in selection if self.jobs_tree.exists(iid)]
+        if existing:
+            self.jobs_tree.selection_set(existing)
+
+    def _on_scheduler_event(self, event):
+        """Called from scheduler threads; logs and refreshes through the UI event channel"""
+        kind = event['event']
+        name = event.get('name', '')
+        if kind == 'engine':
+            detail = event['detail']
+            if detail.get('event') == 'log':
+                self.log(f"[{name}] {detail.get('message', '')}")
+            elif detail.get('event') == 'action':
+                status = '✅' if detail.get('success') else '❌'
+                self.log(f"[{name}] {status} {detail.get('account')} {detail.get('action')} {detail.get('target') or ''}".rstrip())
+            return
+        if kind == 'job_started':
+            self.log(f"▶️ Started '{name}' for {', '.join(event.get('accounts', [])) or 'no accounts'}")
+        elif kind == 'job_finished':
+            self.log(f"🏁 Finished '{name}': {self._format_result(event.get('result'))}, next run {self._format_time(event.get('next_run'))}")
+        elif kind == 'job_deferred':
+            self.log(f"⏳ Deferred '{name}', busy accounts: {', '.join(event.get('busy_accounts', []))}")
+        elif kind == 'job_catch_up':
+            self.log(f"🔁 Catching up '{name}' missed at {self._format_time(event.get('missed'))}")
+        elif kind == 'job_skipped':
+            self.log(f"⏭️ Skipped missed run of '{name}' at {self._format_time(event.get('missed'))}")
+        self.ui_events.state((self, 'jobs'), self.refresh_jobs)
+
+    def _selected_job_id(self, title):
+        selection = self.jobs_tree.selection() if self.jobs_tree else ()
+        if not selection:
+            messagebox.showinfo(title, "Select a task first.")
+            return None
+        return selection[0]
 
     def add_task_dialog(self):
-        task = simpledialog.askstring("Add Task", "Enter task description:", parent=self.parent)
-        if task:
-            self.tasks.append(task)
-            self.refresh_tasks_listbox()
-            print(f"[SCHEDULED TASKS PANEL] Added task: {task}")
-            messagebox.showinfo("Add Task", f"Task added: {task}")
+        dialog = tk.Toplevel(self)
+        dialog.title("Add Scheduled Task")
+        dialog.transient(self.winfo_toplevel())
+        dialog.grab_set()
+        form = ttk.Frame(dialog, padding=15)
+        form.pack(fill='both', expand=True)
+
+        fields = {}
+        def add_row(row, label, widget):
+            ttk.Label(form, text=label).grid(row=row, column=0, sticky='w', pady=3)
+            widget.grid(row=row, column=1, sticky='ew', pady=3)
+            return widget
+
+        fields['name'] = add_row(0, "Name:", ttk.Entry(form, width=40))
+        fields['action'] = add_row(1, "Action:", ttk.Combobox(form, values=CAMPAIGN_ACTIONS, state='readonly'))
+        fields['action'].set(CAMPAIGN_ACTIONS[0])
+        fields['accounts'] = add_row(2, "Accounts (all, label, @user, tag:x):", ttk.Entry(form, width=40))
+        fields['accounts'].insert(0, 'all')
+        fields['params'] = add_row(3, "Job settings (JSON):", tk.Text(form, width=40, height=5))
+        fields['params'].insert('1.0', '{}')
+        fields['trigger_type'] = add_row(4, "Trigger:", ttk.Combobox(form, values=(INTERVAL, CRON, ONCE), state='readonly'))
+        fields['trigger_type'].set(INTERVAL)
+        fields['trigger'] = add_row(5, "Minutes / cron / YYYY-MM-DD HH:MM:", ttk.Entry(form, width=40))
+        fields['trigger'].insert(0, '60')
+        fields['window'] = add_row(6, "Time window (HH:MM-HH:MM, optional):", ttk.Entry(form, width=40))
+        fields['priority'] = add_row(7, "Priority (higher runs first):", ttk.Spinbox(form, from_=-10, to=10, width=5))
+        fields['priority'].set(0)
+        catch_up = tk.BooleanVar(value=True)
+        ttk.Checkbutton(form, text="Catch up runs missed while closed", variable=catch_up).grid(row=8, column=1, sticky='w', pady=3)
+        form.columnconfigure(1, weight=1)
+
+        def save():
+            try:
+                name = fields['name'].get().strip() or fields['action'].get()
+                job = json.loads(fields['params'].get('1.0', 'end').strip() or '{}')
+                if not isinstance(job, dict):
+                    raise ValueError("Job settings must be a JSON object")
+                job['action'] = fields['action'].get()
+                job['accounts'] = fields['accounts'].get().strip() or 'all'
+                job.setdefault('name', name)
+
+                kind = fields['trigger_type'].get()
+                value = fields['trigger'].get().strip()
+                if kind == INTERVAL:
+                    trigger = {'type': INTERVAL, 'seconds': int(float(value) * 60)}
+                elif kind == CRON:
+                    trigger = {'type': CRON, 'expr': value}
+                else:
+                    trigger = {'type': ONCE, 'at': datetime.strptime(value, '%Y-%m-%d %H:%M').timestamp()}
+                    if trigger['at'] <= time.time():
+                        raise ValueError("The run time is in the past")
+
+                window = None
+                window_text = fields['window'].get().strip()
+                if window_text:
+                    start, end = (part.strip() for part in window_text.split('-'))
+                    for clock in (start, end):
+                        datetime.strptime(clock, '%H:%M')
+                    window = {'start': start, 'end': end}
+
+                scheduled = self.scheduler.add_job(name, job, trigger, priority=int(fields['priority'].get()),
+                                                   window=window, catch_up=catch_up.get())
+            except Exception as e:
+                messagebox.showerror("Add Task", f"Invalid task: {e}", parent=dialog)
+                return
+            self.log(f"➕ Added '{scheduled.name}' ({scheduled.describe_trigger()}), next run {self._format_time(scheduled.next_run)}")
+            dialog.destroy()
+            self.refresh_jobs()
+
+        buttons = ttk.Frame(form)
+        buttons.grid(row=9, column=0, columnspan=2, sticky='e', pady=(10, 0))
+        ttk.Button(buttons, text="Add", command=save).pack(side='left', padx=2)
+        ttk.Button(buttons, text="Cancel", command=dialog.destroy).pack(side='left', padx=2)
 
     def remove_task_dialog(self):
-        idx = self.get_selected_task_index()
-        if idx is None:
-            messagebox.showinfo("Remove Task", "Select a task to remove.")
+        job_id = self._selected_job_id("Remove Task")
+        if job_id is None:
+            return
+        job = self.scheduler.get_job(job_id)
+        if job and messagebox.askyesno("Remove Task", f"Are you sure you want to remove the task: {job.name}?"):
+            self.scheduler.remove_job(job_id)
+            self.log(f"🗑️ Removed '{job.name}'")
+            self.refresh_jobs()
+
+    def run_selected_now(self):
+        job_id = self._selected_job_id("Run Now")
+        if job_id is None:
+            return
+        if not self.scheduler.run_now(job_id):
+            messagebox.showinfo("Run Now", "That task is already running.")
+        self.refresh_jobs()
+
+    def toggle_selected(self):
+        job_id = self._selected_job_id("Enable/Disable")
+        if job_id is None:
             return
-        task = self.tasks[idx]
-        confirm = messagebox.askyesno("Remove Task", f"Are you sure you want to remove the task: {task}?")
-        if confirm:
-            del self.tasks[idx]
-            self.refresh_tasks_listbox()
-            print(f"[SCHEDULED TASKS PANEL] Removed task: {task}")
-            messagebox.showinfo("Remove Task", f"Task removed: {task}")
-
-    def get_selected_task_index(self):
-        if self.tasks_listbox:
-            selection = self.tasks_listbox.curselection()
-            if not selection:
-                return None
-            return selection[0]
-        return None 
\ No newline at end of file
+        job = self.scheduler.get_job(job_id)
+        if job:
+            self.scheduler.set_enabled(job_id, not job.enabled)
+            self.log(f"{'▶️ Enabled' if job.enabled else '⏸️ Disabled'} '{job.name}'")
+            self.refresh_jobs()
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from constants import COLOR_TAUPE, COLOR_DARK
+from utils import load_settings, save_settings
 
 class SettingsPanel(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
         self.auto_rotate_var = None
+        self.keep_browsers_var = None
 
     def build_panel(self):
         title = tk.Label(self, text="Settings", font=('Segoe UI', 16, 'bold'), bg=COLOR_TAUPE, fg=COLOR_DARK)
@@ -15,8 +17,19 @@ class SettingsPanel(ttk.Frame):
         self.auto_rotate_var = tk.BooleanVar()
         auto_rotate_check = ttk.Checkbutton(self, text="Auto-rotate proxies", variable=self.auto_rotate_var)
         auto_rotate_check.pack(anchor='nw', padx=20, pady=5)
+        # Leave browsers running on exit and reattach to them on the next start
+        self.keep_browsers_var = tk.BooleanVar(value=load_settings().get('keep_browsers_open', False))
+        keep_browsers_check = ttk.Checkbutton(self, text="Keep browsers running when closing (reattach on restart)",
+                                              variable=self.keep_browsers_var, command=self.on_keep_browsers_toggle)
+        keep_browsers_check.pack(anchor='nw', padx=20, pady=5)
 
     def on_auto_rotate_toggle(self):
         value = self.auto_rotate_var.get()
         print(f"[SETTINGS PANEL] Auto-rotate proxy set to: {value}")
-        messagebox.showinfo("Settings", f"Auto-rotate proxy is now {'enabled' if value else 'disabled'}.") 
\ No newline at end of file
+        messagebox.showinfo("Settings", f"Auto-rotate proxy is now {'enabled' if value else 'disabled'}.")
+
+    def on_keep_browsers_toggle(self):
+        settings = load_settings()
+        settings['keep_browsers_open'] = self.keep_browsers_var.get()
+        save_settings(settings)
+        print(f"[SETTINGS PANEL] Keep browsers running set to: {settings['keep_browsers_open']}")
\ No newline at end of file
@@ -5,9 +5,13 @@ import threading
 import requests
 import json
 import time
-from selenium_manager import reply_to_tweet, scrape_tweet_content_and_comments
+from selenium_manager import reply_to_tweet, scrape_tweet_content_and_comments_with_account
 from utils import log_to_file
-from ai_integration import create_ai_integration
+from log_bus import get_log_bus
+from campaign_engine import CampaignEngine, generate_unique_reply
+from ui_events import get_ui_events
+from tracing import traced
+from run_journal import RunJournal, latest_unfinished_run
 from typing import Dict, List
 from selenium.webdriver.common.by import By
 import random
@@ -16,48 +20,6 @@ import re
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-def scrape_tweet_content_and_comments_with_account(account, tweet_url: str) -> tuple:
-    """Scrape tweet content and comments using a specific account"""
-    try:
-        from selenium_manager import get_global_driver_manager
-        
-        # Get driver from the driver manager (reuses existing sessions)
-        driver = get_global_driver_manager().get_driver(account)
-        if not driver:
-            print(f"❌ Failed to get driver for {account.label}")
-            return "", [], False
-        
-        try:
-            # Navigate to tweet
-            driver.get(tweet_url)
-            time.sleep(3)
-            
-            # Check if logged in
-            current_url = driver.current_url
-            if 'login' in current_url or 'i/flow/login' in current_url:
-                print(f"❌ Account {account.label} is not logged in (redirected to login)")
-                return "", [], False
-            
-            # Scrape tweet content and comments
-            tweet_content, comments = scrape_tweet_content_and_comments(driver, tweet_url)
-            
-            # Consider successful if we got tweet content
-            success = len(tweet_content.strip()) > 10
-            
-            if success:
-                print(f"✅ Successfully scraped tweet for {account.label}: {len(tweet_content)} chars, {len(comments)} comments")
-            else:
-                print(f"❌ Failed to scrape tweet for {account.label}")
-            
-            return tweet_content, comments, success
-        except Exception as e:
-            print(f"❌ Error during scraping for {account.label}: {e}")
-            return "", [], False
-                
-    except Exception as e:
-        print(f"❌ Error scraping tweet with account {account.label}: {e}")
-        return "", [], False
-
 class YappingPanel(ttk.Frame):
     def __init__(self, parent, accounts):
         super().__init__(parent)
@@ -118,6 +80,9 @@ class YappingPanel(ttk.Frame):
         self.auto_progress_bar = None
         self.auto_stats_label = None
         self.auto_log_text = None
+        self.log_channel = get_log_bus().channel('yapping', file_name='yapping')
+        self.auto_log_channel = get_log_bus().channel('yapping_auto')
+        self.ui_events = get_ui_events()
         
         # Enhanced search query builder variables
         self.auto_keywords_entry = None
@@ -139,10 +104,13 @@ class YappingPanel(ttk.Frame):
         self.auto_yapping_paused = False
         self.auto_yapping_stats = {'processed': 0, 'successful': 0, 'failed': 0}
         self.replied_tweets_db = {}
-        self._review_dialog_open = False
+        # Campaign engine of the auto search run in progress
+        self.auto_engine = None
+        # Run journal of the manual reply run in progress
+        self.manual_journal = None
         
-        # Initialize AI integration
-        self.ai_integration = create_ai_integration()
+        # AI integration (loads .env and the OpenAI client) is created on first use
+        self._ai_integration = None
         
         # Store scraped data
         self.scraped_tweet_content = None
@@ -153,7 +121,6 @@ class YappingPanel(ttk.Frame):
             'selected_tag': 'All',
             'tweet_url': '',
             'reply_text': '',
-            'log_messages': [],
             'ai_enabled': True,
             'context_analysis': True,
             'auto_reply': False,
@@ -164,6 +131,13 @@ class YappingPanel(ttk.Frame):
         
         # Don't call build_panel() here - it will be called by the main app
     
+    @property
+    def ai_integration(self):
+        if self._ai_integration is None:
+            from ai_integration import create_ai_integration
+            self._ai_integration = create_ai_integration()
+        return self._ai_integration
+
     def get_current_ai_provider(self):
         """Get the current AI provider from the AI settings"""
         try:
@@ -782,6 +756,7 @@ class YappingPanel(ttk.Frame):
             
             self.auto_log_text.grid(row=0, column=0, sticky='nsew')
             auto_log_scrollbar.grid(row=0, column=1, sticky='ns')
+            self.auto_log_channel.attach(self.auto_log_text)
             
         except Exception as e:
             print(f"Error building auto tab: {e}")
@@ -864,6 +839,7 @@ class YappingPanel(ttk.Frame):
         thread.daemon = True
         thread.start()
     
+    @traced()
     def _analyze_tweet_context_worker(self, tweet_url, scraping_account):
         """Worker thread for tweet context analysis"""
         try:
@@ -930,6 +906,7 @@ class YappingPanel(ttk.Frame):
             args=(self.scraped_tweet_content, {}, custom_prompt)
         ).start()
 
+    @traced()
     def _generate_ai_comments_worker(self, tweet_content: str, analysis: Dict, custom_prompt: str = None):
         """Generate AI comments based on tweet content"""
         try:
@@ -947,7 +924,7 @@ class YappingPanel(ttk.Frame):
             if comment:
                 self.log(f"✅ Generated comment: {comment}")
                 # Update the comment display
-                self.after(0, lambda: self._update_ai_comments_display([comment]))
+                self.ui_events.call(self._update_ai_comments_display, [comment])
             else:
                 self.log("❌ Failed to generate comment", is_error=True)
                 
@@ -995,6 +972,7 @@ class YappingPanel(ttk.Frame):
         self.log(f"🚀 Starting auto-yapping with {len(selected_accounts)} accounts...")
         threading.Thread(target=self._auto_yapping_worker, args=(selected_accounts, tweet_url)).start()
 
+    @traced()
     def _auto_yapping_worker(self, accounts, tweet_url):
         """Worker thread for auto-yapping"""
         try:
@@ -1040,7 +1018,7 @@ class YappingPanel(ttk.Frame):
                         try:
                             success, message = reply_to_tweet(account, tweet_url, comment)
                             if success:
-                                self.log(f"✅ Posted comment for {account.label}")
+                                self.log(f"✅ Posted comment for {account.label}", account=account.label, action='yapping')
                                 break
                             else:
                                 if "Chrome" in message or "connection" in message.lower() or "reply button" in message.lower():
@@ -1048,16 +1026,19 @@ class YappingPanel(ttk.Frame):
                                     if attempt < max_retries - 1:
                                         time.sleep(5)
                                     else:
-                                        self.log(f"❌ Failed to post comment for {account.label} after {max_retries} attempts")
+                                        self.log(f"❌ Failed to post comment for {account.label} after {max_retries} attempts",
+                                                 account=account.label, action='yapping')
                                 else:
-                                    self.log(f"❌ Failed to post comment for {account.label}: {message}")
+                                    self.log(f"❌ Failed to post comment for {account.label}: {message}",
+                                             account=account.label, action='yapping')
                                     break
                         except Exception as e:
                             self.log(f"⚠️ Error posting comment (attempt {attempt + 1}/{max_retries}): {str(e)}")
                             if attempt < max_retries - 1:
                                 time.sleep(5)
                             else:
-                                self.log(f"❌ Failed to post comment for {account.label} after {max_retries} attempts")
+                                self.log(f"❌ Failed to post comment for {account.label} after {max_retries} attempts",
+                                         account=account.label, action='yapping')
                 else:
                     self.log(f"⚠️ AI is disabled for {account.label}")
                 
@@ -1068,28 +1049,16 @@ class YappingPanel(ttk.Frame):
             self.log(f"❌ Error in auto-yapping: {e}")
             log_to_file('yapping_panel', f"Error in _auto_yapping_worker: {e}")
 
-    def log(self, message, is_error=False):
+    def log(self, message, is_error=False, **fields):
         """Log a message to the log area"""
         if is_error:
             message = f"❌ {message}"
-        self.log_text.config(state='normal')
-        self.log_text.insert('end', message + '\n')
-        self.log_text.see('end')
-        self.log_text.config(state='disabled')
-        # Save to state
-        self.state['log_messages'].append(message)
-        # Keep only last 100 messages to prevent memory issues
-        if len(self.state['log_messages']) > 100:
-            self.state['log_messages'] = self.state['log_messages'][-100:]
-        log_to_file('yapping', message)
+        # Safe from worker threads; shown on the next log bus drain
+        self.log_channel.write(message, is_error, **fields)
 
     def restore_log_messages(self):
-        """Restore log messages from state"""
-        for message in self.state['log_messages']:
-            self.log_text.config(state='normal')
-            self.log_text.insert('end', message + '\n')
-            self.log_text.see('end')
-            self.log_text.config(state='disabled') 
+        """Show the log history kept by the log channel"""
+        self.log_channel.attach(self.log_text)
 
     def _on_prompt_focus_in(self, event):
         """Handle focus in for the AI prompt entry"""
@@ -1125,6 +1094,15 @@ class YappingPanel(ttk.Frame):
 
     def start_auto_yapping_search(self):
         """Start auto yapping based on search query"""
+        # A run cut short by a crash or Stop can pick up where it left off
+        journal = latest_unfinished_run('auto_yapping')
+        if journal:
+            if messagebox.askyesno("Resume Run", f"An unfinished auto yapping run was found ({journal.describe()}).\n\n"
+                                                 "Resume it where it stopped?"):
+                self._resume_auto_yapping_search(journal)
+                return
+            journal.finish('abandoned')
+
         # Get the generated search query
         search_query = self.auto_generated_query.get().strip()
         if not search_query:
@@ -1174,20 +1152,45 @@ class YappingPanel(ttk.Frame):
         else:
             self.auto_log("ℹ️ No custom instructions provided")
         
-        # Start auto yapping in separate thread
-        import threading
+        # The same campaign engine the headless runner uses
+        campaign = {
+            'name': 'auto_yapping',
+            'min_interval': min_interval,
+            'max_interval': max_interval,
+            'jobs': [{
+                'action': 'yapping',
+                'query': search_query,
+                'accounts': [acc.label for acc in selected_accounts],
+                'max_tweets': max_tweets,
+                'prompt': custom_prompt,
+                'min_chars': min_chars,
+                'max_chars': max_chars,
+                'exclude_tweets': list(self.replied_tweets_db)
+            }]
+        }
+        self._start_auto_yapping_thread(campaign, RunJournal.create('auto_yapping', campaign))
+
+    def _resume_auto_yapping_search(self, journal):
+        """Restart an unfinished auto yapping run from its journal"""
+        if 'jobs' not in journal.params:
+            # Journals written before auto yapping ran on the campaign engine
+            self.auto_log("❌ The unfinished run was saved by an older version and can't be resumed.", is_error=True)
+            journal.finish('abandoned')
+            return
+        self.auto_log(f"♻️ Resuming auto yapping run {journal.run_id} ({journal.describe()})")
+        self._start_auto_yapping_thread(journal.params, journal)
+
+    def _start_auto_yapping_thread(self, campaign, journal):
+        """Run the auto yapping campaign in a separate thread, checkpointed to journal"""
         self.auto_yapping_running = True
         self.auto_yapping_paused = False
         
         # Update UI
-        self.start_auto_button.config(state='disabled')
-        self.stop_auto_button.config(state='normal')
-        self.pause_auto_button.config(state='normal')
+        self._set_auto_buttons(True)
         
-        thread = threading.Thread(
-            target=self._auto_yapping_search_worker,
-            args=(search_query, selected_accounts, min_interval, max_interval, max_tweets, custom_prompt, min_chars, max_chars)
-        )
+        self.auto_engine = CampaignEngine(campaign, on_event=self._on_auto_engine_event, journal=journal,
+                                          review=self._review_replies)
+        thread = threading.Thread(target=self._auto_yapping_search_worker, args=(self.auto_engine,))
         thread.daemon = True
         thread.start()
 
@@ -1195,21 +1198,25 @@ class YappingPanel(ttk.Frame):
         """Stop auto yapping"""
         self.auto_yapping_running = False
         self.auto_yapping_paused = False
+        if self.auto_engine:
+            self.auto_engine.stop()
         self.auto_log("⏹️ Auto yapping stopped by user.")
         
         # Update UI
-        self.start_auto_button.config(state='normal')
-        self.stop_auto_button.config(state='disabled')
-        self.pause_auto_button.config(state='disabled')
+        self._set_auto_buttons(False)
 
     def pause_auto_yapping_search(self):
         """Pause/resume auto yapping"""
         if self.auto_yapping_paused:
             self.auto_yapping_paused = False
+            if self.auto_engine:
+                self.auto_engine.resume()
             self.pause_auto_button.config(text="⏸️ Pause")
             self.auto_log("▶️ Auto yapping resumed.")
         else:
             self.auto_yapping_paused = True
+            if self.auto_engine:
+                self.auto_engine.pause()
             self.pause_auto_button.config(text="▶️ Resume")
             self.auto_log("⏸️ Auto yapping paused.")
 
@@ -1219,44 +1226,26 @@ class YappingPanel(ttk.Frame):
             timestamp = time.strftime("[%H:%M:%S]")
             log_message = f"{timestamp} {message}"
             
-            # Use after() to update UI from main thread
-            self.after(0, lambda: self._update_auto_log_safe(log_message, is_error))
+            # Safe from worker threads; shown on the next log bus drain
+            self.auto_log_channel.write(log_message, is_error)
             
         except Exception as e:
             print(f"Error in auto_log: {e}")
 
-    def _update_auto_log_safe(self, log_message, is_error=False):
-        """Safely update the auto log from main thread"""
-        try:
-            if hasattr(self, 'auto_log_text') and self.auto_log_text:
-                # Enable the text widget for writing
-                self.auto_log_text.config(state='normal')
-                
-                # Configure tag for error messages
-                if is_error:
-                    self.auto_log_text.tag_configure("error", foreground="red")
-                    self.auto_log_text.insert('end', log_message + '\n', "error")
-                else:
-                    self.auto_log_text.insert('end', log_message + '\n')
-                
-                # Auto-scroll to bottom
-                self.auto_log_text.see('end')
-                
-                # Limit log size to prevent memory issues
-                lines = self.auto_log_text.get('1.0', 'end').split('\n')
-                if len(lines) > 1000:  # Keep only last 1000 lines
-                    self.auto_log_text.delete('1.0', f'{len(lines)-1000}.0')
-                
-                # Disable the text widget to make it read-only
-                self.auto_log_text.config(state='disabled')
-                    
-        except Exception as e:
-            print(f"Error updating auto log: {e}")
-            import traceback
-            traceback.print_exc()
+    def _set_auto_buttons(self, running):
+        """Enable the auto yapping controls for a running or stopped search"""
+        self.start_auto_button.config(state='disabled' if running else 'normal')
+        self.stop_auto_button.config(state='normal' if running else 'disabled')
+        self.pause_auto_button.config(state='normal' if running else 'disabled')
+
+    def _apply_auto_stats(self, deltas):
+        """Add a worker's stat deltas to the auto yapping totals (main thread)"""
+        for name, delta in deltas.items():
+            self.auto_yapping_stats[name] = self.auto_yapping_stats.get(name, 0) + delta
 
-    def update_progress(self, current, total, stats):
+    def update_progress(self, current, total, stats=None):
         """Update progress bar and stats safely from main thread"""
+        stats = self.auto_yapping_stats if stats is None else stats
         try:
             if hasattr(self, 'auto_progress_bar') and self.auto_progress_bar:
                 # Calculate percentage
@@ -1273,413 +1262,87 @@ class YappingPanel(ttk.Frame):
         except Exception as e:
             print(f"Error updating progress: {e}")
 
-    def _auto_yapping_search_worker(self, search_query, accounts, min_interval, max_interval, max_tweets, custom_prompt, min_chars, max_chars):
-        """Worker thread for auto yapping search"""
+    @traced()
+    def _auto_yapping_search_worker(self, engine):
+        """Worker thread for auto yapping search, checkpointed to the engine's journal"""
+        completed = False
         try:
-            # Get custom prompt if provided
-            if custom_prompt:
-                self.auto_log(f"🎯 Using custom instructions: {custom_prompt}")
-            else:
-                self.auto_log("ℹ️ No custom instructions provided, using default AI behavior")
-            
-            # Build search URL properly
-            import urllib.parse
-            encoded_query = urllib.parse.quote(search_query)
-            search_url = f"https://x.com/search?q={encoded_query}&src=typed_query&f=top"
-            
-            self.auto_log(f"🔍 Searching: {search_url}")
-            
-            # Get tweets from search results
-            tweets = self._get_tweets_from_search(search_url, max_tweets, accounts)
-            
-            if not tweets:
-                self.auto_log("❌ No tweets found for the search query.", is_error=True)
-                return
-            
-            self.auto_log(f"📊 Found {len(tweets)} tweets to process")
-            
-            # Process tweets
-            for i, tweet_url in enumerate(tweets):
-                if not self.auto_yapping_running:
-                    break
-                
-                while self.auto_yapping_paused:
-                    time.sleep(1)
-                    if not self.auto_yapping_running:
-                        return
-                
-                # Clean the URL to get base tweet URL
-                base_tweet_url = tweet_url.split('/photo/')[0].split('/video/')[0].split('/gif/')[0]
-                
-                # Check if already replied
-                if base_tweet_url in self.replied_tweets_db:
-                    self.auto_log(f"⏭️ Skipping already replied tweet: {base_tweet_url}")
-                    continue
-                
-                self.auto_log(f"📝 Processing tweet {i+1}/{len(tweets)}: {base_tweet_url}")
-                
-                # Process this tweet
-                success = self._process_single_tweet(base_tweet_url, accounts, custom_prompt, min_chars, max_chars)
-                
-                if success:
-                    self.auto_yapping_stats['successful'] += 1
-                    self.replied_tweets_db[base_tweet_url] = time.time()
-                else:
-                    self.auto_yapping_stats['failed'] += 1
-                
-                self.auto_yapping_stats['processed'] += 1
-                
-                # Update progress
-                self.after(0, lambda: self.update_progress(i+1, len(tweets), self.auto_yapping_stats))
-                
-                # Wait before next tweet - but only if review is not enabled or review is complete
-                if i < len(tweets) - 1 and self.auto_yapping_running:
-                    # Check if review is enabled
-                    review_enabled = hasattr(self, 'review_before_posting_var') and self.review_before_posting_var.get()
-                    
-                    if review_enabled:
-                        # Wait for review dialog to be closed
-                        self.auto_log("⏳ Waiting for user review completion...")
-                        while hasattr(self, '_review_dialog_open') and self._review_dialog_open:
-                            time.sleep(0.5)  # Check every 500ms
-                            if not self.auto_yapping_running:
-                                return
-                        
-                        # After review is complete, apply the time interval
-                        wait_time = random.randint(min_interval, max_interval)
-                        self.auto_log(f"⏱️ Review completed. Waiting {wait_time} seconds before next tweet...")
-                        time.sleep(wait_time)
-                    else:
-                        # No review enabled, apply timer immediately
-                        wait_time = random.randint(min_interval, max_interval)
-                        self.auto_log(f"⏱️ Waiting {wait_time} seconds before next tweet...")
-                        time.sleep(wait_time)
-            
-            self.auto_log("🎉 Auto yapping completed!")
+            summary = engine.run()
+            completed = not summary['stopped']
+            if completed:
+                self.auto_log("🎉 Auto yapping completed!")
             
         except Exception as e:
             self.auto_log(f"❌ Error in auto yapping: {e}", is_error=True)
         finally:
+            if completed:
+                engine.journal.finish('completed')
+            else:
+                engine.journal.close()
+                self.auto_log("💾 Progress saved - press Start to resume this run")
             # Update UI
-            self.after(0, lambda: self.stop_auto_button.config(state='disabled'))
-            self.after(0, lambda: self.start_auto_button.config(state='normal'))
-            self.after(0, lambda: self.pause_auto_button.config(state='disabled'))
+            self.ui_events.state((self, 'auto_buttons'), self._set_auto_buttons, False)
             self.auto_yapping_running = False
 
-    def _get_tweets_from_search(self, search_url, max_tweets, selected_accounts=None):
-        """Get tweet URLs from search results"""
-        try:
-            # Use the first selected account to scrape search results
-            if not selected_accounts:
-                # Fallback: Get selected accounts from the listbox
-                selected_indices = self.auto_accounts_listbox.curselection()
-                if not selected_indices:
-                    self.auto_log("❌ No accounts selected for scraping.", is_error=True)
-                    return []
-                
-                # Get the selected accounts
-                selected_accounts = []
-                for index in selected_indices:
-                    account_label = self.auto_accounts_listbox.get(index)
-                    # Find the account object
-                    for acc in self.accounts:
-                        if acc.label == account_label:
-                            selected_accounts.append(acc)
-                            break
-            
-            if not selected_accounts:
-                self.auto_log("❌ No valid accounts found for scraping.", is_error=True)
-                return []
-            
-            scraping_account = selected_accounts[0]  # Use first selected account
-            self.auto_log(f"🔍 Using account '{scraping_account.label}' for scraping search results")
-            
-            from selenium_manager import get_global_driver_manager
-            driver = get_global_driver_manager().get_driver(scraping_account)
-            if not driver:
-                self.auto_log("❌ Failed to get driver for scraping.", is_error=True)
-                return []
-            
-            try:
-                self.auto_log(f"🌐 Navigating to search URL: {search_url}")
-                driver.get(search_url)
-                time.sleep(5)  # Wait longer for search results to load
-                
-                # Check if we're on the search page
-                current_url = driver.current_url
-                self.auto_log(f"📍 Current URL: {current_url}")
-                
-                # Check if redirected to login
-                if 'login' in current_url.lower() or 'i/flow/login' in current_url.lower():
-                    self.auto_log("❌ Account is not logged in. Please log in first.")
-                    return []
-                
-                if 'search' not in current_url.lower():
-                    self.auto_log("⚠️ Not on search page, trying to navigate again...")
-                    driver.get(search_url)
-                    time.sleep(3)
-                    
-                    # Check again after retry
-                    current_url = driver.current_url
-                    if 'login' in current_url.lower() or 'i/flow/login' in current_url.lower():
-                        self.auto_log("❌ Account is not logged in after retry. Please log in first.")
-                        return []
-                
-                # Wait for search results to load
-                try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'article[data-testid="tweet"]'))
-                    )
-                    self.auto_log("✅ Search results loaded successfully")
-                except Exception as e:
-                    self.auto_log(f"⚠️ Search results not found: {e}")
-                    # Check if we're still on search page
-                    current_url = driver.current_url
-                    if 'search' not in current_url.lower():
-                        self.auto_log("❌ Not on search page. Check if account is logged in.")
-                        return []
-                
-                # Scroll to load more tweets
-                self.auto_log("📜 Scrolling to load tweets...")
-                for i in range(5):  # Scroll 5 times
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                    self.auto_log(f"📜 Scroll {i+1}/5 completed")
-                
-                # Extract tweet URLs with better selectors
-                tweet_urls = []
-                
-                # Method 1: Find all tweet articles and extract URLs
-                tweet_articles = driver.find_elements(By.CSS_SELECTOR, 'article[data-testid="tweet"]')
-                self.auto_log(f"📊 Found {len(tweet_articles)} tweet articles")
-                
-                for i, article in enumerate(tweet_articles):
-                    try:
-                        # Look for links within the article
-                        links = article.find_elements(By.CSS_SELECTOR, 'a[href*="/status/"]')
-                        for link in links:
-                            href = link.get_attribute('href')
-                            if href and '/status/' in href:
-                                # Clean the URL to get the base tweet URL (remove photo/1, etc.)
-                                base_url = href.split('/photo/')[0].split('/video/')[0].split('/gif/')[0]
-                                if base_url not in tweet_urls:
-                                    tweet_urls.append(base_url)
-                                    self.auto_log(f"📝 Found tweet {len(tweet_urls)}: {base_url}")
-                                    break  # Only take the first link per article
-                    except Exception as e:
-                        continue
-                
-                # Method 2: If Method 1 didn't work well, try direct link extraction
-                if len(tweet_urls) < 5:
-                    self.auto_log("🔄 Trying alternative URL extraction method...")
-                    all_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/status/"]')
-                    self.auto_log(f"🔗 Found {len(all_links)} total links")
-                    
-                    for link in all_links:
-                        href = link.get_attribute('href')
-                        if href and '/status/' in href:
-                            # Clean the URL to get the base tweet URL
-                            base_url = href.split('/photo/')[0].split('/video/')[0].split('/gif/')[0]
-                            if base_url not in tweet_urls:
-                                tweet_urls.append(base_url)
-                                self.auto_log(f"📝 Found tweet {len(tweet_urls)}: {base_url}")
-                
-                # Remove duplicates and limit
-                unique_urls = list(dict.fromkeys(tweet_urls))[:max_tweets]
-                
-                self.auto_log(f"📊 Found {len(tweet_urls)} total URLs")
-                self.auto_log(f"📊 Extracted {len(unique_urls)} unique tweets")
-                
-                # Log some example URLs for debugging
-                for i, url in enumerate(unique_urls[:3]):
-                    self.auto_log(f"📝 Example URL {i+1}: {url}")
-                
-                if len(unique_urls) == 0:
-                    self.auto_log("❌ No tweets found in search results. Check if the search query is valid.")
-                
-                return unique_urls
-                
-            finally:
-                driver.quit()
-                
-        except Exception as e:
-            self.auto_log(f"❌ Error getting tweets from search: {e}", is_error=True)
-            return []
-
-    def _process_single_tweet(self, tweet_url, accounts, custom_prompt, min_chars, max_chars):
-        """Process a single tweet with all accounts"""
-        try:
-            # Use the first selected account for scraping
-            scraping_account = accounts[0] if accounts else None
-            if not scraping_account:
-                self.auto_log("❌ No accounts available for scraping.")
-                return False
-            
-            # First check if tweet is accessible
-            self.auto_log(f"🔍 Checking tweet accessibility using account: {scraping_account.label}")
-            from selenium_manager import check_tweet_accessibility, get_global_driver_manager
-            
-            driver_manager = get_global_driver_manager()
-            driver = driver_manager.get_driver(scraping_account)
-            
-            if not driver:
-                self.auto_log(f"❌ No driver available for {scraping_account.label}")
-                return False
-            
-            # Check accessibility first
-            if not check_tweet_accessibility(driver, tweet_url):
-                self.auto_log(f"❌ Tweet is not accessible: {tweet_url}")
-                return False
-            
-            self.auto_log(f"✅ Tweet is accessible, scraping content...")
-            tweet_content, comments, success = scrape_tweet_content_and_comments_with_account(scraping_account, tweet_url)
-            
-            if not success or not tweet_content.strip():
-                self.auto_log(f"❌ Failed to scrape tweet content: {tweet_url}")
-                return False
-            
-            # Generate AI reply for each account separately
-            ai_provider = self.get_current_ai_provider()
-            if not ai_provider:
-                self.auto_log("❌ No AI provider available.")
-                return False
-            
-            # Clean the tweet content for AI and include comments context
-            cleaned_content = tweet_content[:500]  # Limit content length
-            
-            # Store comments for review dialog
-            self.scraped_comments = comments
-            
-            # Add comments context if available
-            if comments and len(comments) > 0:
-                comments_context = "\n\n--- Comments Context ---\n"
-                # Include up to 5 comments for context
-                for i, comment in enumerate(comments[:5]):
-                    comments_context += f"Comment {i+1}: {comment}\n"
-                cleaned_content += comments_context
-                self.auto_log(f"📝 Added {len(comments[:5])} comments to AI context")
-            
-            # Generate comments for all accounts
-            generated_comments = {}
-            for account in accounts:
-                if not self.auto_yapping_running:
-                    break
-                
-                self.auto_log(f"🤖 Generating reply for account: {account.label}")
-                
-                # Generate unique reply for this specific account
-                unique_reply = self._generate_unique_reply(ai_provider, cleaned_content, custom_prompt, account.label, tweet_url, min_chars, max_chars)
-                
-                if not unique_reply:
-                    self.auto_log(f"❌ Failed to generate unique reply for {account.label}")
-                    continue
-                
-                generated_comments[account.label] = unique_reply
-                self.auto_log(f"💭 Generated unique reply for {account.label}: {unique_reply[:50]}...")
-            
-            # Check if review is enabled
-            if hasattr(self, 'review_before_posting_var') and self.review_before_posting_var.get():
-                # Show review dialog
-                self.auto_log(f"📝 Showing review dialog for tweet: {tweet_url}")
-                
-                # Set a flag to indicate the dialog is open
-                self._review_dialog_open = True
-                
-                # Use after() to ensure dialog is shown in main thread
-                self.after(0, lambda: self._show_review_dialog(
-                    tweet_url, tweet_content, accounts, generated_comments, custom_prompt, min_chars, max_chars
-                ))
-                
-                # Wait for dialog to be closed (this will be handled by the dialog)
-                return True
+    def _on_auto_engine_event(self, event):
+        """Campaign engine events (worker thread) as log lines, stats and progress"""
+        kind = event['event']
+        if kind == 'log':
+            self.auto_log(event['message'], is_error=event['level'] == 'error')
+        elif kind == 'action':
+            if event['success']:
+                self.replied_tweets_db[event['target']] = time.time()
+                self.auto_log(f"✅ Successfully replied with {event['account']}")
             else:
-                # Post immediately without review
-                success_count = 0
-                for account in accounts:
-                    if not self.auto_yapping_running:
-                        break
-                    
-                    if account.label not in generated_comments:
-                        continue
-                    
-                    comment = generated_comments[account.label]
-                    self.auto_log(f"🤖 Replying with account: {account.label}")
-                    
-                    try:
-                        from selenium_manager import reply_to_tweet
-                        success, message = reply_to_tweet(account, tweet_url, comment)
-                        
-                        if success:
-                            self.auto_log(f"✅ Successfully replied with {account.label}")
-                            success_count += 1
-                        else:
-                            self.auto_log(f"❌ Failed to reply with {account.label}: {message}")
-                            
-                    except Exception as e:
-                        self.auto_log(f"❌ Error replying with {account.label}: {e}")
-                    
-                    # Wait between accounts
-                    if account != accounts[-1]:
-                        time.sleep(random.randint(10, 30))
-                
-                return success_count > 0
-            
-        except Exception as e:
-            self.auto_log(f"❌ Error processing tweet: {e}", is_error=True)
-            return False 
+                self.auto_log(f"❌ Failed to reply with {event['account']}: {event['message']}", is_error=True)
+            # The stats dict is only touched on the main thread
+            self.ui_events.stats((self, 'auto_stats'), self._apply_auto_stats, processed=1,
+                                 successful=int(event['success']), failed=int(not event['success']))
+        elif kind == 'progress':
+            self.ui_events.progress((self, 'auto_progress'), self.update_progress, event['done'], event['total'])
+
+    def _review_replies(self, tweet_url, tweet_content, comments, replies):
+        """Campaign engine review hook (worker thread): wait for the review dialog's decision"""
+        engine = self.auto_engine
+        if not (hasattr(self, 'review_before_posting_var') and self.review_before_posting_var.get()):
+            return replies
+        
+        decision = {}
+        closed = threading.Event()
+        
+        def on_close(edited):
+            decision['replies'] = edited
+            closed.set()
+        
+        self.auto_log(f"📝 Showing review dialog for tweet: {tweet_url}")
+        accounts = [acc for acc in self.accounts if acc.label in replies]
+        max_chars = int(engine.campaign['jobs'][0].get('max_chars', 280))
+        self.ui_events.call(self._show_review_dialog, tweet_url, tweet_content, comments, accounts, replies,
+                            max_chars, on_close)
+        
+        self.auto_log("⏳ Waiting for user review completion...")
+        while not closed.wait(0.5):
+            if engine.stopped:
+                return None
+        return decision['replies']
 
     def _generate_unique_reply(self, ai_provider, tweet_content, custom_prompt, account_label, tweet_url, min_chars, max_chars):
         """Generate a unique reply for each account to avoid caching"""
         try:
-            # Add unique elements to prevent caching
-            import random
-            import time
-            
-            # Create unique content by adding account, timestamp, and random elements
-            unique_content = f"{tweet_content}\n\n[Account: {account_label}]\n[Timestamp: {int(time.time())}]\n[Random: {random.randint(1000, 9999)}]\n[UniqueID: {random.randint(100000, 999999)}]"
-            
-            # Generate reply with enhanced context and character limits
-            # The tweet_content now includes comments context from _process_single_tweet
-            reply_text = ai_provider.generate_comment_from_tweet_with_limits(unique_content, custom_prompt, min_chars, max_chars)
-            
-            if not reply_text:
-                return None
-            
-            # Remove any remaining hashtags and emojis
-            import re
-            reply_text = re.sub(r'#\w+', '', reply_text)  # Remove hashtags
-            reply_text = re.sub(r'[^\x00-\x7F\u00A0-\uFFFF]', '', reply_text)  # Remove emojis
-            reply_text = re.sub(r'\s+', ' ', reply_text).strip()  # Clean whitespace
-            
-            # Ensure it's within character limit
-            if len(reply_text) > max_chars:
-                reply_text = reply_text[:max_chars]
-            elif len(reply_text) < min_chars:
-                # If too short, try to expand naturally
-                reply_text = ai_provider._expand_short_reply_with_limits(reply_text, tweet_content, min_chars, max_chars)
-            
-            # Final length check
-            if len(reply_text) < min_chars:
-                # If still too short, add a natural follow-up
-                follow_ups = [
-                    " What do you think about this?",
-                    " I'm curious about your thoughts.",
-                    " How has your experience been?",
-                    " Any insights to share?",
-                    " What's your take on this?"
-                ]
-                reply_text += random.choice(follow_ups)
-                if len(reply_text) > max_chars:
-                    reply_text = reply_text[:max_chars]
-            
-            return reply_text
-            
+            return generate_unique_reply(ai_provider, tweet_content, custom_prompt, account_label, min_chars, max_chars)
         except Exception as e:
             self.auto_log(f"❌ Error generating unique reply: {e}", is_error=True)
             return None
 
-    def _show_review_dialog(self, tweet_url, tweet_content, accounts, generated_comments, custom_prompt, min_chars, max_chars):
-        """Show review dialog for generated comments"""
+    def _show_review_dialog(self, tweet_url, tweet_content, comments, accounts, generated_comments, max_chars, on_close):
+        """Show review dialog for generated comments; on_close gets the approved replies, or None to skip"""
+        closed = []
+        
+        def close(replies):
+            if not closed:
+                closed.append(True)
+                on_close(replies)
+        
         try:
             # Create review dialog
             review_dialog = tk.Toplevel(self)
@@ -1688,6 +1351,7 @@ class YappingPanel(ttk.Frame):
             review_dialog.minsize(900, 700)  # Set minimum size
             review_dialog.transient(self)
             review_dialog.grab_set()
+            review_dialog.protocol("WM_DELETE_WINDOW", lambda: [close(None), review_dialog.destroy()])
             
             # Center the dialog on screen
             review_dialog.update_idletasks()
@@ -1748,7 +1412,7 @@ class YappingPanel(ttk.Frame):
             tweet_text.config(state='disabled')
             
             # Add comment context display if available
-            if hasattr(self, 'scraped_comments') and self.scraped_comments:
+            if comments:
                 comment_context_frame = ttk.LabelFrame(content_frame, text="💬 Comment Context (Used for AI Generation)", padding="10")
                 comment_context_frame.pack(fill='x', pady=(0, 20))
                 
@@ -1760,7 +1424,7 @@ class YappingPanel(ttk.Frame):
                 comment_context_scrollbar.pack(side='right', fill='y')
                 
                 comment_context_text.config(state='normal')
-                comment_context = "\n".join([f"• {comment}" for comment in self.scraped_comments[:5]])
+                comment_context = "\n".join([f"• {comment}" for comment in comments[:5]])
                 comment_context_text.insert('1.0', comment_context)
                 comment_context_text.config(state='disabled')
             
@@ -1847,8 +1511,12 @@ class YappingPanel(ttk.Frame):
             button_container.pack(expand=True)
             
             def approve_and_post():
-                """Approve and post all comments"""
+                """Approve all comments; the campaign engine posts them"""
                 try:
+                    # The edit boxes may also have been changed from the single comment dialog
+                    for account_label, widgets in comment_widgets.items():
+                        edited_comments[account_label] = widgets['edit_text'].get('1.0', 'end-1c')
+                    
                     # Validate character counts
                     invalid_comments = []
                     for account_label, comment in edited_comments.items():
@@ -1860,36 +1528,18 @@ class YappingPanel(ttk.Frame):
                                           f"The following comments exceed the character limit:\n\n" + "\n".join(invalid_comments))
                         return
                     
-                    # Post comments
-                    success_count = 0
-                    for account_label, comment in edited_comments.items():
-                        if comment.strip():  # Only post non-empty comments
-                            try:
-                                from selenium_manager import reply_to_tweet
-                                success, message = reply_to_tweet(comment_widgets[account_label]['account'], tweet_url, comment)
-                                if success:
-                                    success_count += 1
-                                    self.auto_log(f"✅ Posted comment for {account_label}")
-                                else:
-                                    self.auto_log(f"❌ Failed to post comment for {account_label}: {message}")
-                            except Exception as e:
-                                self.auto_log(f"❌ Error posting comment for {account_label}: {e}")
-                    
-                    self.auto_log(f"✅ Posted {success_count}/{len(edited_comments)} comments")
-                    # Clear the review dialog flag before destroying
-                    if hasattr(self, '_review_dialog_open'):
-                        self._review_dialog_open = False
+                    approved = {label: comment for label, comment in edited_comments.items() if comment.strip()}
+                    self.auto_log(f"✅ Approved {len(approved)}/{len(edited_comments)} comments")
+                    close(approved)
                     review_dialog.destroy()
                     
                 except Exception as e:
-                    messagebox.showerror("Error", f"Error posting comments: {e}")
+                    messagebox.showerror("Error", f"Error approving comments: {e}")
             
             def skip_tweet():
                 """Skip this tweet"""
                 self.auto_log(f"⏭️ Skipped tweet: {tweet_url}")
-                # Clear the review dialog flag before destroying
-                if hasattr(self, '_review_dialog_open'):
-                    self._review_dialog_open = False
+                close(None)
                 review_dialog.destroy()
             
             def edit_individual_comment(account_label):
@@ -1900,7 +1550,7 @@ class YappingPanel(ttk.Frame):
             # Buttons with better spacing and visibility
             ttk.Button(button_container, text="✅ Approve & Post All", command=approve_and_post, style='Accent.TButton').pack(side='left', padx=(0, 15))
             ttk.Button(button_container, text="⏭️ Skip Tweet", command=skip_tweet).pack(side='left', padx=(0, 15))
-            ttk.Button(button_container, text="❌ Cancel", command=lambda: [setattr(self, '_review_dialog_open', False) if hasattr(self, '_review_dialog_open') else None, review_dialog.destroy()]).pack(side='right')
+            ttk.Button(button_container, text="❌ Cancel", command=lambda: [close(None), review_dialog.destroy()]).pack(side='right')
             
             # Ensure buttons are visible by scrolling to bottom if needed
             def ensure_buttons_visible():
@@ -1910,6 +1560,7 @@ class YappingPanel(ttk.Frame):
             review_dialog.after(500, ensure_buttons_visible)  # Ensure buttons are visible after dialog loads
             
         except Exception as e:
+            close(None)
             self.auto_log(f"❌ Error showing review dialog: {e}", is_error=True)
             messagebox.showerror("Error", f"Error showing review dialog: {e}")
 
@@ -2175,6 +1826,7 @@ class YappingPanel(ttk.Frame):
         # Start worker thread
         threading.Thread(target=self._load_tweet_contents_worker, args=(urls,), daemon=True).start()
     
+    @traced()
     def _load_tweet_contents_worker(self, urls):
         """Worker thread for loading tweet contents"""
         try:
@@ -2207,7 +1859,7 @@ class YappingPanel(ttk.Frame):
                 
                 # Update progress
                 progress = ((i + 1) / total_urls) * 100
-                self.after(0, lambda p=progress: self._update_progress(p))
+                self.ui_events.progress((self, 'progress'), self._update_progress, progress)
                 
                 if success:
                     self.log(f"✅ Successfully loaded tweet {i+1}/{total_urls}")
@@ -2215,7 +1867,7 @@ class YappingPanel(ttk.Frame):
                     self.log(f"❌ Failed to load tweet {i+1}/{total_urls}")
             
             # Update UI
-            self.after(0, self._update_tweet_display)
+            self.ui_events.state((self, 'tweet_display'), self._update_tweet_display)
             self.log(f"✅ Completed loading {len(self.tweets_data)} tweets")
             
         except Exception as e:
@@ -2310,13 +1962,14 @@ class YappingPanel(ttk.Frame):
         threading.Thread(target=self._generate_ai_comment_worker, 
                        args=(current_tweet, custom_prompt), daemon=True).start()
     
+    @traced()
     def _generate_ai_comment_worker(self, tweet_data, custom_prompt):
         """Worker thread for generating AI comment"""
         try:
             # Get AI provider
             ai_provider = self.get_current_ai_provider()
             if not ai_provider:
-                self.after(0, lambda: self.log("❌ No AI provider configured", is_error=True))
+                self.log("❌ No AI provider configured", is_error=True)
                 return
             
             # Generate comment
@@ -2332,13 +1985,13 @@ class YappingPanel(ttk.Frame):
             
             if comment:
                 # Update the reply text
-                self.after(0, lambda: self._update_reply_text(comment))
-                self.after(0, lambda: self.log(f"✅ Generated AI comment: {len(comment)} characters"))
+                self.ui_events.call(self._update_reply_text, comment)
+                self.log(f"✅ Generated AI comment: {len(comment)} characters")
             else:
-                self.after(0, lambda: self.log("❌ Failed to generate AI comment", is_error=True))
+                self.log("❌ Failed to generate AI comment", is_error=True)
                 
         except Exception as e:
-            self.after(0, lambda: self.log(f"❌ Error generating AI comment: {e}", is_error=True))
+            self.log(f"❌ Error generating AI comment: {e}", is_error=True)
     
     def _update_reply_text(self, comment):
         """Update the reply text with generated comment"""
@@ -2435,6 +2088,7 @@ class YappingPanel(ttk.Frame):
         threading.Thread(target=self._send_single_reply_worker, 
                        args=(current_tweet, selected_accounts, reply_text), daemon=True).start()
     
+    @traced()
     def _send_single_reply_worker(self, tweet_data, selected_accounts, reply_text):
         """Worker thread for sending a single reply"""
         try:
@@ -2447,30 +2101,40 @@ class YappingPanel(ttk.Frame):
                     success, message = reply_to_tweet(account, tweet_data['url'], reply_text)
                     
                     if success:
-                        self.after(0, lambda acc=account: self.log(f"✅ Reply sent successfully with {acc.label}"))
+                        self.log(f"✅ Reply sent successfully with {account.label}", account=account.label, action='reply')
                         success_count += 1
                     else:
-                        self.after(0, lambda acc=account, msg=message: self.log(f"❌ Failed to send reply with {acc.label}: {msg}", is_error=True))
+                        self.log(f"❌ Failed to send reply with {account.label}: {message}", is_error=True,
+                                 account=account.label, action='reply')
                         failed_count += 1
                     
                     # Wait between accounts
                     if account != selected_accounts[-1]:
                         wait_time = random.randint(5, 15)
-                        self.after(0, lambda wt=wait_time: self.log(f"⏱️ Waiting {wt} seconds before next account..."))
+                        self.log(f"⏱️ Waiting {wait_time} seconds before next account...")
                         time.sleep(wait_time)
                         
                 except Exception as e:
-                    self.after(0, lambda acc=account, err=str(e): self.log(f"❌ Error sending reply with {acc.label}: {err}", is_error=True))
+                    self.log(f"❌ Error sending reply with {account.label}: {str(e)}", is_error=True)
                     failed_count += 1
             
             # Final summary
-            self.after(0, lambda: self.log(f"📊 Reply process completed: {success_count} success, {failed_count} failed"))
+            self.log(f"📊 Reply process completed: {success_count} success, {failed_count} failed")
             
         except Exception as e:
-            self.after(0, lambda: self.log(f"❌ Error in reply worker: {e}", is_error=True))
+            self.log(f"❌ Error in reply worker: {e}", is_error=True)
     
     def start_manual_reply_process(self):
         """Start the manual reply process for all tweets"""
+        # A run cut short by a crash or Stop can pick up where it left off
+        journal = latest_unfinished_run('manual_reply')
+        if journal:
+            if messagebox.askyesno("Resume Run", f"An unfinished reply run was found ({journal.describe()}).\n\n"
+                                                 "Resume it where it stopped?"):
+                self._resume_manual_reply_process(journal)
+                return
+            journal.finish('abandoned')
+
         if not self.tweets_data:
             messagebox.showerror("Error", "No tweets loaded. Please load tweet contents first.")
             return
@@ -2491,9 +2155,33 @@ class YappingPanel(ttk.Frame):
             messagebox.showerror("Error", "Min interval cannot be greater than max interval")
             return
         
+        # The loaded tweets and their reply texts are the run's queue
+        journal = RunJournal.create('manual_reply', {
+            'accounts': [acc.label for acc in selected_accounts],
+            'min_interval': min_interval, 'max_interval': max_interval
+        })
+        journal.set_queue('tweets', self.tweets_data)
+        self._start_manual_reply_thread(selected_accounts, min_interval, max_interval, journal)
+
+    def _resume_manual_reply_process(self, journal):
+        """Reload the tweets of an unfinished reply run and continue it"""
+        accounts_by_label = {acc.label: acc for acc in self.accounts}
+        accounts = [accounts_by_label[label] for label in journal.params['accounts'] if label in accounts_by_label]
+        if not accounts or not journal.queue('tweets'):
+            self.log("❌ The unfinished reply run can't be resumed (its accounts or tweets are gone)", is_error=True)
+            journal.finish('abandoned')
+            return
+        self.tweets_data = journal.queue('tweets')
+        self.current_tweet_index = 0
+        self._update_tweet_display()
+        self.log(f"♻️ Resuming reply run {journal.run_id} ({journal.describe()})")
+        self._start_manual_reply_thread(accounts, journal.params['min_interval'], journal.params['max_interval'], journal)
+
+    def _start_manual_reply_thread(self, selected_accounts, min_interval, max_interval, journal):
         # Start processing
         self.is_replying = True
         self.is_paused = False
+        self.manual_journal = journal
         
         # Update UI
         self.start_reply_button.config(state='disabled')
@@ -2502,10 +2190,12 @@ class YappingPanel(ttk.Frame):
         
         # Start worker thread
         threading.Thread(target=self._manual_reply_worker, 
-                       args=(selected_accounts, min_interval, max_interval), daemon=True).start()
+                       args=(selected_accounts, min_interval, max_interval, journal), daemon=True).start()
     
-    def _manual_reply_worker(self, selected_accounts, min_interval, max_interval):
-        """Worker thread for manual reply process"""
+    @traced()
+    def _manual_reply_worker(self, selected_accounts, min_interval, max_interval, journal):
+        """Worker thread for manual reply process, checkpointed to journal"""
+        completed = False
         try:
             total_tweets = len(self.tweets_data)
             processed = 0
@@ -2530,8 +2220,8 @@ class YappingPanel(ttk.Frame):
                 processed += 1
                 progress = (processed / total_tweets) * 100
                 
-                self.after(0, lambda p=progress, proc=processed, succ=success_count, fail=failed_count: 
-                          self._update_manual_progress(p, proc, succ, fail))
+                self.ui_events.progress((self, 'progress'), self._update_manual_progress,
+                                        progress, processed, success_count, failed_count)
                 
                 self.log(f"📝 Processing tweet {processed}/{total_tweets}: {tweet_data['url']}")
                 
@@ -2541,28 +2231,41 @@ class YappingPanel(ttk.Frame):
                     self.log(f"⏭️ Skipping tweet {processed} - no reply text")
                     continue
                 
+                journal.set_cursor('tweet', i)
+                pending = [acc for acc in selected_accounts if not journal.is_handled(tweet_data['url'], acc.label)]
+                if not pending:
+                    self.log(f"⏭️ Skipping tweet {processed} - already replied before the run stopped")
+                    continue
+                
                 # Process with each account
-                for account in selected_accounts:
+                for account in pending:
                     if not self.is_replying:
                         break
                     
+                    journal.record_attempt(tweet_data['url'], account.label)
+                    outcome_recorded = False
                     try:
                         success, message = reply_to_tweet(account, tweet_data['url'], reply_text)
+                        journal.record_outcome(tweet_data['url'], account.label, success, message)
+                        outcome_recorded = True
                         
                         if success:
-                            self.log(f"✅ Reply sent successfully with {account.label}")
+                            self.log(f"✅ Reply sent successfully with {account.label}", account=account.label, action='reply')
                             success_count += 1
                         else:
-                            self.log(f"❌ Failed to send reply with {account.label}: {message}", is_error=True)
+                            self.log(f"❌ Failed to send reply with {account.label}: {message}", is_error=True,
+                                     account=account.label, action='reply')
                             failed_count += 1
                         
                         # Wait between accounts
-                        if account != selected_accounts[-1]:
+                        if account != pending[-1]:
                             wait_time = random.randint(min_interval, max_interval)
                             self.log(f"⏱️ Waiting {wait_time} seconds before next account...")
                             time.sleep(wait_time)
                             
                     except Exception as e:
+                        if not outcome_recorded:
+                            journal.record_outcome(tweet_data['url'], account.label, False, str(e))
                         self.log(f"❌ Error processing with {account.label}: {e}", is_error=True)
                         failed_count += 1
                 
@@ -2573,13 +2276,20 @@ class YappingPanel(ttk.Frame):
                     time.sleep(wait_time)
             
             # Final update
-            self.after(0, lambda: self._update_manual_progress(100, processed, success_count, failed_count))
+            self.ui_events.progress((self, 'progress'), self._update_manual_progress,
+                                    100, processed, success_count, failed_count)
             self.log(f"✅ Manual reply process completed! Success: {success_count}, Failed: {failed_count}")
+            completed = self.is_replying
             
         except Exception as e:
             self.log(f"❌ Error in manual reply worker: {e}", is_error=True)
         finally:
-            self.after(0, self.stop_manual_reply_process)
+            if completed:
+                journal.finish('completed')
+            else:
+                journal.close()
+                self.log("💾 Progress saved - press Start to resume this run")
+            self.ui_events.call(self.stop_manual_reply_process)
     
     def _update_manual_progress(self, progress, processed, success, failed):
         """Update progress bar and stats for manual reply process"""
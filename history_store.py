@@ -0,0 +1,246 @@
+import csv
+import json
+import time
+import sqlite3
+import threading
+import functools
+from datetime import datetime
+from constants import HISTORY_DB
+from metrics import get_metrics
+from tracing import get_tracer
+from sampling_profiler import profile_tags
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS actions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    account TEXT NOT NULL,
+    action TEXT NOT NULL,
+    target TEXT,
+    success INTEGER NOT NULL,
+    latency_ms REAL,
+    error_class TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_actions_ts ON actions(ts);
+CREATE INDEX IF NOT EXISTS idx_actions_account_ts ON actions(account, ts);
+CREATE INDEX IF NOT EXISTS idx_actions_success_ts ON actions(success, ts);
+"""
+
+# Rows fetched per query while exporting
+EXPORT_CHUNK_ROWS = 1000
+
+EXPORT_COLUMNS = ('id', 'time', 'account', 'action', 'target', 'success', 'latency_ms', 'error_class', 'message')
+
+# Failure messages mapped to error classes, checked in order (lowercase substrings)
+ERROR_CLASSES = (
+    ('login', 'not_logged_in'),
+    ('driver', 'no_browser'),
+    ('browser session', 'no_browser'),
+    ('not accessible', 'tweet_unavailable'),
+    ('unavailable', 'tweet_unavailable'),
+    ('could not find', 'element_not_found'),
+    ('timeout', 'timeout'),
+    ('timed out', 'timeout'),
+)
+
+
+def classify_error(message):
+    """Short error class for a failed action's message"""
+    text = (message or '').lower()
+    for needle, error_class in ERROR_CLASSES:
+        if needle in text:
+            return error_class
+    return 'action_failed'
+
+
+class HistoryStore:
+    """SQLite log of every account action (one row per attempt).
+
+    Rows are indexed by time, account and outcome, and read newest first in
+    pages. Paging uses a (ts, id) cursor rather than OFFSET so later pages
+    cost the same as the first. Exports walk the same cursor in chunks, so
+    they never load the whole history into memory.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def record(self, account, action, target=None, success=True, latency_ms=None,
+               error_class=None, message=None, ts=None):
+        """Add one action row"""
+        if not success and error_class is None:
+            error_class = classify_error(message)
+        self._execute(
+            'INSERT INTO actions (ts, account, action, target, success, latency_ms, error_class, message) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (ts or time.time(), account, action, target, 1 if success else 0, latency_ms, error_class, message))
+
+    @staticmethod
+    def _where(account=None, action=None, success=None, since=None, until=None):
+        clauses, params = [], []
+        if account:
+            clauses.append('account = ?')
+            params.append(account)
+        if action:
+            clauses.append('action = ?')
+            params.append(action)
+        if success is not None:
+            clauses.append('success = ?')
+            params.append(1 if success else 0)
+        if since is not None:
+            clauses.append('ts >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('ts < ?')
+            params.append(until)
+        return clauses, params
+
+    def query(self, limit=50, cursor=None, **filters):
+        """One page of rows, newest first.
+
+        Filters: account, action, success (True/False), since/until
+        (timestamps). Pass the returned cursor to get the next page; it is
+        None after the last page.
+        """
+        clauses, params = self._where(**filters)
+        if cursor:
+            clauses.append('(ts < ? OR (ts = ? AND id < ?))')
+            params.extend([cursor[0], cursor[0], cursor[1]])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        rows = self._execute(f'SELECT * FROM actions {where} ORDER BY ts DESC, id DESC LIMIT ?', params + [limit + 1])
+        has_more = len(rows) > limit
+        rows = [dict(row) for row in rows[:limit]]
+        next_cursor = (rows[-1]['ts'], rows[-1]['id']) if has_more else None
+        return rows, next_cursor
+
+    def count(self, **filters):
+        clauses, params = self._where(**filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self._execute(f'SELECT COUNT(*) FROM actions {where}', params)[0][0]
+
+    def accounts(self):
+        """Account labels that have history"""
+        return [row[0] for row in self._execute('SELECT DISTINCT account FROM actions ORDER BY account')]
+
+    def iter_rows(self, chunk_rows=EXPORT_CHUNK_ROWS, **filters):
+        """All matching rows, newest first, fetched a chunk at a time"""
+        cursor = None
+        while True:
+            rows, cursor = self.query(limit=chunk_rows, cursor=cursor, **filters)
+            yield from rows
+            if cursor is None:
+                return
+
+    @staticmethod
+    def _export_row(row):
+        return {
+            'id': row['id'],
+            'time': datetime.fromtimestamp(row['ts']).isoformat(timespec='seconds'),
+            'account': row['account'],
+            'action': row['action'],
+            'target': row['target'],
+            'success': bool(row['success']),
+            'latency_ms': row['latency_ms'],
+            'error_class': row['error_class'],
+            'message': row['message'],
+        }
+
+    def export(self, path, fmt='csv', **filters):
+        """Stream matching rows to a CSV or JSONL file; returns the row count"""
+        written = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS) if fmt == 'csv' else None
+            if writer:
+                writer.writeheader()
+            for row in self.iter_rows(**filters):
+                record = self._export_row(row)
+                if writer:
+                    writer.writerow(record)
+                else:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                written += 1
+        return written
+
+    def clear(self, before=None):
+        """Delete all rows, or only those older than 'before'; returns how many were removed"""
+        with self._lock:
+            if before is None:
+                cursor = self._conn.execute('DELETE FROM actions')
+            else:
+                cursor = self._conn.execute('DELETE FROM actions WHERE ts < ?', (before,))
+            return cursor.rowcount
+
+
+def recorded_action(action, target_arg=None):
+    """Record every call of an account action (acc first) in the history store.
+
+    The wrapped function returns a bool or a (success, message) tuple;
+    target_arg is the positional index (acc is 0) of the argument saved
+    as the target.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(acc, *args, **kwargs):
+            started = time.perf_counter()
+            target = args[target_arg - 1] if target_arg and len(args) >= target_arg else None
+            label = getattr(acc, 'label', str(acc))
+            with profile_tags(account=label, action=action), \
+                    get_tracer().span(f'action.{action}', account=label, target=target) as span:
+                try:
+                    result = func(acc, *args, **kwargs)
+                except Exception as e:
+                    _record_safely(acc, action, target, False, started, type(e).__name__, str(e))
+                    raise
+                if isinstance(result, tuple):
+                    success, message = bool(result[0]), (str(result[1]) if len(result) > 1 else None)
+                else:
+                    success, message = bool(result), None
+                span.set(success=success, message=message)
+            _record_safely(acc, action, target, success, started, None, message)
+            return result
+        return wrapper
+    return decorator
+
+
+def _record_safely(acc, action, target, success, started, error_class, message):
+    if not success and error_class is None:
+        error_class = classify_error(message)
+    metrics = get_metrics()
+    metrics.increment('actions', action)
+    if not success:
+        metrics.increment('action_failures', action)
+        metrics.increment('failure_causes', error_class)
+    try:
+        get_history_store().record(
+            getattr(acc, 'label', str(acc)), action, target=None if target is None else str(target),
+            success=success, latency_ms=(time.perf_counter() - started) * 1000,
+            error_class=error_class, message=message)
+    except Exception as e:
+        print(f"⚠️ Could not record {action} in history: {e}")
+
+
+_history_store = None
+_history_store_lock = threading.Lock()
+
+def get_history_store():
+    """Get or create the global action history store"""
+    global _history_store
+    with _history_store_lock:
+        if _history_store is None:
+            _history_store = HistoryStore()
+        return _history_store
@@ -0,0 +1,124 @@
+import threading
+from collections import deque
+from utils import log_to_file
+
+# Lines kept per channel, both in memory and in the attached Text widget
+LOG_RING_SIZE = 1000
+
+# How often the Tk side drains pending lines
+LOG_DRAIN_INTERVAL_MS = 100
+
+
+class LogChannel:
+    """One log stream (usually one Text widget in a panel).
+
+    write() is safe from any thread: it only appends to two bounded deques,
+    which are atomic under the GIL. The Tk side moves pending lines into the
+    widget in one insert per drain, and the ring buffer keeps the recent
+    history so a widget attached later starts with it.
+    """
+
+    def __init__(self, name, file_name=None, max_lines=LOG_RING_SIZE):
+        self.name = name
+        self.file_name = file_name
+        self.max_lines = max_lines
+        self.lines = deque(maxlen=max_lines)    # (message, is_error) history
+        self._pending = deque(maxlen=max_lines)  # not yet shown in the widget
+        self.widget = None
+
+    def write(self, message, is_error=False, **fields):
+        entry = (message, is_error)
+        self.lines.append(entry)
+        self._pending.append(entry)
+        if self.file_name:
+            log_to_file(self.file_name, message, **fields)
+
+    def attach(self, widget):
+        """Show this channel in a Text widget, starting with the buffered history (main thread)"""
+        self.widget = widget
+        self._pending.clear()
+        widget.tag_configure('error', foreground='red')
+        self._insert(list(self.lines))
+
+    def drain(self):
+        """Move pending lines into the widget (main thread)"""
+        entries = []
+        for _ in range(len(self._pending)):
+            try:
+                entries.append(self._pending.popleft())
+            except IndexError:
+                break
+        if not entries:
+            return
+        if self.widget is not None:
+            self._insert(entries)
+
+    def _insert(self, entries):
+        if not entries:
+            return
+        widget = self.widget
+        try:
+            if not widget.winfo_exists():
+                self.widget = None
+                return
+            # One insert for the whole batch, tagging error lines
+            args = []
+            for message, is_error in entries:
+                args.extend((message + '\n', ('error',) if is_error else ()))
+            widget.config(state='normal')
+            widget.insert('end', *args)
+            # Trim the oldest lines beyond the ring size
+            line_count = int(widget.index('end-1c').split('.')[0])
+            if line_count > self.max_lines + 1:
+                widget.delete('1.0', f'{line_count - self.max_lines}.0')
+            widget.see('end')
+            widget.config(state='disabled')
+        except Exception as e:
+            print(f"⚠️ Error updating log {self.name}: {e}")
+
+
+class LogBus:
+    """Registry of log channels, drained into Tk on a timer"""
+
+    def __init__(self, interval_ms=LOG_DRAIN_INTERVAL_MS):
+        self.interval_ms = interval_ms
+        self._channels = {}
+        self._lock = threading.Lock()
+        self._root = None
+
+    def channel(self, name, file_name=None, max_lines=LOG_RING_SIZE):
+        """Get or create a named channel"""
+        with self._lock:
+            if name not in self._channels:
+                self._channels[name] = LogChannel(name, file_name=file_name, max_lines=max_lines)
+            return self._channels[name]
+
+    def start(self, root):
+        """Start draining channels on the Tk main loop"""
+        if self._root is not None:
+            return
+        self._root = root
+        self._drain()
+
+    def _drain(self):
+        with self._lock:
+            channels = list(self._channels.values())
+        for channel in channels:
+            channel.drain()
+        try:
+            self._root.after(self.interval_ms, self._drain)
+        except Exception:
+            # The window is gone
+            self._root = None
+
+
+_log_bus = None
+_log_bus_lock = threading.Lock()
+
+def get_log_bus():
+    """Get or create the global log bus"""
+    global _log_bus
+    with _log_bus_lock:
+        if _log_bus is None:
+            _log_bus = LogBus()
+        return _log_bus
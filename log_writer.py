@@ -0,0 +1,188 @@
+import os
+import json
+import gzip
+import time
+import atexit
+import shutil
+import threading
+from queue import SimpleQueue, Empty
+from datetime import datetime
+
+LOG_DIR = 'logs'
+
+# Buffered bytes per file that trigger a flush before the timer does
+FLUSH_BYTES = 64 * 1024
+
+# Longest a buffered line waits before reaching the disk
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# Rotate a log file once it grows past this size
+MAX_LOG_BYTES = 5 * 1024 * 1024
+
+# Compressed rotations kept per log
+BACKUP_COUNT = 5
+
+_STOP = object()
+
+
+class AsyncLogWriter:
+    """Background writer for the per-panel log files.
+
+    Callers only put a record on a queue; a single thread formats records,
+    keeps one open handle per log, flushes on size or time and rotates files
+    past max_bytes into gzip-compressed backups. With structured=True each
+    record is written as a JSON line (to <name>.jsonl) including any extra
+    fields such as account, action and duration. Pending lines are flushed at
+    interpreter exit.
+    """
+
+    def __init__(self, log_dir=LOG_DIR, structured=False, flush_bytes=FLUSH_BYTES,
+                 flush_interval=FLUSH_INTERVAL_SECONDS, max_bytes=MAX_LOG_BYTES, backup_count=BACKUP_COUNT):
+        self.log_dir = log_dir
+        self.structured = structured
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue = SimpleQueue()
+        self._handles = {}  # log name -> open file
+        self._sizes = {}    # log name -> bytes on disk
+        self._buffers = {}  # log name -> list of formatted lines
+        self._buffered = {}  # log name -> buffered bytes
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, name, message, **fields):
+        """Queue a log line (cheap; safe from any thread)"""
+        if not self._closed:
+            self._queue.put((name, time.time(), message, fields))
+
+    def flush(self, timeout=5):
+        """Block until everything queued so far is on disk"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=5):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+            except Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush_all()
+                self._close_handles()
+                return
+            if isinstance(item, threading.Event):
+                self._flush_all()
+                item.set()
+            elif item is not None:
+                try:
+                    self._buffer(*item)
+                except Exception as e:
+                    print(f"⚠️ Log writer error: {e}")
+
+            if time.monotonic() >= next_flush:
+                self._flush_all()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _buffer(self, name, timestamp, message, fields):
+        if self.structured:
+            record = {'ts': datetime.fromtimestamp(timestamp).isoformat(timespec='milliseconds'),
+                      'log': name, 'message': message}
+            record.update({k: v for k, v in fields.items() if v is not None})
+            line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        else:
+            stamp = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+            extras = ' '.join(f'{k}={v}' for k, v in fields.items() if v is not None)
+            line = f'[{stamp}] {message}' + (f' ({extras})' if extras else '') + '\n'
+
+        self._buffers.setdefault(name, []).append(line)
+        size = self._buffered.get(name, 0) + len(line)
+        self._buffered[name] = size
+        if size >= self.flush_bytes:
+            self._flush(name)
+
+    def _flush_all(self):
+        for name in list(self._buffers):
+            self._flush(name)
+
+    def _flush(self, name):
+        lines = self._buffers.pop(name, None)
+        self._buffered.pop(name, None)
+        if not lines:
+            return
+        try:
+            handle = self._get_handle(name)
+            data = ''.join(lines)
+            handle.write(data)
+            handle.flush()
+            self._sizes[name] = self._sizes.get(name, 0) + len(data.encode('utf-8'))
+            if self._sizes[name] >= self.max_bytes:
+                self._rotate(name)
+        except Exception as e:
+            print(f"⚠️ Could not write log {name}: {e}")
+
+    def _path(self, name):
+        extension = 'jsonl' if self.structured else 'log'
+        return os.path.join(self.log_dir, f'{name}.{extension}')
+
+    def _get_handle(self, name):
+        handle = self._handles.get(name)
+        if handle is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            path = self._path(name)
+            handle = open(path, 'a', encoding='utf-8')
+            self._handles[name] = handle
+            self._sizes[name] = os.path.getsize(path)
+        return handle
+
+    def _rotate(self, name):
+        """Move the current file aside, gzip it and keep the newest backups"""
+        self._handles.pop(name).close()
+        self._sizes.pop(name, None)
+        path = self._path(name)
+        rotated = f"{path}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        os.replace(path, rotated)
+        with open(rotated, 'rb') as src, gzip.open(rotated + '.gz', 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+
+        prefix = os.path.basename(path) + '.'
+        backups = sorted(f for f in os.listdir(self.log_dir) if f.startswith(prefix) and f.endswith('.gz'))
+        for old in backups[:-self.backup_count]:
+            try:
+                os.remove(os.path.join(self.log_dir, old))
+            except OSError:
+                pass
+
+    def _close_handles(self):
+        for handle in self._handles.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._handles.clear()
+
+
+_log_writer = None
+_log_writer_lock = threading.Lock()
+
+def get_log_writer():
+    """Get or create the global log writer (JSON lines when XAUTO_LOG_JSON=1)"""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = AsyncLogWriter(structured=os.getenv('XAUTO_LOG_JSON') == '1')
+        return _log_writer
@@ -0,0 +1,135 @@
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from tracing import get_tracer
+
+# Width of one rolling counter bucket
+BUCKET_SECONDS = 10
+
+# How far back rolling counters reach
+WINDOW_SECONDS = 3600
+
+# Recent latency samples kept per stage for percentiles
+SAMPLES_PER_STAGE = 512
+
+# Browser automation stages timed with timed_stage()
+STAGES = ('launch', 'navigate', 'scrape', 'generate', 'type', 'post')
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Metrics:
+    """In-process counters and timings for the dashboard.
+
+    Recording is a dict update or deque append under one lock, so workers
+    can call it on every action. Counters are rolled into BUCKET_SECONDS
+    buckets (kept for WINDOW_SECONDS) and each stage keeps its most recent
+    latency samples; totals and percentiles are only worked out in
+    snapshot(), which the dashboard calls at its own pace. Sources are
+    callables (browser and OpenAI state) polled by snapshot() as well.
+    """
+
+    def __init__(self, bucket_seconds=BUCKET_SECONDS, window_seconds=WINDOW_SECONDS,
+                 samples_per_stage=SAMPLES_PER_STAGE):
+        self.bucket_seconds = bucket_seconds
+        self.window_seconds = window_seconds
+        self.samples_per_stage = samples_per_stage
+        self._lock = threading.Lock()
+        self._buckets = deque()  # (bucket number, {(name, key): count})
+        self._totals = {}        # (name, key) -> count since start
+        self._samples = {}       # stage -> deque of seconds
+        self._sources = {}       # name -> callable returning a dict
+
+    def increment(self, name, key, amount=1):
+        """Count an event, e.g. increment('actions', 'reply')"""
+        bucket = int(time.time() // self.bucket_seconds)
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != bucket:
+                self._buckets.append((bucket, {}))
+                oldest = bucket - self.window_seconds // self.bucket_seconds
+                while self._buckets and self._buckets[0][0] <= oldest:
+                    self._buckets.popleft()
+            counts = self._buckets[-1][1]
+            counts[(name, key)] = counts.get((name, key), 0) + amount
+            self._totals[(name, key)] = self._totals.get((name, key), 0) + amount
+
+    def observe(self, stage, seconds):
+        """Record how long one run of a stage took"""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.samples_per_stage)
+            samples.append(seconds)
+
+    def register_source(self, name, callback):
+        """Poll callback() for a dict of current values on every snapshot"""
+        with self._lock:
+            self._sources[name] = callback
+
+    def snapshot(self):
+        """Aggregated view: counts per name/key over the last minute and hour,
+        stage latency percentiles and the current source values"""
+        now_bucket = int(time.time() // self.bucket_seconds)
+        minute_start = now_bucket - 60 // self.bucket_seconds
+        hour_start = now_bucket - self.window_seconds // self.bucket_seconds
+        with self._lock:
+            buckets = list(self._buckets)
+            totals = dict(self._totals)
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+            sources = dict(self._sources)
+
+        counts = {}
+        for (name, key), total in totals.items():
+            counts.setdefault(name, {})[key] = {'minute': 0, 'hour': 0, 'total': total}
+        for bucket, bucket_counts in buckets:
+            if bucket <= hour_start:
+                continue
+            for (name, key), amount in bucket_counts.items():
+                entry = counts[name][key]
+                entry['hour'] += amount
+                if bucket > minute_start:
+                    entry['minute'] += amount
+
+        latency = {}
+        for stage, values in samples.items():
+            latency[stage] = {'p50': _percentile(values, 0.5), 'p95': _percentile(values, 0.95), 'samples': len(values)}
+
+        source_values = {}
+        for name, callback in sources.items():
+            try:
+                source_values[name] = callback()
+            except Exception as e:
+                source_values[name] = {'error': str(e)}
+        return {'counts': counts, 'latency': latency, 'sources': source_values, 'taken_at': time.time()}
+
+
+@contextmanager
+def timed_stage(stage, **attrs):
+    """Time a block (or, used as a decorator, a function) as one run of a stage.
+
+    Also traced as a 'stage.<stage>' span when tracing is on.
+    """
+    started = time.perf_counter()
+    try:
+        with get_tracer().span(f'stage.{stage}', **attrs):
+            yield
+    finally:
+        get_metrics().observe(stage, time.perf_counter() - started)
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_metrics():
+    """Get or create the global metrics registry"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+        return _metrics
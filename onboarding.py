@@ -0,0 +1,175 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import X_BASE_URL
+
+LOGIN_URL = f'{X_BASE_URL}/i/flow/login'
+
+# Login browsers open at the same time
+ONBOARDING_CONCURRENCY = 3
+
+# Give up on an account if nobody logs in within this time
+LOGIN_TIMEOUT_SECONDS = 10 * 60
+
+LOGIN_POLL_SECONDS = 1.5
+
+# Job states, in the order a job normally goes through them
+QUEUED = 'Queued'
+OPENING = 'Opening browser'
+WAITING = 'Waiting for login'
+DONE = 'Logged in'
+FAILED = 'Failed'
+SKIPPED = 'Skipped'
+FINISHED_STATES = (DONE, FAILED, SKIPPED)
+
+
+class OnboardingJob:
+    """One account going through login"""
+
+    def __init__(self, acc):
+        self.acc = acc
+        self.state = QUEUED
+        self.message = ''
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def elapsed(self):
+        if not self.started_at:
+            return 0
+        return (self.finished_at or time.time()) - self.started_at
+
+
+def has_session_cookie(driver):
+    """Whether the browser holds X's auth_token cookie (checked over CDP first)"""
+    try:
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+    except Exception:
+        cookies = driver.get_cookies()
+    return any(c.get('name') == 'auth_token' and c.get('value') for c in cookies)
+
+
+class OnboardingQueue:
+    """Logs in newly imported accounts, several browsers at a time.
+
+    Each job opens the account's browser on the login page and watches for
+    X's auth_token cookie over CDP. As soon as it appears the cookies are
+    saved, the account is marked Active and the browser closes, freeing the
+    slot for the next account. on_change(job) is called from worker threads
+    whenever a job changes state.
+    """
+
+    def __init__(self, max_concurrent=ONBOARDING_CONCURRENCY, login_timeout=LOGIN_TIMEOUT_SECONDS, on_change=None):
+        self.max_concurrent = max_concurrent
+        self.login_timeout = login_timeout
+        self.on_change = on_change
+        self.jobs = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='onboarding')
+
+    def add(self, accounts):
+        """Queue accounts for login; returns the new jobs"""
+        new_jobs = [OnboardingJob(acc) for acc in accounts]
+        with self._lock:
+            self.jobs.extend(new_jobs)
+        for job in new_jobs:
+            self._executor.submit(self._run, job)
+        return new_jobs
+
+    def get_job(self, label):
+        with self._lock:
+            return next((job for job in reversed(self.jobs) if job.acc.label == label), None)
+
+    def skip(self, label):
+        """Stop waiting for this account (closes its browser if open)"""
+        job = self.get_job(label)
+        if job and job.state not in FINISHED_STATES:
+            job.cancel_event.set()
+            if job.state == QUEUED:
+                self._set_state(job, SKIPPED)
+
+    def retry(self, label):
+        job = self.get_job(label)
+        if job and job.state in (FAILED, SKIPPED):
+            return self.add([job.acc])[0]
+        return None
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.jobs)
+
+    def counts(self):
+        counts = {}
+        for job in self.snapshot():
+            counts[job.state] = counts.get(job.state, 0) + 1
+        return counts
+
+    def shutdown(self):
+        for job in self.snapshot():
+            job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _set_state(self, job, state, message=''):
+        job.state = state
+        job.message = message
+        if state in FINISHED_STATES:
+            job.finished_at = time.time()
+        if self.on_change:
+            try:
+                self.on_change(job)
+            except Exception as e:
+                print(f"⚠️ Onboarding callback error: {e}")
+
+    def _run(self, job):
+        if job.cancel_event.is_set():
+            return
+        from selenium_manager import get_global_driver_manager
+        from account_manager import get_account_repository
+        acc = job.acc
+        driver_manager = get_global_driver_manager()
+        job.started_at = time.time()
+        self._set_state(job, OPENING)
+
+        try:
+            driver = driver_manager.get_driver(acc)
+            if not driver:
+                self._set_state(job, FAILED, 'Could not open browser')
+                return
+
+            driver.get(LOGIN_URL)
+            self._set_state(job, WAITING, 'Log in in the browser window')
+
+            deadline = time.time() + self.login_timeout
+            logged_in = False
+            while time.time() < deadline and not job.cancel_event.is_set():
+                try:
+                    if has_session_cookie(driver):
+                        logged_in = True
+                        break
+                except Exception as e:
+                    # The operator closed the window
+                    self._set_state(job, FAILED, f'Browser closed: {e}')
+                    driver_manager.close_driver(acc)
+                    return
+                job.cancel_event.wait(LOGIN_POLL_SECONDS)
+
+            if not logged_in:
+                driver_manager.close_driver(acc)
+                if job.cancel_event.is_set():
+                    self._set_state(job, SKIPPED)
+                else:
+                    self._set_state(job, FAILED, 'Timed out waiting for login')
+                return
+
+            # close_driver takes the cookie snapshot before quitting
+            driver_manager.close_driver(acc)
+            get_account_repository().update(acc, status='Active')
+            self._set_state(job, DONE, f'Session saved in {job.elapsed:.0f}s')
+        except Exception as e:
+            self._set_state(job, FAILED, str(e))
+            try:
+                driver_manager.close_driver(acc)
+            except Exception:
+                pass
@@ -0,0 +1,229 @@
+import os
+import shutil
+import threading
+import time
+
+PROFILES_DIR = 'chrome_profiles'
+
+# Per-profile budget for Chrome's disposable caches before pruning kicks in
+CACHE_BUDGET_BYTES = 300 * 1024 * 1024
+
+# A profile used within this window is "hot": its HTTP and code caches are kept
+HOT_PROFILE_SECONDS = 2 * 60 * 60
+
+# Chrome caches that are safe to delete while the browser is closed
+CHROME_CACHE_DIRS = [
+    os.path.join('Default', 'Cache'),
+    os.path.join('Default', 'Code Cache'),
+    os.path.join('Default', 'GPUCache'),
+    os.path.join('Default', 'DawnCache'),
+    os.path.join('Default', 'Service Worker', 'CacheStorage'),
+    os.path.join('Default', 'Service Worker', 'ScriptCache'),
+    'ShaderCache',
+    'GrShaderCache',
+    'GraphiteDawnCache',
+    'component_crx_cache',
+]
+
+# Caches that make the next launch faster, kept for hot accounts
+WARM_CACHE_DIRS = {
+    os.path.join('Default', 'Cache'),
+    os.path.join('Default', 'Code Cache'),
+}
+
+# Leftovers from the old per-launch cache_/media_ directory layout
+LEGACY_CACHE_PREFIXES = ('cache_', 'media_')
+
+
+def _dir_size(path):
+    """Total size in bytes of all files below path"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+class ProfileMaintenanceService:
+    """Background pruning of Chrome profile caches.
+
+    Disk usage is measured a few profiles per tick and remembered between
+    ticks. Profiles whose caches grew past the budget are pruned coldest
+    first (LRU by last use). Hot profiles keep their HTTP and code caches,
+    and profiles with an open browser are never touched.
+    """
+
+    def __init__(self, profiles_dir=PROFILES_DIR, cache_budget_bytes=CACHE_BUDGET_BYTES,
+                 hot_seconds=HOT_PROFILE_SECONDS, interval=60, profiles_per_tick=5, in_use=None):
+        self.profiles_dir = profiles_dir
+        self.cache_budget_bytes = cache_budget_bytes
+        self.hot_seconds = hot_seconds
+        self.interval = interval
+        self.profiles_per_tick = profiles_per_tick
+        self.in_use = in_use  # Callable returning the set of absolute profile paths with open browsers
+        self.last_used = {}   # absolute profile path -> last use timestamp
+        self.cache_sizes = {}  # absolute profile path -> {cache dir: bytes}
+        self._scan_cursor = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the maintenance thread (no-op if it's already running)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='profile-maintenance', daemon=True)
+        self._thread.start()
+        print("🧹 Profile maintenance running in background")
+
+    def stop(self):
+        self._stop_event.set()
+
+    def touch(self, profile_dir):
+        """Record that a profile was just used"""
+        with self._lock:
+            self.last_used[os.path.abspath(profile_dir)] = time.time()
+
+    def get_cache_usage(self):
+        """Last measured cache bytes per profile"""
+        with self._lock:
+            return {path: sum(sizes.values()) for path, sizes in self.cache_sizes.items()}
+
+    def _run(self):
+        # Let the app finish starting before touching the disk
+        if self._stop_event.wait(5):
+            return
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"⚠️ Profile maintenance error: {e}")
+            self._stop_event.wait(self.interval)
+
+    def run_once(self):
+        """Measure the next batch of profiles and prune those over budget"""
+        profiles = self._list_profiles()
+        if not profiles:
+            return
+
+        # Incremental measurement: a few profiles per tick, round robin
+        batch = []
+        for _ in range(min(self.profiles_per_tick, len(profiles))):
+            self._scan_cursor %= len(profiles)
+            batch.append(profiles[self._scan_cursor])
+            self._scan_cursor += 1
+        for profile in batch:
+            sizes = self._measure_profile(profile)
+            with self._lock:
+                self.cache_sizes[profile] = sizes
+
+        with self._lock:
+            known = set(profiles)
+            for stale in [p for p in self.cache_sizes if p not in known]:
+                del self.cache_sizes[stale]
+            over_budget = [p for p, sizes in self.cache_sizes.items()
+                           if sum(sizes.values()) > self.cache_budget_bytes]
+
+        for profile in sorted(over_budget, key=self._last_use):
+            if self._stop_event.is_set():
+                return
+            self._prune_profile(profile)
+
+    def _list_profiles(self):
+        if not os.path.isdir(self.profiles_dir):
+            return []
+        try:
+            with os.scandir(self.profiles_dir) as entries:
+                return sorted(os.path.abspath(e.path) for e in entries if e.is_dir(follow_symlinks=False))
+        except OSError:
+            return []
+
+    def _measure_profile(self, profile):
+        sizes = {}
+        for cache_dir in CHROME_CACHE_DIRS:
+            path = os.path.join(profile, cache_dir)
+            if os.path.isdir(path):
+                sizes[cache_dir] = _dir_size(path)
+        try:
+            with os.scandir(profile) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and entry.name.startswith(LEGACY_CACHE_PREFIXES):
+                        sizes[entry.name] = _dir_size(entry.path)
+        except OSError:
+            pass
+        return sizes
+
+    def _last_use(self, profile):
+        with self._lock:
+            if profile in self.last_used:
+                return self.last_used[profile]
+        # Chrome rewrites "Local State" on every exit
+        for marker in ('Local State', os.path.join('Default', 'Preferences')):
+            try:
+                return os.path.getmtime(os.path.join(profile, marker))
+            except OSError:
+                continue
+        return 0
+
+    def _is_in_use(self, profile):
+        if not self.in_use:
+            return False
+        try:
+            return profile in self.in_use()
+        except Exception:
+            return True
+
+    def _prune_profile(self, profile):
+        if self._is_in_use(profile):
+            return
+
+        hot = time.time() - self._last_use(profile) < self.hot_seconds
+        with self._lock:
+            sizes = dict(self.cache_sizes.get(profile, {}))
+
+        # Biggest caches first, stop as soon as the profile is back under budget
+        total = sum(sizes.values())
+        freed = 0
+        for cache_dir, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+            if total - freed <= self.cache_budget_bytes:
+                break
+            if hot and cache_dir in WARM_CACHE_DIRS:
+                continue
+            # Re-check right before deleting: a browser may have been opened meanwhile
+            if self._is_in_use(profile):
+                return
+            try:
+                shutil.rmtree(os.path.join(profile, cache_dir))
+                freed += size
+                with self._lock:
+                    self.cache_sizes.get(profile, {}).pop(cache_dir, None)
+            except Exception as e:
+                print(f"⚠️ Error pruning {cache_dir} in {profile}: {e}")
+
+        if freed:
+            print(f"🗑️ Pruned {freed / (1024 * 1024):.1f} MB of cache from {os.path.basename(profile)}")
+
+
+_profile_maintenance = None
+_profile_maintenance_lock = threading.Lock()
+
+def get_profile_maintenance():
+    """Get or create the global profile maintenance service"""
+    global _profile_maintenance
+    with _profile_maintenance_lock:
+        if _profile_maintenance is None:
+            _profile_maintenance = ProfileMaintenanceService()
+        return _profile_maintenance
@@ -0,0 +1,210 @@
+import os
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# How often browser process trees are sampled
+SAMPLE_INTERVAL_SECONDS = 15
+
+# Recycle a browser whose process tree stays above this much resident memory
+RECYCLE_RSS_MB = 1500
+
+# A recycle request is withdrawn if memory falls back below this before it happens
+RECYCLE_RSS_RESUME_MB = 1200
+
+# Consecutive samples above RECYCLE_RSS_MB before a recycle is requested
+RECYCLE_AFTER_SAMPLES = 3
+
+# Recycle a browser after it has been running this long
+RECYCLE_MAX_AGE_SECONDS = 6 * 3600
+
+# Browsers younger than this are never recycled, so a relaunch can't thrash
+RECYCLE_MIN_AGE_SECONDS = 10 * 60
+
+
+def process_table():
+    """{pid: (ppid, rss bytes, cpu seconds)} for every visible process.
+
+    Uses psutil when installed and /proc otherwise; returns None when
+    neither is available.
+    """
+    table = {}
+    if psutil is not None:
+        for proc in psutil.process_iter(['ppid', 'memory_info', 'cpu_times']):
+            info = proc.info
+            if info.get('memory_info') is None or info.get('cpu_times') is None:
+                continue
+            table[proc.pid] = (info['ppid'], info['memory_info'].rss,
+                               info['cpu_times'].user + info['cpu_times'].system)
+        return table
+
+    if not os.path.isdir('/proc'):
+        return None
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    ticks = os.sysconf('SC_CLK_TCK')
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+            # Fields after the parenthesised command name: ppid is index 1,
+            # utime/stime 11/12 and rss 21
+            fields = stat[stat.rfind(b')') + 2:].split()
+            table[int(entry)] = (int(fields[1]), int(fields[21]) * page_size,
+                                 (int(fields[11]) + int(fields[12])) / ticks)
+        except (OSError, IndexError, ValueError):
+            continue
+    return table
+
+
+def process_tree(table, root_pid):
+    """root_pid and all its descendants that are in the table"""
+    children = {}
+    for pid, (ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    tree, pending = set(), [root_pid]
+    while pending:
+        pid = pending.pop()
+        if pid in table and pid not in tree:
+            tree.add(pid)
+            pending.extend(children.get(pid, ()))
+    return tree
+
+
+class BrowserResourceMonitor:
+    """Samples each open browser's process tree and recycles heavy or old ones.
+
+    Every interval the monitor maps each writer and reader driver to its
+    Chrome process tree and records resident memory and CPU use. A browser
+    over RECYCLE_RSS_MB for RECYCLE_AFTER_SAMPLES samples in a row, or older
+    than RECYCLE_MAX_AGE_SECONDS, is flagged on the driver manager; the
+    manager restarts it (saving cookies first) the next time an action asks
+    for it while no other action holds a lease on it, so recycling always
+    happens between actions. The request is
+    withdrawn if memory drops below RECYCLE_RSS_RESUME_MB first, and
+    browsers younger than RECYCLE_MIN_AGE_SECONDS are left alone.
+    """
+
+    def __init__(self, driver_manager, interval=SAMPLE_INTERVAL_SECONDS):
+        self.driver_manager = driver_manager
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._latest = []      # one dict per browser from the last sample
+        self._over_limit = {}  # (kind, label) -> consecutive samples over RECYCLE_RSS_MB
+        self._cpu = {}         # (kind, label) -> (sampled at, {pid: cpu seconds})
+        self._started = {}     # (kind, label) -> launch time of the browser being tracked
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='browser-resource-monitor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"⚠️ Browser resource monitor error: {e}")
+
+    def latest(self):
+        """Per-browser numbers from the last sample"""
+        with self._lock:
+            return list(self._latest)
+
+    def total_rss_mb(self):
+        """Memory of all browsers at the last sample, or None if unknown"""
+        rows = self.latest()
+        if not rows or any(row['rss_mb'] is None for row in rows):
+            return None
+        return sum(row['rss_mb'] for row in rows)
+
+    def sample(self):
+        now = time.time()
+        table = process_table()
+        rows = []
+        seen = set()
+        for browser in self.driver_manager.browser_processes():
+            key = (browser['kind'], browser['label'])
+            seen.add(key)
+            if self._started.get(key) != browser['started_at']:
+                # A new browser for this account (first sight or after a recycle)
+                self._started[key] = browser['started_at']
+                self._over_limit.pop(key, None)
+                self._cpu.pop(key, None)
+            row = dict(browser, rss_mb=None, cpu_percent=None, processes=0,
+                       age_seconds=now - browser['started_at'] if browser['started_at'] else None)
+            if table is not None and browser['root_pid']:
+                pids = process_tree(table, browser['root_pid'])
+                row['processes'] = len(pids)
+                row['rss_mb'] = sum(table[pid][1] for pid in pids) / (1024 * 1024)
+                row['cpu_percent'] = self._cpu_percent(key, now, {pid: table[pid][2] for pid in pids})
+            row['recycle'] = self._recycle_reason(key, row)
+            rows.append(row)
+            if row['recycle']:
+                self.driver_manager.request_recycle(browser['label'], browser['kind'], row['recycle'])
+            elif browser['recycle_pending']:
+                self.driver_manager.cancel_recycle(browser['label'], browser['kind'])
+
+        with self._lock:
+            self._latest = rows
+            for key in list(self._over_limit):
+                if key not in seen:
+                    self._over_limit.pop(key, None)
+                    self._cpu.pop(key, None)
+            for key in list(self._started):
+                if key not in seen:
+                    self._started.pop(key, None)
+        return rows
+
+    def _cpu_percent(self, key, now, cpu_by_pid):
+        """CPU use of the tree since the previous sample, counting processes present in both"""
+        previous = self._cpu.get(key)
+        self._cpu[key] = (now, cpu_by_pid)
+        if not previous or now <= previous[0]:
+            return None
+        then, previous_cpu = previous
+        used = sum(seconds - previous_cpu[pid] for pid, seconds in cpu_by_pid.items() if pid in previous_cpu)
+        return max(0.0, used / (now - then) * 100)
+
+    def _recycle_reason(self, key, row):
+        """Why this browser should be recycled now, or None (with hysteresis)"""
+        age = row['age_seconds']
+        rss = row['rss_mb']
+        if rss is not None and rss > RECYCLE_RSS_MB:
+            self._over_limit[key] = self._over_limit.get(key, 0) + 1
+        elif rss is None or rss < RECYCLE_RSS_RESUME_MB:
+            self._over_limit[key] = 0
+        # Between the two thresholds the count is kept, so a pending request stands
+
+        if age is not None and age < RECYCLE_MIN_AGE_SECONDS:
+            return None
+        if self._over_limit.get(key, 0) >= RECYCLE_AFTER_SAMPLES:
+            return f"memory {rss:.0f} MB" if rss is not None else "memory"
+        if age is not None and age > RECYCLE_MAX_AGE_SECONDS:
+            return f"age {age / 3600:.1f} h"
+        return None
+
+
+_resource_monitor = None
+_resource_monitor_lock = threading.Lock()
+
+def get_resource_monitor():
+    """Get or create the global browser resource monitor"""
+    global _resource_monitor
+    with _resource_monitor_lock:
+        if _resource_monitor is None:
+            from selenium_manager import get_global_driver_manager
+            _resource_monitor = BrowserResourceMonitor(get_global_driver_manager())
+        return _resource_monitor
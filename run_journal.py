@@ -0,0 +1,221 @@
+import os
+import json
+import time
+import uuid
+import threading
+from datetime import datetime
+
+RUNS_DIR = 'runs'
+
+# Journal records written before an fsync is forced
+FSYNC_BATCH_RECORDS = 20
+
+# Longest a written record waits for an fsync (checked on the next write)
+FSYNC_INTERVAL_SECONDS = 2.0
+
+# Finished run journals older than this are deleted by prune_runs()
+FINISHED_RUN_RETENTION_DAYS = 7
+
+
+class RunJournal:
+    """Append-only checkpoint log for one long-running campaign run.
+
+    Each line is a JSON record: the run's parameters, harvested queues,
+    cursors, generated replies, and an 'attempt' and then an 'outcome'
+    for every (item, account) action. Records are flushed to the OS as
+    they are written, so they survive the app crashing or being closed;
+    fsync (which also survives power loss) is batched every
+    FSYNC_BATCH_RECORDS records or FSYNC_INTERVAL_SECONDS.
+
+    Opening an existing journal replays it, so a restarted run can reuse
+    its queue and replies and skip every action already done. An action
+    with an attempt but no outcome may or may not have been posted before
+    the crash; is_handled() treats it as done rather than risk posting
+    twice.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.run_id = os.path.splitext(os.path.basename(path))[0]
+        self.kind = None
+        self.params = {}
+        self.started_at = None
+        self.finished = None  # status once finish() was called
+        self.queues = {}      # name -> list
+        self.cursors = {}     # name -> value
+        self.replies = {}     # (item, account) -> text
+        self.outcomes = {}    # (item, account) -> (success, message)
+        self.attempts = set()  # (item, account) started, outcome may be missing
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        if os.path.exists(path):
+            self._replay()
+
+    @staticmethod
+    def create(kind, params, runs_dir=RUNS_DIR):
+        """Start a new journal for a run of this kind"""
+        os.makedirs(runs_dir, exist_ok=True)
+        run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{kind}-{uuid.uuid4().hex[:6]}"
+        journal = RunJournal(os.path.join(runs_dir, f'{run_id}.jsonl'))
+        journal._append('start', kind=kind, params=params)
+        journal._sync()
+        return journal
+
+    def _replay(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-write
+                    continue
+                self._apply(record)
+
+    def _apply(self, record):
+        kind = record.get('type')
+        if kind == 'start':
+            self.kind = record['kind']
+            self.params = record['params']
+            self.started_at = record['ts']
+        elif kind == 'queue':
+            self.queues[record['name']] = record['items']
+        elif kind == 'cursor':
+            self.cursors[record['name']] = record['value']
+        elif kind == 'reply':
+            self.replies[(record['item'], record['account'])] = record['text']
+        elif kind == 'attempt':
+            self.attempts.add((record['item'], record['account']))
+        elif kind == 'outcome':
+            self.outcomes[(record['item'], record['account'])] = (record['success'], record.get('message'))
+        elif kind == 'finish':
+            self.finished = record['status']
+
+    def _append(self, record_type, **fields):
+        record = dict(type=record_type, ts=time.time(), **fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            self._apply(record)
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= FSYNC_BATCH_RECORDS or time.monotonic() - self._last_sync >= FSYNC_INTERVAL_SECONDS:
+                self._sync_locked()
+
+    def _sync_locked(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _sync(self):
+        with self._lock:
+            self._sync_locked()
+
+    # Checkpoints
+
+    def set_queue(self, name, items):
+        """Save a harvested work list (tweet URLs, loaded tweets, ...)"""
+        self._append('queue', name=name, items=items)
+
+    def queue(self, name):
+        return self.queues.get(name)
+
+    def set_cursor(self, name, value):
+        if self.cursors.get(name) != value:
+            self._append('cursor', name=name, value=value)
+
+    def cursor(self, name, default=None):
+        return self.cursors.get(name, default)
+
+    def save_reply(self, item, account, text):
+        """Keep a generated reply so a resumed run doesn't generate it again"""
+        self._append('reply', item=item, account=account, text=text)
+
+    def reply_for(self, item, account):
+        return self.replies.get((item, account))
+
+    def record_attempt(self, item, account):
+        """Call right before an action that changes something on X"""
+        self._append('attempt', item=item, account=account)
+
+    def record_outcome(self, item, account, success, message=None):
+        self._append('outcome', item=item, account=account, success=bool(success), message=message)
+        if success:
+            # A confirmed post is what must never be repeated
+            self._sync()
+
+    def is_handled(self, item, account):
+        """Whether this action already succeeded, or was in flight when the run stopped"""
+        key = (item, account)
+        outcome = self.outcomes.get(key)
+        if outcome is not None:
+            return outcome[0]
+        return key in self.attempts
+
+    def counts(self):
+        """(succeeded, failed) over the latest outcome of every action"""
+        succeeded = sum(1 for success, _ in self.outcomes.values() if success)
+        return succeeded, len(self.outcomes) - succeeded
+
+    def describe(self):
+        started = datetime.fromtimestamp(self.started_at).strftime('%Y-%m-%d %H:%M') if self.started_at else '?'
+        succeeded, failed = self.counts()
+        return f"started {started}, {succeeded} done, {failed} failed"
+
+    def finish(self, status='completed'):
+        """Mark the run as over (completed or abandoned) so it isn't offered for resume"""
+        self._append('finish', status=status)
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync_locked()
+                self._file.close()
+                self._file = None
+
+
+def unfinished_runs(kind=None, runs_dir=RUNS_DIR):
+    """Journals of runs that never finished, newest first"""
+    if not os.path.isdir(runs_dir):
+        return []
+    runs = []
+    for name in sorted(os.listdir(runs_dir), reverse=True):
+        if not name.endswith('.jsonl'):
+            continue
+        try:
+            journal = RunJournal(os.path.join(runs_dir, name))
+        except Exception as e:
+            print(f"⚠️ Skipping unreadable run journal {name}: {e}")
+            continue
+        if journal.finished is None and journal.kind is not None and (kind is None or journal.kind == kind):
+            runs.append(journal)
+    return runs
+
+
+def latest_unfinished_run(kind, runs_dir=RUNS_DIR):
+    runs = unfinished_runs(kind, runs_dir)
+    return runs[0] if runs else None
+
+
+def prune_runs(max_age_days=FINISHED_RUN_RETENTION_DAYS, runs_dir=RUNS_DIR):
+    """Delete finished run journals older than max_age_days; returns how many were removed"""
+    if not os.path.isdir(runs_dir):
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for name in os.listdir(runs_dir):
+        path = os.path.join(runs_dir, name)
+        if not name.endswith('.jsonl') or os.path.getmtime(path) >= cutoff:
+            continue
+        try:
+            if RunJournal(path).finished is not None:
+                os.remove(path)
+                removed += 1
+        except Exception as e:
+            print(f"⚠️ Could not prune run journal {name}: {e}")
+    return removed
@@ -0,0 +1,249 @@
+import os
+import sys
+import time
+import linecache
+import threading
+from contextlib import contextmanager
+
+# Time between samples of every thread's stack
+SAMPLE_INTERVAL_SECONDS = 0.01
+
+# Where a blocked thread is waiting, judged from its stack; checked in order
+BLOCKED_CATEGORIES = (
+    ('webdriver', ('selenium', 'undetected_chromedriver', 'urllib3')),
+    ('http', ('openai', 'httpx', 'httpcore', 'requests', 'http/client', 'http\\client', 'ssl.py', 'socket.py')),
+)
+
+# Innermost functions that mean "waiting" when thread states can't be read from /proc
+WAITING_FUNCTIONS = {'wait', 'sleep', 'acquire', 'select', 'poll', 'recv', 'recv_into', 'readinto', 'read',
+                     'accept', 'join', 'get', 'mainloop', '_wait_for_tstate_lock'}
+
+# On-CPU functions listed in the summary
+TOP_FUNCTIONS = 25
+
+_thread_tags = {}  # thread ident -> {'account': ..., 'action': ...}
+
+
+@contextmanager
+def profile_tags(**tags):
+    """Tag this thread's samples (account=, action=) for the duration of the block.
+
+    Costs two dict writes, so it is left on whether or not the profiler runs.
+    """
+    ident = threading.get_ident()
+    previous = _thread_tags.get(ident)
+    _thread_tags[ident] = dict(previous or {}, **{key: value for key, value in tags.items() if value is not None})
+    try:
+        yield
+    finally:
+        if previous is None:
+            _thread_tags.pop(ident, None)
+        else:
+            _thread_tags[ident] = previous
+
+
+def _frame_label(code):
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    if module == '__init__':
+        module = os.path.basename(os.path.dirname(code.co_filename))
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{module}:{name}".replace(';', ',').replace(' ', '_')
+
+
+def _thread_state(native_id):
+    """Kernel scheduler state of a thread ('R' running, 'S' sleeping, ...) or None if unknown"""
+    try:
+        with open(f'/proc/self/task/{native_id}/stat', 'rb') as f:
+            stat = f.read()
+        return chr(stat[stat.rfind(b')') + 2])
+    except (OSError, IndexError):
+        return None
+
+
+class SamplingProfiler:
+    """Statistical profiler over every Python thread.
+
+    A background thread snapshots all stacks (sys._current_frames) every
+    interval and counts them as collapsed stacks, the input format of
+    flamegraph.pl, speedscope and similar viewers. Each sample is rooted at
+    the thread's profile tags (account and action, set by recorded_action
+    and the campaign engine) and thread name. It is also classified as on
+    CPU or blocked using the thread's scheduler state from /proc (or a stack
+    heuristic elsewhere). Blocked samples are split into WebDriver round
+    trips, other HTTP (OpenAI), sleeps and other waits, and end in a
+    '[blocked:<kind>]' frame so the flame graph shows them too. Waiting for
+    the GIL counts as blocked.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._reset()
+
+    def _reset(self):
+        self.stacks = {}        # collapsed stack -> samples
+        self.categories = {}    # (action or thread name, category) -> samples
+        self.on_cpu = {}        # innermost function -> samples while on CPU
+        self.rounds = 0
+        self.started_at = None
+        self.elapsed = 0.0
+        self.sampling_seconds = 0.0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval=None):
+        """Start sampling, discarding any previous profile"""
+        if self.running:
+            return
+        if interval:
+            self.interval = interval
+        with self._lock:
+            self._reset()
+            self.started_at = time.time()
+        self._use_proc = os.path.isdir('/proc/self/task')
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling; the profile stays available for write()/summary()"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self):
+        started = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            sample_started = time.perf_counter()
+            try:
+                self._sample()
+            except Exception as e:
+                print(f"⚠️ Profiler sample failed: {e}")
+            with self._lock:
+                self.sampling_seconds += time.perf_counter() - sample_started
+                self.elapsed = time.perf_counter() - started
+
+    def _classify(self, frame, native_id):
+        """'cpu' or the kind of wait a thread is in"""
+        state = _thread_state(native_id) if self._use_proc and native_id else None
+        if state is None:
+            running = frame.f_code.co_name not in WAITING_FUNCTIONS
+        else:
+            running = state == 'R'
+        if running:
+            return 'cpu'
+        if 'sleep(' in linecache.getline(frame.f_code.co_filename, frame.f_lineno):
+            return 'sleep'
+        f = frame
+        while f is not None:
+            filename = f.f_code.co_filename
+            for category, markers in BLOCKED_CATEGORIES:
+                if any(marker in filename for marker in markers):
+                    return category
+            f = f.f_back
+        return 'wait'
+
+    def _sample(self):
+        frames = sys._current_frames()
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        own = threading.get_ident()
+        samples = []
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            thread = threads.get(ident)
+            name = thread.name if thread else f'thread-{ident}'
+            category = self._classify(frame, getattr(thread, 'native_id', None))
+
+            labels = []
+            f = frame
+            while f is not None:
+                labels.append(_frame_label(f.f_code))
+                f = f.f_back
+            labels.reverse()
+
+            tags = _thread_tags.get(ident) or {}
+            roots = [f"action:{tags['action']}"] if 'action' in tags else []
+            if 'account' in tags:
+                roots.append(f"account:{tags['account']}")
+            roots.append(name.replace(';', ',').replace(' ', '_'))
+            if category != 'cpu':
+                labels.append(f'[blocked:{category}]')
+            samples.append((';'.join(roots + labels), tags.get('action') or name, category,
+                            labels[-1] if category == 'cpu' and labels else None))
+
+        with self._lock:
+            self.rounds += 1
+            for stack, group, category, function in samples:
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+                self.categories[(group, category)] = self.categories.get((group, category), 0) + 1
+                if function:
+                    self.on_cpu[function] = self.on_cpu.get(function, 0) + 1
+
+    def summary(self):
+        """Wall-clock seconds per group (action tag, else thread name) and category,
+        the busiest on-CPU functions and the profiler's own overhead"""
+        with self._lock:
+            rounds, elapsed, sampling = self.rounds, self.elapsed, self.sampling_seconds
+            categories = dict(self.categories)
+            on_cpu = dict(self.on_cpu)
+        # Each sample of a thread stands for one sampling period of its wall-clock time
+        period = elapsed / rounds if rounds else self.interval
+        groups = {}
+        totals = {}
+        for (group, category), count in categories.items():
+            groups.setdefault(group, {})[category] = count * period
+            totals[category] = totals.get(category, 0) + count * period
+        top = sorted(on_cpu.items(), key=lambda item: -item[1])[:TOP_FUNCTIONS]
+        return {
+            'started_at': self.started_at,
+            'elapsed_seconds': elapsed,
+            'samples': rounds,
+            'period_seconds': period,
+            'overhead_percent': sampling / elapsed * 100 if elapsed else 0.0,
+            'totals': totals,
+            'groups': groups,
+            'top_cpu_functions': [(function, count * period) for function, count in top],
+        }
+
+    def write(self, path):
+        """Write collapsed stacks to path and a text summary next to it; returns the summary path"""
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in stacks:
+                f.write(f"{stack} {count}\n")
+
+        summary = self.summary()
+        summary_path = os.path.splitext(path)[0] + '.summary.txt'
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(f"Profiled {summary['elapsed_seconds']:.1f}s, {summary['samples']} samples every "
+                    f"{summary['period_seconds'] * 1000:.1f} ms (profiler overhead {summary['overhead_percent']:.1f}%)\n")
+            f.write("Thread wall-clock seconds: cpu = running Python or C code, webdriver = waiting on chromedriver, "
+                    "http = other network calls, sleep = time.sleep, wait = locks, queues and idle loops\n\n")
+            categories = ('cpu', 'webdriver', 'http', 'sleep', 'wait')
+            f.write(f"{'group':<40}" + ''.join(f"{name:>11}" for name in categories) + '\n')
+            rows = sorted(summary['groups'].items(), key=lambda item: -sum(item[1].values()))
+            for group, values in [('TOTAL', summary['totals'])] + rows:
+                f.write(f"{group[:39]:<40}" + ''.join(f"{values.get(name, 0):>11.2f}" for name in categories) + '\n')
+            f.write("\nBusiest functions on CPU (innermost frame, seconds)\n")
+            for function, seconds in summary['top_cpu_functions']:
+                f.write(f"{seconds:>10.2f}  {function}\n")
+        return summary_path
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+def get_profiler():
+    """Get or create the global sampling profiler"""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = SamplingProfiler()
+        return _profiler
@@ -0,0 +1,492 @@
+import os
+import json
+import heapq
+import time
+import uuid
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from constants import SCHEDULE_FILE
+
+# Scheduled jobs allowed to run at the same time
+SCHEDULER_WORKERS = 3
+
+# Scheduled jobs one account may take part in at the same time
+ACCOUNT_CONCURRENCY = 1
+
+# How long a due job waits before retrying when one of its accounts is busy
+ACCOUNT_BUSY_RETRY_SECONDS = 60
+
+# Trigger types
+INTERVAL = 'interval'
+CRON = 'cron'
+ONCE = 'once'
+
+_CRON_FIELDS = (  # (name, lowest, highest)
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 6),
+)
+
+
+def _parse_cron_field(text, low, high):
+    """Allowed values of one cron field ('*', '*/5', '1-5', '1,15', '8-18/2')"""
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Bad cron step: {text}")
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(v) for v in part.split('-', 1))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron value out of range {low}-{high}: {text}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronTrigger:
+    """Standard five-field cron expression (minute hour day month weekday).
+
+    Weekdays run 0-6 from Sunday (7 is accepted as Sunday too). As in cron,
+    when both day and weekday are restricted a time matches either one.
+    """
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression}")
+        fields[4] = fields[4].replace('7', '0')
+        self.expression = expression
+        parsed = [_parse_cron_field(text, low, high) for text, (_, low, high) in zip(fields, _CRON_FIELDS)]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self.day_restricted = fields[2] != '*'
+        self.weekday_restricted = fields[4] != '*'
+
+    def _day_matches(self, moment):
+        weekday = (moment.weekday() + 1) % 7  # Python's Monday=0 to cron's Sunday=0
+        day_ok = moment.day in self.days
+        weekday_ok = weekday in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, timestamp):
+        """First matching time strictly after timestamp (local time)"""
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment.timestamp()
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+
+def next_trigger_time(trigger, after):
+    """Next run time for a trigger dict after the given timestamp, or None if it won't fire again"""
+    kind = trigger.get('type')
+    if kind == INTERVAL:
+        return after + max(60, int(trigger['seconds']))
+    if kind == CRON:
+        return CronTrigger(trigger['expr']).next_after(after)
+    if kind == ONCE:
+        at = float(trigger['at'])
+        return at if at > after else None
+    raise ValueError(f"Unknown trigger type: {kind}")
+
+
+def _parse_clock(text):
+    hours, minutes = text.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def fit_to_window(timestamp, window):
+    """Move a run time into its daily 'HH:MM'-'HH:MM' window (windows may wrap past midnight)"""
+    if not window:
+        return timestamp
+    start, end = _parse_clock(window['start']), _parse_clock(window['end'])
+    moment = datetime.fromtimestamp(timestamp)
+    minute_of_day = moment.hour * 60 + moment.minute
+    if start <= end:
+        inside = start <= minute_of_day < end
+    else:
+        inside = minute_of_day >= start or minute_of_day < end
+    if inside:
+        return timestamp
+    window_start = moment.replace(hour=start // 60, minute=start % 60, second=0, microsecond=0)
+    if window_start.timestamp() <= timestamp:
+        window_start += timedelta(days=1)
+    return window_start.timestamp()
+
+
+class ScheduledJob:
+    """A campaign job (see campaign_engine) with a trigger and constraints"""
+
+    FIELDS = ('id', 'name', 'job', 'trigger', 'priority', 'window', 'catch_up', 'enabled',
+              'next_run', 'last_run', 'last_result', 'created_at')
+
+    def __init__(self, name, job, trigger, priority=0, window=None, catch_up=True, enabled=True,
+                 id=None, next_run=None, last_run=None, last_result=None, created_at=None):
+        self.id = id or uuid.uuid4().hex[:12]
+        self.name = name
+        self.job = job
+        self.trigger = trigger
+        self.priority = priority
+        self.window = window
+        self.catch_up = catch_up
+        self.enabled = enabled
+        self.next_run = next_run
+        self.last_run = last_run
+        self.last_result = last_result
+        self.created_at = created_at or time.time()
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @staticmethod
+    def from_dict(data):
+        return ScheduledJob(**{field: data.get(field) for field in ScheduledJob.FIELDS if field in data})
+
+    def describe_trigger(self):
+        kind = self.trigger.get('type')
+        if kind == INTERVAL:
+            minutes = int(self.trigger['seconds']) // 60
+            return f"every {minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"every {minutes}m"
+        if kind == CRON:
+            return f"cron {self.trigger['expr']}"
+        return f"once at {datetime.fromtimestamp(float(self.trigger['at'])).strftime('%Y-%m-%d %H:%M')}"
+
+    def schedule_next(self, after):
+        """Set next_run to the next trigger time after 'after', inside the window"""
+        next_run = next_trigger_time(self.trigger, after)
+        self.next_run = fit_to_window(next_run, self.window) if next_run is not None else None
+        return self.next_run
+
+
+class JobScheduler:
+    """Persistent scheduler for campaign jobs.
+
+    Jobs live in a JSON file and, while enabled, in an in-memory heap ordered
+    by (next run, priority). A single thread sleeps until the earliest job is
+    due and hands it to a small worker pool, which runs it with the campaign
+    engine. A due job waits while any of its accounts is already busy in
+    account_concurrency other scheduled jobs, and runs at most once per due
+    time. Runs missed while the app was closed are caught up once at start
+    (unless the job sets catch_up=False, in which case it skips to its next
+    time). on_event(event) gets plain dicts from scheduler and worker threads.
+    """
+
+    def __init__(self, path=SCHEDULE_FILE, max_workers=SCHEDULER_WORKERS,
+                 account_concurrency=ACCOUNT_CONCURRENCY, on_event=None):
+        self.path = path
+        self.max_workers = max_workers
+        self.account_concurrency = account_concurrency
+        self._listeners = [on_event] if on_event else []
+        self._jobs = {}  # id -> ScheduledJob
+        self._heap = []  # (next_run, -priority, seq, id)
+        self._seq = 0
+        self._running = {}  # job id -> CampaignEngine (None while a "Run now" is starting)
+        self._account_load = {}  # account label -> running scheduled jobs
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+        self._load()
+
+    # Persistence
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = []
+        for item in data:
+            try:
+                job = ScheduledJob.from_dict(item)
+                self._jobs[job.id] = job
+            except Exception as e:
+                print(f"⚠️ Skipping unreadable scheduled job: {e}")
+
+    def _save(self):
+        with self._lock:
+            data = [job.to_dict() for job in self._jobs.values()]
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    # Events
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, event, **fields):
+        payload = dict(event=event, ts=time.time(), **fields)
+        for callback in list(self._listeners):
+            try:
+                callback(payload)
+            except Exception as e:
+                print(f"⚠️ Scheduler event handler error: {e}")
+
+    # Queue
+
+    def _push(self, job):
+        """Queue an enabled job at its next_run (caller holds the lock)"""
+        if job.enabled and job.next_run is not None:
+            self._seq += 1
+            heapq.heappush(self._heap, (job.next_run, -job.priority, self._seq, job.id, job.next_run))
+            self._wakeup.notify()
+
+    def _is_queued(self, job):
+        """Whether the heap holds a current entry for job (caller holds the lock)"""
+        return any(entry[3] == job.id and entry[4] == job.next_run for entry in self._heap)
+
+    def _rebuild_heap(self):
+        self._heap = []
+        for job in self._jobs.values():
+            self._push(job)
+
+    def jobs(self):
+        """Snapshot of all jobs, soonest first"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: (job.next_run is None, job.next_run or 0, -job.priority))
+
+    def get_job(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def is_running(self, job_id):
+        with self._lock:
+            return job_id in self._running
+
+    def add_job(self, name, job, trigger, priority=0, window=None, catch_up=True):
+        """Add a campaign job (e.g. {'action': 'reply', ...}) with a trigger dict"""
+        from campaign_engine import validate_campaign
+        validate_campaign({'jobs': [job]})
+        scheduled = ScheduledJob(name, job, trigger, priority=priority, window=window, catch_up=catch_up)
+        scheduled.schedule_next(time.time() - 1 if trigger.get('type') == ONCE else time.time())
+        with self._lock:
+            self._jobs[scheduled.id] = scheduled
+            self._push(scheduled)
+        self._save()
+        self._emit('job_added', job_id=scheduled.id, name=name, next_run=scheduled.next_run)
+        return scheduled
+
+    def remove_job(self, job_id):
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            engine = self._running.get(job_id)
+        if engine:
+            engine.stop()
+        if job:
+            self._save()
+            self._emit('job_removed', job_id=job_id, name=job.name)
+        return job
+
+    def set_enabled(self, job_id, enabled):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return None
+            job.enabled = enabled
+            if enabled:
+                if job.next_run is None or job.next_run < time.time():
+                    job.schedule_next(time.time())
+                self._push(job)
+        self._save()
+        self._emit('job_updated', job_id=job_id, name=job.name, enabled=enabled, next_run=job.next_run)
+        return job
+
+    def run_now(self, job_id):
+        """Dispatch a job right away, outside its schedule"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job_id in self._running:
+                return False
+            # Claim the job so the scheduler thread can't dispatch it before the engine exists
+            self._running[job_id] = None
+        if self._executor is None:
+            self.start()
+        self._dispatch(job, scheduled_for=time.time(), manual=True)
+        return True
+
+    # Running
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scheduled-job')
+            self._catch_up(time.time())
+            self._rebuild_heap()
+        self._save()
+        self._thread = threading.Thread(target=self._run, name='job-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop dispatching and ask running jobs to stop after their current action"""
+        self._stop.set()
+        with self._lock:
+            self._wakeup.notify_all()
+            engines = [engine for engine in self._running.values() if engine]
+        for engine in engines:
+            engine.stop()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _catch_up(self, now):
+        """Handle runs missed while the app was closed (caller holds the lock)"""
+        for job in self._jobs.values():
+            if not job.enabled:
+                continue
+            if job.next_run is None:
+                if job.last_run is None or job.trigger.get('type') != ONCE:
+                    job.schedule_next(now)
+                continue
+            if job.next_run < now:
+                missed = job.next_run
+                if job.catch_up:
+                    # One catch-up run covers all missed occurrences
+                    job.next_run = fit_to_window(now, job.window)
+                    self._emit('job_catch_up', job_id=job.id, name=job.name, missed=missed)
+                else:
+                    job.schedule_next(now)
+                    self._emit('job_skipped', job_id=job.id, name=job.name, missed=missed)
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                due = self._pop_due(time.time())
+                if due is None:
+                    timeout = self._heap[0][0] - time.time() if self._heap else None
+                    self._wakeup.wait(timeout=None if timeout is None else max(0.0, min(timeout, 60)))
+                    continue
+            job, scheduled_for = due
+            self._dispatch(job, scheduled_for)
+
+    def _pop_due(self, now):
+        """Next due job that is still current, or None (caller holds the lock)"""
+        while self._heap and self._heap[0][0] <= now:
+            _, _, _, job_id, queued_for = heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            # Entries go stale when a job is removed, disabled or rescheduled
+            if not job or not job.enabled or job.next_run != queued_for or job_id in self._running:
+                continue
+            return job, queued_for
+        return None
+
+    def _job_accounts(self, job):
+        from campaign_engine import resolve_accounts
+        return resolve_accounts(job.job.get('accounts'))
+
+    def _dispatch(self, job, scheduled_for, manual=False):
+        try:
+            accounts = self._job_accounts(job)
+        except Exception as e:
+            if manual:
+                with self._lock:
+                    self._running.pop(job.id, None)
+            self._finish(job, scheduled_for, {'error': str(e)}, manual)
+            return
+
+        labels = [acc.label for acc in accounts]
+        with self._lock:
+            busy = [label for label in labels if self._account_load.get(label, 0) >= self.account_concurrency]
+            if busy and not manual:
+                # Try again shortly instead of stacking runs on a busy account
+                job.next_run = fit_to_window(time.time() + ACCOUNT_BUSY_RETRY_SECONDS, job.window)
+                self._push(job)
+                self._emit('job_deferred', job_id=job.id, name=job.name, busy_accounts=busy, next_run=job.next_run)
+                return
+            for label in labels:
+                self._account_load[label] = self._account_load.get(label, 0) + 1
+            from campaign_engine import CampaignEngine
+            engine = CampaignEngine({'name': job.name, 'jobs': [job.job]},
+                                    on_event=lambda event: self._emit('engine', job_id=job.id, name=job.name, detail=event))
+            self._running[job.id] = engine
+        self._emit('job_started', job_id=job.id, name=job.name, accounts=labels, manual=manual)
+        try:
+            self._executor.submit(self._execute, job, engine, labels, scheduled_for, manual)
+        except RuntimeError:
+            # Executor already shut down
+            self._release(job, labels)
+
+    def _execute(self, job, engine, labels, scheduled_for, manual):
+        result = {}
+        try:
+            succeeded, failed = engine.run_job(job.job)
+            result = {'succeeded': succeeded, 'failed': failed, 'stopped': engine.stopped}
+        except Exception as e:
+            result = {'error': str(e)}
+        finally:
+            self._release(job, labels)
+            self._finish(job, scheduled_for, result, manual)
+
+    def _release(self, job, labels):
+        with self._lock:
+            self._running.pop(job.id, None)
+            for label in labels:
+                remaining = self._account_load.get(label, 0) - 1
+                if remaining > 0:
+                    self._account_load[label] = remaining
+                else:
+                    self._account_load.pop(label, None)
+
+    def _finish(self, job, scheduled_for, result, manual):
+        now = time.time()
+        with self._lock:
+            job.last_run = now
+            job.last_result = result
+            if not manual and job.id in self._jobs:
+                job.schedule_next(max(now, scheduled_for))
+                if job.next_run is None:
+                    job.enabled = False
+                self._push(job)
+            elif manual and job.id in self._jobs and not self._is_queued(job):
+                # The scheduled run came due during "Run now" and was dropped; queue it again
+                self._push(job)
+        try:
+            self._save()
+        except Exception as e:
+            print(f"⚠️ Could not save scheduled jobs: {e}")
+        self._emit('job_finished', job_id=job.id, name=job.name, result=result, next_run=job.next_run)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler():
+    """Get or create the global job scheduler"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler()
+        return _scheduler
@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import functools
+import threading
+from collections import deque
+
+# Finished spans kept in memory; the oldest are dropped first
+TRACE_BUFFER_SPANS = 50000
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is off; every method does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ('tracer', 'name', 'attrs', 'start_ns')
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer._finish(self, end_ns)
+        return False
+
+    def set(self, **attrs):
+        """Add attributes, e.g. the outcome once it is known"""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """Collects timed spans from any thread into a ring buffer.
+
+    span(name, **attrs) is a context manager; while the tracer is disabled
+    it returns a shared do-nothing object, so leaving spans in hot paths
+    costs one attribute check. Finished spans can be exported as Chrome
+    trace-event JSON (load it in chrome://tracing or ui.perfetto.dev) or as
+    JSON lines.
+    """
+
+    def __init__(self, enabled=False, max_spans=TRACE_BUFFER_SPANS):
+        self.enabled = enabled
+        self._spans = deque(maxlen=max_spans)  # (name, start_ns, duration_ns, thread id, attrs)
+        self._thread_names = {}
+        # perf_counter has no fixed epoch; this maps it to wall-clock time
+        self._wall_offset = time.time() - time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        self._spans.clear()
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def _finish(self, span, end_ns):
+        thread_id = threading.get_native_id()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        # deque.append is atomic, so no lock is needed on the hot path
+        self._spans.append((span.name, span.start_ns, end_ns - span.start_ns, thread_id, span.attrs))
+
+    def spans(self):
+        """Finished spans, oldest first"""
+        return list(self._spans)
+
+    def export_chrome_trace(self, path):
+        """Write the buffer as Chrome trace-event JSON; returns the span count"""
+        pid = os.getpid()
+        spans = self.spans()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in list(self._thread_names.items())]
+        for name, start_ns, duration_ns, tid, attrs in spans:
+            events.append({'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': start_ns / 1000, 'dur': duration_ns / 1000, 'args': attrs})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+        return len(spans)
+
+    def export_jsonl(self, path):
+        """Write the buffer as one JSON object per span; returns the span count"""
+        spans = self.spans()
+        with open(path, 'w', encoding='utf-8') as f:
+            for name, start_ns, duration_ns, tid, attrs in spans:
+                record = {'name': name, 'start': self._wall_offset + start_ns / 1e9,
+                          'duration_ms': duration_ns / 1e6, 'thread': self._thread_names.get(tid, tid)}
+                record.update(attrs)
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        return len(spans)
+
+    def export(self, path):
+        """Export by file extension: .jsonl for JSON lines, anything else for Chrome trace JSON"""
+        if path.lower().endswith('.jsonl'):
+            return self.export_jsonl(path)
+        return self.export_chrome_trace(path)
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """Get or create the global tracer (enabled at start when XAUTO_TRACE=1)"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(enabled=os.getenv('XAUTO_TRACE') == '1')
+        return _tracer
+
+
+def span(name, **attrs):
+    """A span on the global tracer: with span('reply.find_post_button', account=...): ..."""
+    # Skips get_tracer()'s lock once the tracer exists
+    return (_tracer or get_tracer()).span(name, **attrs)
+
+
+def traced(name=None, **attrs):
+    """Decorator that runs the whole function inside a span"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with (_tracer or get_tracer()).span(span_name, **attrs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,105 @@
+import threading
+from collections import deque
+
+# How many times per second queued UI updates are applied
+UI_EVENT_FPS = 30
+
+
+class UIEventChannel:
+    """Coalescing channel for UI updates posted by worker threads.
+
+    Workers post typed events instead of scheduling one Tk callback each:
+
+    - progress(key, handler, *args): only the latest update per key is kept
+    - stats(key, handler, **deltas): numeric deltas are summed per key and
+      handler(deltas) is called once per frame with the totals
+    - state(key, handler, *args): latest state per key (button states,
+      display refreshes); applied after progress
+    - call(handler, *args): one-off callbacks, applied in order, never merged
+
+    Keys identify the widget or panel area being updated, e.g.
+    (panel, 'progress'). Everything queued is applied on the Tk main thread
+    at a fixed frame rate, so a busy worker costs at most one callback per
+    key per frame.
+    """
+
+    def __init__(self, fps=UI_EVENT_FPS):
+        self.interval_ms = max(1, int(1000 / fps))
+        self._lock = threading.Lock()
+        self._stats = {}     # key -> [handler, summed deltas]
+        self._progress = {}  # key -> (handler, args)
+        self._states = {}    # key -> (handler, args)
+        self._calls = deque()
+        self._root = None
+
+    def progress(self, key, handler, *args):
+        with self._lock:
+            self._progress[key] = (handler, args)
+
+    def stats(self, key, handler, **deltas):
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                self._stats[key] = [handler, dict(deltas)]
+                return
+            entry[0] = handler
+            totals = entry[1]
+            for name, delta in deltas.items():
+                totals[name] = totals.get(name, 0) + delta
+
+    def state(self, key, handler, *args):
+        with self._lock:
+            self._states[key] = (handler, args)
+
+    def call(self, handler, *args):
+        self._calls.append((handler, args))
+
+    def start(self, root):
+        """Start applying events on the Tk main loop"""
+        if self._root is not None:
+            return
+        self._root = root
+        self._pump()
+
+    def flush(self):
+        """Apply everything queued so far (main thread)"""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+            progress, self._progress = self._progress, {}
+            states, self._states = self._states, {}
+        calls = []
+        for _ in range(len(self._calls)):
+            try:
+                calls.append(self._calls.popleft())
+            except IndexError:
+                break
+
+        updates = [(handler, (deltas,)) for handler, deltas in stats.values()]
+        updates.extend(progress.values())
+        updates.extend(states.values())
+        updates.extend(calls)
+        for handler, args in updates:
+            try:
+                handler(*args)
+            except Exception as e:
+                print(f"⚠️ UI update error in {getattr(handler, '__name__', handler)}: {e}")
+
+    def _pump(self):
+        self.flush()
+        try:
+            self._root.after(self.interval_ms, self._pump)
+        except Exception:
+            # The window is gone
+            self._root = None
+
+
+_ui_events = None
+_ui_events_lock = threading.Lock()
+
+def get_ui_events():
+    """Get or create the global UI event channel"""
+    global _ui_events
+    with _ui_events_lock:
+        if _ui_events is None:
+            _ui_events = UIEventChannel()
+        return _ui_events
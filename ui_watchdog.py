@@ -0,0 +1,158 @@
+import os
+import sys
+import time
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+from metrics import get_metrics
+from utils import log_to_file
+
+# Heartbeat period of the Tk event loop
+HEARTBEAT_MS = 100
+
+# Event-loop lag beyond which the main thread counts as stalled
+STALL_THRESHOLD_MS = 250
+
+# How often the watcher thread checks the heartbeat
+WATCH_POLL_SECONDS = 0.05
+
+# Stall events kept for the dashboard
+RECENT_STALLS = 50
+
+# Innermost main-thread frames kept with each stall
+STACK_DEPTH = 12
+
+_APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _origin(stack):
+    """Innermost frame of the app's own code in an extracted stack, or None"""
+    for frame in reversed(stack):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(_APP_ROOT) and 'site-packages' not in path and path != os.path.abspath(__file__):
+            return f"{os.path.relpath(path, _APP_ROOT)}:{frame.lineno} in {frame.name}"
+    return None
+
+
+class UIWatchdog:
+    """Catches stalls of the Tk main loop and names the code behind them.
+
+    A heartbeat scheduled with root.after() every HEARTBEAT_MS records when
+    it last ran; how late it runs is the event-loop lag. A watcher thread
+    polls the heartbeat, and once it is more than STALL_THRESHOLD_MS late it
+    captures the main thread's stack while the blocking code is still on it.
+    When the heartbeat runs again the stall is finished: its duration,
+    stack and origin (innermost frame of the app's own code) are logged to
+    logs/ui_stalls.log, counted in metrics and kept for the dashboard.
+    Stalls with no Python code on the stack (the OS suspending the app, or
+    Tk busy inside mainloop) are recorded with origin 'Tk event loop'.
+    """
+
+    def __init__(self, heartbeat_ms=HEARTBEAT_MS, threshold_ms=STALL_THRESHOLD_MS):
+        self.heartbeat_ms = heartbeat_ms
+        self.threshold_ms = threshold_ms
+        self.root = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._main_ident = None
+        self._last_beat = None
+        self._captured = None   # stack captured during the stall in progress
+        self._stalls = deque(maxlen=RECENT_STALLS)
+        self._lag_ms = 0.0
+        self._max_lag_ms = 0.0
+        self._stall_count = 0
+
+    def start(self, root):
+        """Start the heartbeat on root (main thread) and the watcher thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self.root = root
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self.root.after(self.heartbeat_ms, self._beat)
+        self._thread = threading.Thread(target=self._watch, name='ui-watchdog', daemon=True)
+        self._thread.start()
+        get_metrics().register_source('ui', self.status)
+
+    def stop(self):
+        self._stop.set()
+
+    def _beat(self):
+        """Heartbeat (main thread): measure the lag and close any stall in progress"""
+        if self._stop.is_set():
+            return
+        now = time.perf_counter()
+        with self._lock:
+            lag_ms = max(0.0, (now - self._last_beat) * 1000 - self.heartbeat_ms)
+            captured, self._captured = self._captured, None
+            self._last_beat = now
+            self._lag_ms = lag_ms
+            self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        if lag_ms > self.threshold_ms:
+            self._record_stall(lag_ms, captured)
+        try:
+            self.root.after(self.heartbeat_ms, self._beat)
+        except Exception:
+            # The window is being destroyed
+            pass
+
+    def _watch(self):
+        """Watcher thread: grab the main thread's stack while a stall is happening"""
+        limit = (self.heartbeat_ms + self.threshold_ms) / 1000
+        while not self._stop.wait(WATCH_POLL_SECONDS):
+            with self._lock:
+                overdue = time.perf_counter() - self._last_beat > limit and self._captured is None
+            if not overdue:
+                continue
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                # A heartbeat may have run in the meantime; then this stack is stale
+                if time.perf_counter() - self._last_beat > limit:
+                    self._captured = stack
+
+    def _record_stall(self, lag_ms, stack):
+        origin = _origin(stack) if stack else None
+        if origin is None:
+            origin = 'Tk event loop' if stack else 'unknown (no stack captured)'
+        lines = [f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}" for frame in (stack or [])[-STACK_DEPTH:]]
+        stall = {'ts': time.time(), 'duration_ms': lag_ms, 'origin': origin, 'stack': lines}
+        with self._lock:
+            self._stalls.append(stall)
+            self._stall_count += 1
+        get_metrics().increment('ui_stalls', origin)
+        get_metrics().observe('ui_stall', lag_ms / 1000)
+        message = f"🐢 UI stalled for {lag_ms:.0f} ms in {origin}"
+        print(message)
+        log_to_file('ui_stalls', message + ('\n    ' + '\n    '.join(lines) if lines else ''),
+                    duration_ms=round(lag_ms), origin=origin)
+
+    def recent_stalls(self):
+        """Recent stall events, newest first"""
+        with self._lock:
+            return list(reversed(self._stalls))
+
+    def status(self):
+        """Metrics source: current and worst lag, stall count and recent stalls"""
+        with self._lock:
+            stalls = list(reversed(self._stalls))
+            return {'lag_ms': self._lag_ms, 'max_lag_ms': self._max_lag_ms, 'stalls_total': self._stall_count,
+                    'recent': [dict(stall, time=datetime.fromtimestamp(stall['ts']).strftime('%H:%M:%S'))
+                               for stall in stalls]}
+
+
+_ui_watchdog = None
+_ui_watchdog_lock = threading.Lock()
+
+def get_ui_watchdog():
+    """Get or create the global UI watchdog"""
+    global _ui_watchdog
+    with _ui_watchdog_lock:
+        if _ui_watchdog is None:
+            _ui_watchdog = UIWatchdog()
+        return _ui_watchdog
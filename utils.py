@@ -1,7 +1,8 @@
 import random
 import re
-import os
-from datetime import datetime
+import json
+from constants import SETTINGS_FILE
+from log_writer import get_log_writer
 
 def spin_text(template):
     # Simple text spinner using {a|b|c} syntax
@@ -17,9 +18,22 @@ def log(message, acc=None):
     label = f"[{acc.label}] " if acc else ""
     print(label + message)
 
-def log_to_file(panel_name, message):
-    os.makedirs('logs', exist_ok=True)
-    log_path = os.path.join('logs', f'{panel_name}.log')
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    with open(log_path, 'a', encoding='utf-8') as f:
-        f.write(f'[{timestamp}] {message}\n') 
\ No newline at end of file
+def log_to_file(panel_name, message, **fields):
+    """Append a line to logs/<panel_name>.log via the background log writer.
+
+    Extra keyword fields (account, action, duration, ...) are kept as
+    structured fields in JSON-lines mode.
+    """
+    get_log_writer().write(panel_name, message, **fields)
+
+def load_settings():
+    """Load the app-wide settings saved by the Settings panel"""
+    try:
+        with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_settings(settings):
+    with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=2)
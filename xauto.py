@@ -0,0 +1,187 @@
+"""Headless campaign runner.
+
+    python -m xauto run campaign.json [--daemon] [--every SECONDS] [--headless] [--trace FILE] [--resume]
+                                      [--profile FILE]
+    python -m xauto validate campaign.json
+
+Runs the same campaign engine as the GUI without Tk. Progress goes to stdout
+as one JSON object per line; everything else (browser and driver messages)
+is sent to stderr. SIGINT/SIGTERM stop the run after the current action and
+close the browsers, saving their cookies. --trace records spans for the run
+and writes them on exit (Chrome trace JSON, or JSON lines for .jsonl).
+--profile samples every thread's stack during the run and writes collapsed
+stacks (for flame graphs) to FILE, plus a CPU/blocked summary next to it.
+--resume checkpoints the run to a journal under runs/ and, if an earlier run
+of the same campaign file never finished, continues it instead of starting
+over.
+"""
+import os
+import sys
+import json
+import signal
+import time
+import argparse
+import threading
+
+# Pause between campaign runs in daemon mode
+DEFAULT_DAEMON_INTERVAL_SECONDS = 15 * 60
+
+
+class JsonLinesReporter:
+    """Writes engine events as JSON lines to a stream"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        # Reentrant: the signal handler reports from the main thread, possibly mid-write
+        self._lock = threading.RLock()
+
+    def __call__(self, event):
+        event.setdefault('ts', time.time())
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+
+
+def _install_signal_handlers(stop):
+    def handler(signum, frame):
+        stop(signal.Signals(signum).name)
+    for name in ('SIGINT', 'SIGTERM', 'SIGHUP'):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), handler)
+
+
+def _campaign_journal(campaign_path, report):
+    """The unfinished journal for this campaign file, or a new one"""
+    from run_journal import RunJournal, unfinished_runs
+    campaign_path = os.path.abspath(campaign_path)
+    for journal in unfinished_runs('campaign'):
+        if journal.params.get('file') == campaign_path:
+            succeeded, failed = journal.counts()
+            report({'event': 'resuming', 'run_id': journal.run_id, 'succeeded': succeeded, 'failed': failed})
+            return journal
+    return RunJournal.create('campaign', {'file': campaign_path})
+
+
+def run_command(args, report):
+    from campaign_engine import CampaignEngine, load_campaign
+
+    try:
+        campaign = load_campaign(args.campaign)
+    except (OSError, ValueError) as e:
+        report({'event': 'error', 'message': f"Invalid campaign: {e}"})
+        return 2
+
+    if args.headless:
+        os.environ['XAUTO_HEADLESS'] = '1'
+    if args.trace:
+        from tracing import get_tracer
+        get_tracer().enable()
+    if args.profile:
+        from sampling_profiler import get_profiler
+        get_profiler().start()
+
+    stop_event = threading.Event()
+    current = {'engine': None}
+
+    def stop(reason):
+        report({'event': 'stopping', 'reason': reason})
+        stop_event.set()
+        if current['engine']:
+            current['engine'].stop()
+
+    _install_signal_handlers(stop)
+
+    # Long daemon runs need browsers recycled before their memory grows unbounded
+    from resource_monitor import get_resource_monitor
+    get_resource_monitor().start()
+
+    interval = args.every or campaign.get('repeat_every', DEFAULT_DAEMON_INTERVAL_SECONDS)
+    failed = 0
+    try:
+        while not stop_event.is_set():
+            journal = _campaign_journal(args.campaign, report) if args.resume else None
+            engine = CampaignEngine(campaign, on_event=report, journal=journal)
+            current['engine'] = engine
+            summary = engine.run()
+            if journal:
+                if summary['stopped']:
+                    journal.close()
+                else:
+                    journal.finish('completed')
+            failed += summary['failed'] + summary['errors']
+            if not args.daemon or stop_event.is_set():
+                break
+            report({'event': 'sleeping', 'seconds': interval})
+            # The signal handler sets the event, so this wakes up immediately on stop
+            stop_event.wait(interval)
+    finally:
+        try:
+            from selenium_manager import get_global_driver_manager
+            get_global_driver_manager().close_driver()
+        except Exception as e:
+            print(f"⚠️ Error closing browser drivers: {e}")
+        if args.trace:
+            from tracing import get_tracer
+            spans = get_tracer().export(args.trace)
+            report({'event': 'trace_written', 'path': args.trace, 'spans': spans})
+        if args.profile:
+            from sampling_profiler import get_profiler
+            profiler = get_profiler()
+            profiler.stop()
+            summary_path = profiler.write(args.profile)
+            report({'event': 'profile_written', 'path': args.profile, 'summary': summary_path,
+                    'samples': profiler.rounds})
+        report({'event': 'exited', 'failed': failed})
+    return 1 if failed else 0
+
+
+def validate_command(args, report):
+    from campaign_engine import load_campaign, resolve_accounts
+
+    try:
+        campaign = load_campaign(args.campaign)
+        jobs = []
+        for index, job in enumerate(campaign['jobs']):
+            accounts = resolve_accounts(job.get('accounts', campaign.get('accounts')))
+            jobs.append({'job': job.get('name', f"{job['action']}-{index + 1}"),
+                         'action': job['action'], 'accounts': [acc.label for acc in accounts]})
+    except (OSError, ValueError) as e:
+        report({'event': 'error', 'message': f"Invalid campaign: {e}"})
+        return 2
+    report({'event': 'valid', 'jobs': jobs})
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='xauto', description='Run X automation campaigns without the GUI')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run a campaign file')
+    run_parser.add_argument('campaign', help='path to the campaign JSON file')
+    run_parser.add_argument('--daemon', action='store_true', help='keep running the campaign until stopped by a signal')
+    run_parser.add_argument('--every', type=int, default=None, metavar='SECONDS',
+                            help='pause between runs in daemon mode (default: campaign repeat_every or 15 minutes)')
+    run_parser.add_argument('--headless', action='store_true', help='start browsers without a window')
+    run_parser.add_argument('--trace', metavar='FILE', help='record trace spans and write them to FILE on exit')
+    run_parser.add_argument('--profile', metavar='FILE',
+                            help='sample all threads and write flame graph stacks to FILE on exit')
+    run_parser.add_argument('--resume', action='store_true',
+                            help='checkpoint the run and continue an unfinished earlier run of this campaign file')
+
+    validate_parser = commands.add_parser('validate', help='check a campaign file and the accounts it names')
+    validate_parser.add_argument('campaign', help='path to the campaign JSON file')
+
+    args = parser.parse_args(argv)
+
+    # Keep stdout for the JSON progress stream; library prints go to stderr
+    report = JsonLinesReporter(sys.stdout)
+    sys.stdout = sys.stderr
+
+    if args.command == 'run':
+        return run_command(args, report)
+    return validate_command(args, report)
+
+
+if __name__ == '__main__':
+    sys.exit(main())